@@ -0,0 +1,147 @@
+"""Benchmarks of the model memory and deserialization, compared to the plain alternatives.
+
+Run them from the repository root with `python -m benchmarks.serialization`.
+"""
+
+import copy
+import tracemalloc
+from time import perf_counter
+from typing import Any
+
+from orjson import dumps, loads
+
+from pyyoutube.models import Video, VideoListResponse
+from pyyoutube.utils.codec import get_backend
+from pyyoutube.utils.serializable import Serializable
+
+
+def video_data() -> dict[str, Any]:
+    """A raw video item with all common parts."""
+    thumbnail = {"url": "https://i.ytimg.com/vi/dQw4w9WgXcQ/default.jpg", "width": 120, "height": 90}
+    return {
+        "kind": "youtube#video",
+        "etag": "etag",
+        "id": "dQw4w9WgXcQ",
+        "snippet": {
+            "publishedAt": "2009-10-25T06:57:33Z",
+            "channelId": "UCuAXFkgsw1L7xaCfnd5JJOw",
+            "title": "Title",
+            "description": "Description",
+            "thumbnails": {"default": thumbnail, "medium": thumbnail, "high": thumbnail},
+            "tags": ["tag"],
+            "localized": {"title": "Title", "description": "Description"},
+        },
+        "contentDetails": {"duration": "PT3M33S", "definition": "hd", "contentRating": {}},
+        "status": {"uploadStatus": "processed", "privacyStatus": "public"},
+        "statistics": {"viewCount": "1500000000", "likeCount": "17000000", "commentCount": "2300000"},
+        "topicDetails": {"topicCategories": ["https://en.wikipedia.org/wiki/Music"]},
+    }
+
+
+def best_time(fn: Any, repeat: int = 5) -> float:
+    """Run the function several times and get the shortest time in ms, the least disturbed by the other processes."""
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        times.append((perf_counter() - start) * 1000)
+    return min(times)
+
+
+def memory_benchmark(count: int = 10_000) -> None:
+    """Measure the memory taken by deserialized videos, compared to the same objects with per-instance `__dict__`."""
+
+    class Unslotted:
+        """A plain object with `__dict__`, the way instances were stored before the slots took effect."""
+
+    def unslotted(value: Any) -> Any:
+        if isinstance(value, Serializable):
+            instance = Unslotted()
+            instance.__dict__.update({name: unslotted(getattr(value, name)) for name in value._schema})
+            return instance
+        if isinstance(value, list):
+            return [unslotted(item) for item in value]
+        return value
+
+    data = video_data()
+    videos = [Video.deserialize(data) for _ in range(count)]
+
+    # Copy the same object trees, so both measurements include only the objects and not the shared values.
+    tracemalloc.start()
+    slotted_copies = copy.deepcopy(videos)
+    slotted_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    unslotted_copies = unslotted(videos)
+    unslotted_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"With __dict__: {unslotted_size / count:.0f} bytes per video")  # noqa: T201
+    print(f"With __slots__: {slotted_size / count:.0f} bytes per video")  # noqa: T201
+    print(f"Ratio: {unslotted_size / slotted_size:.2f}x")  # noqa: T201
+
+    del slotted_copies, unslotted_copies
+
+
+def deserialization_benchmark(pages: int = 100, page_size: int = 50) -> None:
+    """Compare deserializing the items of `VideoListResponse` pages one by one and in a batch, and decoding them."""
+    responses = [
+        {
+            "kind": "youtube#videoListResponse",
+            "etag": "etag",
+            "nextPageToken": "token",
+            "pageInfo": {"totalResults": pages * page_size, "resultsPerPage": page_size},
+            "items": [video_data() for _ in range(page_size)],
+        }
+        for _ in range(pages)
+    ]
+    bodies = [dumps(response) for response in responses]
+
+    # Warm up every path, the class functions are compiled on their first call and shouldn't count in the timings.
+    Video.deserialize(responses[0]["items"][0])
+    Video.deserialize_many(responses[0]["items"])
+    VideoListResponse.deserialize(responses[0])
+    VideoListResponse.from_json(bodies[0])
+
+    def per_item() -> None:
+        for response in responses:
+            [Video.deserialize(item) for item in response["items"]]
+
+    def batch() -> None:
+        for response in responses:
+            Video.deserialize_many(response["items"])
+
+    def whole_response() -> None:
+        for response in responses:
+            VideoListResponse.deserialize(response)
+
+    def orjson_loads() -> None:
+        for body in bodies:
+            VideoListResponse.deserialize(loads(body))
+
+    def from_json() -> None:
+        for body in bodies:
+            VideoListResponse.from_json(body)
+
+    single_time = best_time(per_item) / pages
+    batch_time = best_time(batch) / pages
+    response_time = best_time(whole_response) / pages
+    loads_time = best_time(orjson_loads) / pages
+    from_json_time = best_time(from_json) / pages
+
+    items = responses[0]["items"]
+    print(f"deserialize per item: {single_time:.6f} ms per page of {page_size}")  # noqa: T201
+    print(f"deserialize_many: {batch_time:.6f} ms per page of {page_size}")  # noqa: T201
+    print(f"VideoListResponse.deserialize: {response_time:.6f} ms per page of {page_size}")  # noqa: T201
+    print(f"Equal: {Video.deserialize_many(items) == [Video.deserialize(item) for item in items]}")  # noqa: T201
+    print(f"Ratio: {single_time / batch_time:.2f}x")  # noqa: T201
+    print(f"orjson.loads + deserialize: {loads_time:.6f} ms per page of {page_size}")  # noqa: T201
+    print(f"from_json ({get_backend()}): {from_json_time:.6f} ms per page of {page_size}")  # noqa: T201
+    print(f"Equal: {VideoListResponse.from_json(bodies[0]) == VideoListResponse.deserialize(responses[0])}")  # noqa: T201
+    print(f"Ratio: {loads_time / from_json_time:.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    memory_benchmark()
+    deserialization_benchmark()
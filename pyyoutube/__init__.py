@@ -1,16 +1,66 @@
 # ruff: noqa: F401 - allow unused imports
 
+"""Async Python wrapper around the YouTube Data API v3.
+
+The client and the helpers are imported on the first access, so importing a submodule (e.g. `pyyoutube.models`)
+doesn't import the HTTP client and its dependencies.
+"""
+
+from typing import TYPE_CHECKING, Any
+
 from .__version__ import __version__
-from .client import (
-    AccessTokenAuthentication,
-    APIKeyAuthentication,
-    AuthenticationMethod,
-    Client,
-)
+
+if TYPE_CHECKING:
+    from .client import (
+        AccessTokenAuthentication,
+        APIKeyAuthentication,
+        AuthenticationMethod,
+        Client,
+        ResponseFormat,
+    )
+    from .utils.etag_cache import ETagCache
+    from .utils.rate_limiter import RateLimiter
+    from .utils.response_cache import ResponseCache
+    from .utils.retry import RetryPolicy
+    from .utils.search_cache import SearchCache
+
+_MODULES: dict[str, str] = {
+    "Client": "client",
+    "AuthenticationMethod": "client",
+    "APIKeyAuthentication": "client",
+    "AccessTokenAuthentication": "client",
+    "RetryPolicy": "utils.retry",
+    "RateLimiter": "utils.rate_limiter",
+    "ResponseFormat": "client",
+    "ETagCache": "utils.etag_cache",
+    "ResponseCache": "utils.response_cache",
+    "SearchCache": "utils.search_cache",
+}
+"""The module of every exported name."""
 
 __all__ = [
     "Client",
     "AuthenticationMethod",
     "APIKeyAuthentication",
     "AccessTokenAuthentication",
+    "RetryPolicy",
+    "RateLimiter",
+    "ResponseFormat",
+    "ETagCache",
+    "ResponseCache",
+    "SearchCache",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of the exported name on the first access."""
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(__import__(f"{__name__}.{_MODULES[name]}", fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
@@ -1,7 +1,9 @@
 import asyncio
+import logging
 from contextlib import suppress
-from dataclasses import dataclass
-from typing import Any, ClassVar, Never, Optional, TypeVar
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Never, Optional, TypeVar, Union, overload
 
 import orjson
 from aiohttp import (
@@ -10,26 +12,43 @@ from aiohttp import (
     ClientTimeout,
     TCPConnector,
     TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
 )
 
 from .error import PyYouTubeForbiddenError, PyYouTubeQuotaReachedError, PyYouTubeServiceError, PyYouTubeSessionError
 from .protocols import APIClientProto
-from .resources import (
-    CaptionsResource,
-    ChannelsResource,
-    CommentsResource,
-    I18nLanguagesResource,
-    I18nRegionsResource,
-    MembersResource,
-    PlaylistsResource,
-    SearchResource,
-    SubscriptionsResource,
-    VideosResource,
-)
+from .utils.etag_cache import ETagCache, ETagEntry
+from .utils.key_pool import APIKeyPool
+from .utils.params_checker import canonical_request_key
+from .utils.quota import DEFAULT_DAILY_QUOTA, get_endpoint, get_quota_cost
+from .utils.rate_limiter import RateLimiter
+from .utils.response_cache import ResponseCache
+from .utils.retry import RetryPolicy, parse_retry_after
+from .utils.search_cache import SearchCache
 from .utils.serializable import Serializable
 
+if TYPE_CHECKING:
+    from .resources import (
+        CaptionsResource,
+        ChannelsResource,
+        CommentsResource,
+        I18nLanguagesResource,
+        I18nRegionsResource,
+        MembersResource,
+        PlaylistsResource,
+        SearchResource,
+        SubscriptionsResource,
+        VideosResource,
+    )
+
 T = TypeVar("T", bound=Serializable)
 
+ResponseFormat = Literal["model", "lazy", "json", "bytes"]
+"""The form of the returned responses: (lazily) deserialized models, orjson-parsed dictionaries or raw bodies."""
+
+logger = logging.getLogger(__name__)
+
 
 # Base class for authentication methods
 class AuthenticationMethod:
@@ -46,9 +65,21 @@ class AccessTokenAuthentication(AuthenticationMethod):
 
 @dataclass
 class APIKeyAuthentication(AuthenticationMethod):
-    """Authentication based on Developer Console App API key."""
+    """Authentication based on Developer Console App API key.
+
+    Accepts a pool of keys via `api_keys`. The client then uses the key with the most remaining quota for every
+    request and switches to another key when the API reports that the quota of the current one is exceeded.
+    """
+
+    api_key: Optional[str] = None
+    api_keys: list[str] = field(default_factory=list)
+    daily_quota: int = DEFAULT_DAILY_QUOTA
+    """The daily quota of each key in units, used to estimate the remaining quota."""
 
-    api_key: str
+    @property
+    def keys(self) -> list[str]:
+        """All API keys of the authentication method."""
+        return ([self.api_key] if self.api_key else []) + [key for key in self.api_keys if key != self.api_key]
 
 
 @dataclass
@@ -60,32 +91,34 @@ class YouTubeDataAPIError:
     reason: str
 
 
+@dataclass
+class ConnectionStats:
+    """The connection counters of the client session, collected with the aiohttp request tracing."""
+
+    created: int = 0
+    """The number of the new connections."""
+    reused: int = 0
+    """The number of the requests sent over a kept-alive connection."""
+
+
 class Client(APIClientProto):
     """YouTube Data API v3 client. Allows getting structured resources from the API."""
 
-    # The ETag caching is not implemented intentionally due to the following reasons:
-    # - We need to collect the most recent data (statistics part) for some resources (e.g. videos).
-    # - aiohttp ClientSession doesn't keep connections alive if headers change (ETag is provided via headers).
+    # The ETag caching is opt-in (`etag_cache`) and limited to the resources that rarely change, because we need
+    # the most recent data (e.g. the statistics part of videos) for the others. The `If-None-Match` header doesn't
+    # affect the connection reuse: aiohttp pools the connections by the host, see `connection_stats`.
 
     base_url: ClassVar[str] = "https://www.googleapis.com/youtube/v3/"
 
-    captions: CaptionsResource
-    channels: ChannelsResource
-    comments: CommentsResource
-    i18n_languages: I18nLanguagesResource
-    i18n_regions: I18nRegionsResource
-    members: MembersResource
-    playlists: PlaylistsResource
-    search: SearchResource
-    subscriptions: SubscriptionsResource
-    videos: VideosResource
-
     session: ClientSession | None = None
     """Current session for the API requests. Can be created manually or using context manager."""
 
     concurrent_connections: int = 100
     """The maximum number of concurrent connections to make."""
 
+    deduplicate_requests: bool = True
+    """Whether identical concurrent requests should share a single HTTP request."""
+
     def _ua(self, gzip: bool = True) -> str:
         """Generate a User-Agent string."""
         agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"  # noqa: E501
@@ -99,34 +132,137 @@ class Client(APIClientProto):
         timeout: Optional[ClientTimeout] = None,
         proxy: Optional[str] = None,
         headers: Optional[dict[str, str]] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_format: ResponseFormat = "model",
+        etag_cache: Optional[ETagCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        search_cache: Optional[SearchCache] = None,
     ):
-        """Initialize the YouTube API client with authentication and connection settings."""
+        """Initialize the YouTube API client with authentication and connection settings.
+
+        Args:
+            auth: Authentication method.
+            timeout: Timeouts of a single request. Defaults to 30 seconds in total and 3 seconds to connect.
+            proxy: Proxy URL.
+            headers: Additional request headers.
+            retry: Retry policy for failed requests. Pass `RetryPolicy(max_attempts=1)` to disable retries.
+            rate_limiter: Rate limiter which admits requests against the per-second and daily quota budgets.
+                `concurrent_connections` only bounds the number of sockets, not the quota spending.
+            response_format: The default form of the responses. With `json` or `bytes`, the responses aren't
+                deserialized into models, which saves CPU when the payloads are only forwarded elsewhere.
+                With `lazy`, the nested models are deserialized on the first access.
+                The resource helpers that read the responses (`iter_pages`, `get_many`, etc.) require `model`
+                or `lazy`.
+            etag_cache: The cache of the responses of the rarely changing resources (e.g. video categories),
+                which are revalidated with `If-None-Match` and served from the cache on `304 Not Modified`.
+            response_cache: The cache which serves the repeated requests without calling the API until their
+                responses expire. The time to live depends on the resource and the requested parts. The requests
+                which depend on the user (e.g. `mine`) aren't cached, nor the requests of the OAuth clients, unless
+                the cache is created with `cache_authorized`.
+            search_cache: The cache of the search results, which canonicalizes the search queries, so the
+                equivalent queries are sent to the API once until their results expire.
+        """
         self.auth = auth
         self.timeout = timeout or ClientTimeout(total=30, connect=3)
         self.proxy = proxy
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.response_format: ResponseFormat = response_format
+        self.etag_cache = etag_cache
+        self.response_cache = response_cache
+        self.search_cache = search_cache
+        self.connection_stats = ConnectionStats()
+        self.key_pool: Optional[APIKeyPool] = None
         self.headers: dict[str, str] = {"Accept-Encoding": "gzip", "User-Agent": self._ua(gzip=True)}
         self.semaphore = asyncio.Semaphore(self.concurrent_connections)
+        self._in_flight: dict[tuple[type, str, ResponseFormat], asyncio.Future] = {}
 
         if headers:
             self.headers.update(headers)
 
-        self.captions = CaptionsResource(self)
-        self.channels = ChannelsResource(self)
-        self.comments = CommentsResource(self)
-        self.i18n_languages = I18nLanguagesResource(self)
-        self.i18n_regions = I18nRegionsResource(self)
-        self.members = MembersResource(self)
-        self.playlists = PlaylistsResource(self)
-        self.search = SearchResource(self)
-        self.subscriptions = SubscriptionsResource(self)
-        self.videos = VideosResource(self)
-
         if isinstance(self.auth, AccessTokenAuthentication):
             self.headers.update({"Authorization": f"Bearer {self.auth.access_token}"})
+        elif isinstance(self.auth, APIKeyAuthentication):
+            self.key_pool = APIKeyPool(self.auth.keys, daily_quota=self.auth.daily_quota)
+
+    # The resources are created on the first access, so only the used resource and model modules are imported.
+
+    @cached_property
+    def captions(self) -> "CaptionsResource":
+        """The captions resource."""
+        from .resources.captions import CaptionsResource
+
+        return CaptionsResource(self)
+
+    @cached_property
+    def channels(self) -> "ChannelsResource":
+        """The channels resource."""
+        from .resources.channels import ChannelsResource
+
+        return ChannelsResource(self)
+
+    @cached_property
+    def comments(self) -> "CommentsResource":
+        """The comments resource."""
+        from .resources.comments import CommentsResource
+
+        return CommentsResource(self)
+
+    @cached_property
+    def i18n_languages(self) -> "I18nLanguagesResource":
+        """The i18n languages resource."""
+        from .resources.i18n_languages import I18nLanguagesResource
+
+        return I18nLanguagesResource(self)
+
+    @cached_property
+    def i18n_regions(self) -> "I18nRegionsResource":
+        """The i18n regions resource."""
+        from .resources.i18n_regions import I18nRegionsResource
+
+        return I18nRegionsResource(self)
+
+    @cached_property
+    def members(self) -> "MembersResource":
+        """The members resource."""
+        from .resources.members import MembersResource
+
+        return MembersResource(self)
+
+    @cached_property
+    def playlists(self) -> "PlaylistsResource":
+        """The playlists resource."""
+        from .resources.playlists import PlaylistsResource
+
+        return PlaylistsResource(self)
+
+    @cached_property
+    def search(self) -> "SearchResource":
+        """The search resource."""
+        from .resources.search import SearchResource
+
+        return SearchResource(self)
+
+    @cached_property
+    def subscriptions(self) -> "SubscriptionsResource":
+        """The subscriptions resource."""
+        from .resources.subscriptions import SubscriptionsResource
+
+        return SubscriptionsResource(self)
+
+    @cached_property
+    def videos(self) -> "VideosResource":
+        """The videos resource."""
+        from .resources.videos import VideosResource
+
+        return VideosResource(self)
 
     async def __aenter__(self) -> "Client":
         """Async context manager entry point."""
         self.tracer = TraceConfig()
+        self.tracer.on_connection_create_end.append(self._on_connection_create_end)
+        self.tracer.on_connection_reuseconn.append(self._on_connection_reuseconn)
         self.connector = TCPConnector(limit=self.concurrent_connections, keepalive_timeout=30, ttl_dns_cache=300)
         self.session = ClientSession(
             timeout=self.timeout, trace_configs=[self.tracer], connector=self.connector, headers=self.headers
@@ -140,6 +276,16 @@ class Client(APIClientProto):
             await self.session.close()
         await asyncio.sleep(0)
 
+    async def _on_connection_create_end(
+        self, session: ClientSession, context: Any, params: TraceConnectionCreateEndParams
+    ) -> None:
+        self.connection_stats.created += 1
+
+    async def _on_connection_reuseconn(
+        self, session: ClientSession, context: Any, params: TraceConnectionReuseconnParams
+    ) -> None:
+        self.connection_stats.reused += 1
+
     def _handle_response_errors(self, code: int, error: YouTubeDataAPIError) -> Never:
         """Handle the errors from the YouTube Data API. Docs: https://developers.google.com/youtube/v3/docs/errors."""
         if error.reason == "quotaExceeded":
@@ -147,7 +293,7 @@ class Client(APIClientProto):
         elif error.reason == "forbidden":
             raise PyYouTubeForbiddenError(code, error.message)
         else:
-            raise PyYouTubeServiceError(code, error.message)
+            raise PyYouTubeServiceError(code, error.message, reason=error.reason)
 
     async def _handle_error(self, response: ClientResponse) -> None:
         status: int = response.status
@@ -176,21 +322,69 @@ class Client(APIClientProto):
         for error in errors:
             self._handle_response_errors(code, error)
 
+    @overload
+    async def list(
+        self,
+        resource: type[T],
+        path: str,
+        params: dict[str, str],
+        response_format: Literal["model", "lazy"],
+    ) -> T: ...
+
+    @overload
     async def list(
         self,
         resource: type[T],
         path: str,
         params: dict[str, str],
-    ) -> T:
+        response_format: Literal["json"],
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def list(
+        self,
+        resource: type[T],
+        path: str,
+        params: dict[str, str],
+        response_format: Literal["bytes"],
+    ) -> bytes: ...
+
+    @overload
+    async def list(
+        self,
+        resource: type[T],
+        path: str,
+        params: dict[str, str],
+        response_format: None = None,
+    ) -> T: ...
+
+    async def list(
+        self,
+        resource: type[T],
+        path: str,
+        params: dict[str, str],
+        response_format: Optional[ResponseFormat] = None,
+    ) -> Union[T, dict[str, Any], bytes]:
         """Make a request to the YouTube Data API v3 and return the deserialized response.
 
+        Identical requests (same path and parameters) made concurrently share a single HTTP request
+        and receive the same deserialized response, unless `deduplicate_requests` is disabled.
+        With `response_cache`, the repeated requests are served from the cache until their responses expire.
+        With `search_cache`, the search queries are canonicalized and served from the search cache.
+
         Args:
             resource (type[T]): The Serializable class to deserialize the response into.
             path (str): The API endpoint path.
             params (dict[str, str]): Query parameters for the request.
+            response_format (ResponseFormat | None): The form of the response. Defaults to `Client.response_format`.
+                - model: The response deserialized into `resource`.
+                - lazy: The response deserialized into `resource` with `deserialize_lazy`. The nested models
+                  are deserialized on the first access, which is cheaper when only some parts are used.
+                - json: The orjson-parsed response dictionary, `resource` isn't used.
+                - bytes: The raw response body, it isn't parsed at all.
 
         Returns:
-            T: The deserialized response.
+            T: The deserialized response, or the dictionary or bytes depending on `response_format`.
 
         Raises:
             PyYouTubeSessionError: If the async session is not initialized or closed.
@@ -200,37 +394,169 @@ class Client(APIClientProto):
         if not self.session or self.session.closed:
             raise PyYouTubeSessionError("Async session is not initialized or closed")
 
+        response_format = response_format or self.response_format
+
         # Construct the full URL if necessary
         if not path.startswith("http"):
             path = f"{self.base_url}{path}"
 
-        # Add API key to params if using APIKeyAuthentication
-        if params and isinstance(self.auth, APIKeyAuthentication):
-            params.update({"key": self.auth.api_key})
-
         # Remove None values from params
-        if params:
-            params = {key: value for key, value in params.items() if value is not None}
+        params = {key: value for key, value in params.items() if value is not None} if params else {}
+
+        cache = self.response_cache
+        if self.search_cache and get_endpoint(path) == "search":
+            params = self.search_cache.canonicalize(params)
+            cache = self.search_cache
+
+        # The cache key doesn't include the credentials, so the responses to OAuth clients are cached only on opt-in.
+        if cache and isinstance(self.auth, AccessTokenAuthentication) and not cache.cache_authorized:
+            cache = None
+
+        # Serve the repeated request from the cache, the body is cached to be decoded into any response format.
+        ttl = cache.get_ttl(path, params) if cache else None
+        if cache and ttl is not None:
+            cache_key = cache.get_key(path, params)
+            body = await cache.get(cache_key)
+            if body is None:
+                body = await self._deduplicated(resource, path, params, "bytes")  # type: ignore
+                await cache.set(cache_key, body, ttl)
+            return self._decode(resource, body, response_format)
+
+        return await self._deduplicated(resource, path, params, response_format)
+
+    async def _deduplicated(
+        self,
+        resource: type[T],
+        path: str,
+        params: dict[str, str],
+        response_format: ResponseFormat,
+    ) -> Union[T, dict[str, Any], bytes]:
+        """Make the request, joining the identical request which is already in flight, if any."""
+        if not self.deduplicate_requests:
+            return await self._request(resource, path, params, response_format)
+
+        # Join the identical request which is already in flight, if any.
+        key = (resource, canonical_request_key(path, params), response_format)
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request(resource, path, params, response_format))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield the shared request, so a cancelled caller doesn't cancel it for the others.
+        return await asyncio.shield(future)
+
+    async def _request(
+        self,
+        resource: type[T],
+        path: str,
+        params: dict[str, str],
+        response_format: ResponseFormat = "model",
+    ) -> Union[T, dict[str, Any], bytes]:
+        """Make an HTTP request to the YouTube Data API v3, retrying it according to the retry policy.
+
+        With an API key pool, a request that hit the quota of its key is repeated with the next key.
+        """
+        attempt: int = 0
+        while True:
+            api_key: Optional[str] = self.key_pool.acquire(get_quota_cost(path)) if self.key_pool else None
+
+            try:
+                return await self._send(resource, path, params, api_key=api_key, response_format=response_format)
+            except PyYouTubeQuotaReachedError:
+                if self.key_pool is None or api_key is None:
+                    raise
+
+                self.key_pool.mark_exhausted(api_key)
+                if not self.key_pool.available:
+                    raise
+
+                logger.warning("Quota of the API key ...%s is exceeded, switching to the next key", api_key[-4:])
+            except Exception as ex:
+                if not self.retry.is_retryable(ex):
+                    raise
+
+                delay = self.retry.get_delay(attempt, retry_after=getattr(ex, "retry_after", None))
+                if delay is None:
+                    raise
+
+                logger.debug("Retrying %s in %.2fs after attempt %d failed: %r", path, delay, attempt + 1, ex)
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        resource: type[T],
+        path: str,
+        params: dict[str, str],
+        api_key: Optional[str] = None,
+        response_format: ResponseFormat = "model",
+    ) -> Union[T, dict[str, Any], bytes]:
+        """Make a single HTTP request to the YouTube Data API v3 and return the response in the requested form."""
+        # Every attempt is charged against the quota, so retries are rate limited as well.
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(path)
+
+        # Revalidate the cached response of the rarely changing resources, if any.
+        etag_cache = self.etag_cache if self.etag_cache and self.etag_cache.is_cacheable(path) else None
+        cache_key: str = canonical_request_key(path, params) if etag_cache else ""
+        entry: Optional[ETagEntry] = etag_cache.get(cache_key) if etag_cache else None
+
+        # Add API key to params if using APIKeyAuthentication
+        if api_key is not None:
+            params = {**params, "key": api_key}
 
         # Make the API request
         async with (
             self.semaphore,
-            self.session.get(
+            self.session.get(  # type: ignore
                 url=path,
                 params=params,
                 proxy=self.proxy,
+                headers={"If-None-Match": entry.etag} if entry else None,
             ) as response,
         ):
+            if response.status == 304 and etag_cache and entry:  # noqa: PLR2004
+                etag_cache.hits += 1
+                key = (resource, response_format)
+                if key not in entry.objects:
+                    entry.objects[key] = self._decode(resource, entry.body, response_format)
+                return entry.objects[key]
+
             # Handle the response
             if response.status != 200:  # noqa: PLR2004
-                await self._handle_error(response)
+                try:
+                    await self._handle_error(response)
+                except PyYouTubeServiceError as ex:
+                    ex.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise
 
             try:
-                data: dict[str, str] = await response.json(loads=orjson.loads)
+                body: bytes = await response.read()
+                result = self._decode(resource, body, response_format)
             except Exception as ex:
+                # Let connection errors in the middle of the body reach the retry loop as they are.
+                if self.retry.is_retryable(ex):
+                    raise
                 raise PyYouTubeServiceError(
                     response.status, f"Unable to read response message ({ex.__class__.__name__}): {ex}"
                 ) from ex
 
-            # Deserialize and return the response data
-            return resource.deserialize(data)
+            etag = response.headers.get("ETag")
+            if etag_cache and etag:
+                etag_cache.misses += 1
+                etag_cache.set(cache_key, etag, body).objects[(resource, response_format)] = result
+
+            return result
+
+    def _decode(self, resource: type[T], body: bytes, response_format: ResponseFormat) -> Union[T, dict[str, Any], bytes]:
+        """Convert the response body into the requested form."""
+        if response_format == "bytes":
+            return body
+        if response_format == "model":
+            return resource.from_json(body)
+
+        data: dict[str, Any] = orjson.loads(body)
+        if response_format == "json":
+            return data
+        return resource.deserialize_lazy(data)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 __all__ = ["PyYouTubeIncorrectParamsError", "PyYouTubeSessionError", "PyYouTubeServiceError"]
 
 
@@ -12,9 +14,19 @@ class PyYouTubeSessionError(Exception):
 class PyYouTubeServiceError(Exception):
     """Raise when YouTube service returns an error response."""
 
-    def __init__(self, status_code: int, message: str):
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        reason: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
         self.status_code = status_code
         self.message = message
+        self.reason = reason
+        """The YouTube Data API error reason, e.g. `rateLimitExceeded`."""
+        self.retry_after = retry_after
+        """The delay in seconds requested by the `Retry-After` response header."""
 
     def __str__(self):
         return f"HTTP error {self.status_code}: {self.message}"
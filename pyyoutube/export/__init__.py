@@ -0,0 +1,4 @@
+# The exporters require the optional PyArrow dependency: `pip install python-youtube[arrow]`.
+from .arrow import ParquetExporter, arrow_schema, to_record_batch, write_parquet
+
+__all__ = ["ParquetExporter", "arrow_schema", "to_record_batch", "write_parquet"]
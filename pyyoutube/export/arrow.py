@@ -0,0 +1,174 @@
+"""Export of the list responses to Apache Arrow and Parquet."""
+
+from collections.abc import AsyncIterable, Iterable
+from datetime import datetime
+from os import PathLike
+from types import TracebackType
+from typing import Any, Optional, Union, get_args, get_origin
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as ex:  # pragma: no cover
+    raise ImportError("Arrow export requires PyArrow, install it with `pip install python-youtube[arrow]`") from ex
+
+from ..utils.serializable import Serializable
+
+PRIMITIVE_TYPES: dict[type, pa.DataType] = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    datetime: pa.timestamp("us", tz="UTC"),
+}
+"""Arrow types of the primitive field types. Other types are exported as strings."""
+
+
+def arrow_type(ftype: Any) -> Optional[pa.DataType]:
+    """Get the Arrow type of the `Serializable` field type.
+
+    Nested models become structs, lists (and sets and tuples) become lists and dictionaries become maps.
+
+    Returns:
+        The Arrow type or None if the type can't be stored, e.g. a model without fields.
+    """
+    origin, args = get_origin(ftype), get_args(ftype)
+
+    # Optional[X] is a nullable X, which all Arrow types are.
+    if origin is Union and len(args) == 2 and args[1] is type(None):  # noqa: PLR2004
+        return arrow_type(args[0])
+
+    if isinstance(ftype, type) and issubclass(ftype, Serializable):
+        return arrow_struct(ftype)
+
+    if origin in {list, set, tuple}:
+        item_type = arrow_type(args[0]) if args else pa.string()
+        return pa.list_(item_type) if item_type is not None else None
+
+    if origin is dict:
+        value_type = arrow_type(args[1]) if args else pa.string()
+        return pa.map_(pa.string(), value_type) if value_type is not None else None
+
+    return PRIMITIVE_TYPES.get(ftype, pa.string())
+
+
+def arrow_struct(resource: type[Serializable]) -> Optional[pa.StructType]:
+    """Get the Arrow struct type of the model. None if the model has no fields which can be stored."""
+    fields = [pa.field(name, ftype) for name, ftype in _arrow_fields(resource)]
+    return pa.struct(fields) if fields else None
+
+
+def _arrow_fields(resource: type[Serializable]) -> Iterable[tuple[str, pa.DataType]]:
+    """Iterate over the names and the Arrow types of the model fields which can be stored."""
+    for name, field in resource._schema.items():
+        ftype = arrow_type(field.type)
+        if ftype is not None:
+            yield name, ftype
+
+
+def arrow_schema(resource: type[Serializable]) -> pa.Schema:
+    """Derive the Arrow schema from the `Serializable` model.
+
+    Args:
+        resource: The model of a row, e.g. `Video`, or a list response (e.g. `VideoListResponse`),
+            in which case the schema of its `items` is returned.
+
+    Returns:
+        The schema with a column per model field.
+    """
+    return pa.schema(list(_arrow_fields(item_model(resource))))
+
+
+def item_model(resource: type[Serializable]) -> type[Serializable]:
+    """Get the model of the list response items, or the model itself if it isn't a list response."""
+    if "items" not in resource._schema:
+        return resource
+
+    item_type = resource._map["items"]
+    return item_type if isinstance(item_type, type) and issubclass(item_type, Serializable) else resource
+
+
+def to_record_batch(items: Union[Serializable, Iterable[Serializable]], schema: pa.Schema) -> pa.RecordBatch:
+    """Convert the items of the list response (or the items themselves) into an Arrow record batch.
+
+    Args:
+        items: The list response, e.g. a `VideoListResponse` page, or the models of the rows.
+        schema: The schema of the rows, see `arrow_schema`.
+
+    Returns:
+        The record batch with a row per item.
+    """
+    if isinstance(items, Serializable) and "items" in items._schema:
+        items = items.items  # type: ignore
+    return pa.RecordBatch.from_pylist([item.serialize() for item in items], schema=schema)
+
+
+class ParquetExporter:
+    """Writes the pages of a list response to a Parquet file incrementally.
+
+    Every page is converted into a record batch and written right away, so only one page is held in memory.
+
+    Example:
+        ```python
+        with ParquetExporter("videos.parquet", VideoListResponse) as exporter:
+            async for page in client.videos.iter_pages(chart="mostPopular"):
+                exporter.write(page)
+        ```
+    """
+
+    def __init__(self, path: Union[str, PathLike], resource: type[Serializable], **kwargs):
+        """Initialize the exporter.
+
+        Args:
+            path: The path of the Parquet file.
+            resource: The list response (e.g. `VideoListResponse`) or the model of the rows (e.g. `Video`).
+            **kwargs: Keyword arguments for `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+        """
+        self.schema: pa.Schema = arrow_schema(resource)
+        self.rows: int = 0
+        self._writer = pq.ParquetWriter(path, self.schema, **kwargs)
+
+    def write(self, items: Union[Serializable, Iterable[Serializable]]) -> None:
+        """Write the list response page (or the models of the rows) to the file."""
+        batch = to_record_batch(items, self.schema)
+        if batch.num_rows:
+            self._writer.write_batch(batch)
+            self.rows += batch.num_rows
+
+    def close(self) -> None:
+        """Finish the file."""
+        self._writer.close()
+
+    def __enter__(self) -> "ParquetExporter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+async def write_parquet(
+    pages: AsyncIterable[Serializable],
+    path: Union[str, PathLike],
+    resource: type[Serializable],
+    **kwargs,
+) -> int:
+    """Write the pages of a list response, e.g. of `iter_pages`, to a Parquet file as they arrive.
+
+    Args:
+        pages: The pages of the list response.
+        path: The path of the Parquet file.
+        resource: The list response (e.g. `VideoListResponse`) or the model of the rows (e.g. `Video`).
+        **kwargs: Keyword arguments for `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+
+    Returns:
+        The number of the written rows.
+    """
+    with ParquetExporter(path, resource, **kwargs) as exporter:
+        async for page in pages:
+            exporter.write(page)
+    return exporter.rows
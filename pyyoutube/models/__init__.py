@@ -1,18 +1,142 @@
-# ruff: noqa: F403 - wildcard import for all models
-
-from .caption import *
-from .category import *
-from .channel import *
-from .channel_section import *
-from .comment import *
-from .comment_thread import *
-from .i18n import *
-from .member import *
-from .memberships_level import *
-from .playlist import *
-from .playlist_item import *
-from .search_result import *
-from .subscription import *
-from .video import *
-from .video_abuse_report_reason import *
-from .watermark import *
+# ruff: noqa: F403 - wildcard import for all models for type checkers
+"""The models of the API resources.
+
+The model modules are imported on the first access to their models, e.g. `pyyoutube.models.VideoListResponse`
+imports only `pyyoutube.models.video` (and the modules it depends on). It keeps the import of the package and
+the code generation of the models limited to the resources that are actually used.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .caption import *
+    from .category import *
+    from .channel import *
+    from .channel_section import *
+    from .comment import *
+    from .comment_thread import *
+    from .i18n import *
+    from .member import *
+    from .memberships_level import *
+    from .playlist import *
+    from .playlist_item import *
+    from .search_result import *
+    from .subscription import *
+    from .video import *
+    from .video_abuse_report_reason import *
+    from .watermark import *
+
+_MODULES: dict[str, str] = {
+    "Caption": "caption",
+    "CaptionListResponse": "caption",
+    "CaptionSnippet": "caption",
+    "CategorySnippet": "category",
+    "VideoCategory": "category",
+    "VideoCategoryListResponse": "category",
+    "VideoCategorySnippet": "category",
+    "Channel": "channel",
+    "ChannelAuditDetails": "channel",
+    "ChannelBrandingSetting": "channel",
+    "ChannelBrandingSettingChannel": "channel",
+    "ChannelBrandingSettingImage": "channel",
+    "ChannelContentDetails": "channel",
+    "ChannelContentOwnerDetails": "channel",
+    "ChannelListResponse": "channel",
+    "ChannelSnippet": "channel",
+    "ChannelStatistics": "channel",
+    "ChannelStatus": "channel",
+    "ChannelTopicDetails": "channel",
+    "RelatedPlaylists": "channel",
+    "ChannelSection": "channel_section",
+    "ChannelSectionContentDetails": "channel_section",
+    "ChannelSectionListResponse": "channel_section",
+    "ChannelSectionSnippet": "channel_section",
+    "Comment": "comment",
+    "CommentListResponse": "comment",
+    "CommentSnippet": "comment",
+    "CommentSnippetAuthorChannelId": "comment",
+    "CommentThread": "comment_thread",
+    "CommentThreadListResponse": "comment_thread",
+    "CommentThreadReplies": "comment_thread",
+    "CommentThreadSnippet": "comment_thread",
+    "BaseList": "common",
+    "BaseResource": "common",
+    "BaseTopicDetails": "common",
+    "Localized": "common",
+    "PaginationResponse": "common",
+    "Player": "common",
+    "ResourceId": "common",
+    "Thumbnails": "common",
+    "I18nLanguage": "i18n",
+    "I18nLanguageListResponse": "i18n",
+    "I18nLanguageSnippet": "i18n",
+    "I18nRegion": "i18n",
+    "I18nRegionListResponse": "i18n",
+    "I18nRegionSnippet": "i18n",
+    "Member": "member",
+    "MemberListResponse": "member",
+    "MemberSnippet": "member",
+    "MemberSnippetMemberDetails": "member",
+    "MemberSnippetMembershipsDetails": "member",
+    "MemberSnippetMembershipsDuration": "member",
+    "MemberSnippetMembershipsDurationAtLevel": "member",
+    "MembershipLevelSnippetLevelDetails": "memberships_level",
+    "MembershipsLevel": "memberships_level",
+    "MembershipsLevelListResponse": "memberships_level",
+    "MembershipsLevelSnippet": "memberships_level",
+    "DatetimeTimeMixin": "mixins",
+    "Playlist": "playlist",
+    "PlaylistContentDetails": "playlist",
+    "PlaylistListResponse": "playlist",
+    "PlaylistSnippet": "playlist",
+    "PlaylistStatus": "playlist",
+    "PlaylistItem": "playlist_item",
+    "PlaylistItemContentDetails": "playlist_item",
+    "PlaylistItemListResponse": "playlist_item",
+    "PlaylistItemSnippet": "playlist_item",
+    "PlaylistItemStatus": "playlist_item",
+    "SearchListResponse": "search_result",
+    "SearchResult": "search_result",
+    "SearchResultId": "search_result",
+    "SearchResultSnippet": "search_result",
+    "Subscription": "subscription",
+    "SubscriptionContentDetails": "subscription",
+    "SubscriptionListResponse": "subscription",
+    "SubscriptionSnippet": "subscription",
+    "SubscriptionSubscriberSnippet": "subscription",
+    "ContentRating": "video",
+    "RegionRestriction": "video",
+    "Video": "video",
+    "VideoContentDetails": "video",
+    "VideoListResponse": "video",
+    "VideoLiveStreamingDetails": "video",
+    "VideoSnippet": "video",
+    "VideoStatistics": "video",
+    "VideoStatus": "video",
+    "VideoTopicDetails": "video",
+    "SecondaryReason": "video_abuse_report_reason",
+    "VideoAbuseReportReason": "video_abuse_report_reason",
+    "VideoAbuseReportReasonListResponse": "video_abuse_report_reason",
+    "VideoAbuseReportReasonSnippet": "video_abuse_report_reason",
+    "Watermark": "watermark",
+    "WatermarkPosition": "watermark",
+    "WatermarkTiming": "watermark",
+}
+"""The module of every model."""
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of the model on the first access."""
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Unlike `importlib.import_module`, `__import__` is reported by `python -X importtime`.
+    value = getattr(__import__(f"{__name__}.{_MODULES[name]}", fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
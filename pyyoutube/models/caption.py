@@ -1,6 +1,6 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
@@ -8,7 +8,6 @@ from .common import BaseList, BaseResource
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class CaptionSnippet(Serializable, DatetimeTimeMixin):
     """A class representing the caption snippet resource info.
 
@@ -30,7 +29,6 @@ class CaptionSnippet(Serializable, DatetimeTimeMixin):
     failureReason: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class Caption(BaseResource):
     """A class representing the caption resource info.
 
@@ -40,11 +38,10 @@ class Caption(BaseResource):
     snippet: Optional[CaptionSnippet] = field(default=None)
 
 
-@dataclass
 class CaptionListResponse(BaseList):
     """A class representing the activity response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/captions/list?#response_1
     """
 
-    items: list[Caption] = field(repr=False)
+    items: list[Caption] = field(default_factory=list, repr=False)
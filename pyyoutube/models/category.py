@@ -1,13 +1,12 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
 from .common import BaseList, BaseResource
 
 
-@dataclass
 class CategorySnippet(Serializable):
     """This is base category snippet for video and guide."""
 
@@ -15,7 +14,6 @@ class CategorySnippet(Serializable):
     title: Optional[str] = field(default=None)
 
 
-@dataclass
 class VideoCategorySnippet(CategorySnippet):
     """A class representing video category snippet info.
 
@@ -25,7 +23,6 @@ class VideoCategorySnippet(CategorySnippet):
     assignable: Optional[bool] = field(default=None, repr=False)
 
 
-@dataclass
 class VideoCategory(BaseResource):
     """A class representing video category info.
 
@@ -35,11 +32,10 @@ class VideoCategory(BaseResource):
     snippet: Optional[VideoCategorySnippet] = field(default=None, repr=False)
 
 
-@dataclass
 class VideoCategoryListResponse(BaseList):
     """A class representing the video category's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videoCategories/list#response_1
     """
 
-    items: list[VideoCategory] = field(repr=False)
+    items: list[VideoCategory] = field(default_factory=list, repr=False)
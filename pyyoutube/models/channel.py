@@ -1,20 +1,19 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
 from .common import (
-    BaseList,
     BaseResource,
     BaseTopicDetails,
     Localized,
+    PaginationResponse,
     Thumbnails,
 )
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class RelatedPlaylists(Serializable):
     """A class representing the channel's related playlists info.
 
@@ -25,7 +24,6 @@ class RelatedPlaylists(Serializable):
     uploads: Optional[str] = field(default=None)
 
 
-@dataclass
 class ChannelBrandingSettingChannel(Serializable):
     """A class representing the channel branding setting's channel info.
 
@@ -42,7 +40,6 @@ class ChannelBrandingSettingChannel(Serializable):
     country: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class ChannelBrandingSettingImage(Serializable):
     """A class representing the channel branding setting's image info.
 
@@ -52,7 +49,6 @@ class ChannelBrandingSettingImage(Serializable):
     bannerExternalUrl: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class ChannelSnippet(Serializable, DatetimeTimeMixin):
     """A class representing the channel snippet info.
 
@@ -69,7 +65,6 @@ class ChannelSnippet(Serializable, DatetimeTimeMixin):
     country: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class ChannelContentDetails(Serializable):
     """A class representing the channel's content info.
 
@@ -79,7 +74,6 @@ class ChannelContentDetails(Serializable):
     relatedPlaylists: Optional[RelatedPlaylists] = field(default=None)
 
 
-@dataclass
 class ChannelStatistics(Serializable):
     """A class representing the Channel's statistics info.
 
@@ -92,7 +86,6 @@ class ChannelStatistics(Serializable):
     videoCount: Optional[int] = field(default=None, repr=False)
 
 
-@dataclass
 class ChannelTopicDetails(BaseTopicDetails):
     """A class representing the channel's topic detail info.
 
@@ -103,7 +96,6 @@ class ChannelTopicDetails(BaseTopicDetails):
     topicCategories: Optional[list[str]] = field(default=None)
 
 
-@dataclass
 class ChannelStatus(Serializable):
     """A class representing the channel's status info.
 
@@ -117,7 +109,6 @@ class ChannelStatus(Serializable):
     selfDeclaredMadeForKids: Optional[bool] = field(default=None, repr=False)
 
 
-@dataclass
 class ChannelBrandingSetting(Serializable):
     """A class representing the channel branding settings info.
 
@@ -128,7 +119,6 @@ class ChannelBrandingSetting(Serializable):
     image: Optional[ChannelBrandingSettingImage] = field(default=None)
 
 
-@dataclass
 class ChannelAuditDetails(Serializable):
     """A class representing the channel audit details info.
 
@@ -141,7 +131,6 @@ class ChannelAuditDetails(Serializable):
     contentIdClaimsGoodStanding: Optional[bool] = field(default=None, repr=True)
 
 
-@dataclass
 class ChannelContentOwnerDetails(Serializable):
     """A class representing the channel data relevant for YouTube Partners.
 
@@ -152,7 +141,6 @@ class ChannelContentOwnerDetails(Serializable):
     timeLinked: Optional[str] = field(default=None)
 
 
-@dataclass
 class Channel(BaseResource):
     """A class representing the channel's info.
 
@@ -170,11 +158,10 @@ class Channel(BaseResource):
     localizations: Optional[dict] = field(default=None, repr=False)
 
 
-@dataclass
-class ChannelListResponse(BaseList):
+class ChannelListResponse(PaginationResponse):
     """A class representing the channel's retrieve response info.
 
     References: https://developers.google.com/youtube/v3/docs/channels/list#response
     """
 
-    items: list[Channel] = field(repr=False)
+    items: list[Channel] = field(default_factory=list, repr=False)
@@ -1,13 +1,12 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
 from .common import BaseList, BaseResource
 
 
-@dataclass
 class ChannelSectionSnippet(Serializable):
     """A class representing the channel section snippet info.
 
@@ -20,7 +19,6 @@ class ChannelSectionSnippet(Serializable):
     position: Optional[int] = field(default=None)
 
 
-@dataclass
 class ChannelSectionContentDetails(Serializable):
     """A class representing the channel section content details info.
 
@@ -31,7 +29,6 @@ class ChannelSectionContentDetails(Serializable):
     channels: Optional[list[str]] = field(default=None)
 
 
-@dataclass
 class ChannelSection(BaseResource):
     """A class representing the channel section info.
 
@@ -42,11 +39,10 @@ class ChannelSection(BaseResource):
     contentDetails: Optional[ChannelSectionContentDetails] = field(default=None, repr=False)
 
 
-@dataclass
 class ChannelSectionListResponse(BaseList):
     """A class representing the channel section's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/channelSections/list?#properties_1
     """
 
-    items: list[ChannelSection] = field(repr=False)
+    items: list[ChannelSection] = field(default_factory=list, repr=False)
@@ -1,14 +1,13 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
-from .common import BaseList, BaseResource
+from .common import BaseResource, PaginationResponse
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class CommentSnippetAuthorChannelId(Serializable):
     """A class representing comment's snippet authorChannelId info.
 
@@ -18,7 +17,6 @@ class CommentSnippetAuthorChannelId(Serializable):
     value: Optional[str] = field(default=None)
 
 
-@dataclass
 class CommentSnippet(Serializable, DatetimeTimeMixin):
     """A class representing comment's snippet info.
 
@@ -42,7 +40,6 @@ class CommentSnippet(Serializable, DatetimeTimeMixin):
     updatedAt: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class Comment(BaseResource):
     """A class representing comment info.
 
@@ -52,11 +49,10 @@ class Comment(BaseResource):
     snippet: Optional[CommentSnippet] = field(default=None)
 
 
-@dataclass
-class CommentListResponse(BaseList):
+class CommentListResponse(PaginationResponse):
     """A class representing the comment's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/comments/list#response_1
     """
 
-    items: list[Comment] = field(repr=False)
+    items: list[Comment] = field(default_factory=list, repr=False)
@@ -1,14 +1,13 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
 from .comment import Comment
-from .common import BaseList, BaseResource
+from .common import BaseResource, PaginationResponse
 
 
-@dataclass
 class CommentThreadSnippet(Serializable):
     """A class representing comment tread snippet info.
 
@@ -23,17 +22,15 @@ class CommentThreadSnippet(Serializable):
     isPublic: Optional[bool] = field(default=None, repr=False)
 
 
-@dataclass
 class CommentThreadReplies(Serializable):
     """A class representing comment tread replies info.
 
     Refer: https://developers.google.com/youtube/v3/docs/commentThreads#replies
     """
 
-    comments: list[Comment] = field(repr=False)
+    comments: list[Comment] = field(default_factory=list, repr=False)
 
 
-@dataclass
 class CommentThread(BaseResource):
     """A class representing comment thread info.
 
@@ -44,11 +41,10 @@ class CommentThread(BaseResource):
     replies: Optional[CommentThreadReplies] = field(default=None, repr=False)
 
 
-@dataclass
-class CommentThreadListResponse(BaseList):
+class CommentThreadListResponse(PaginationResponse):
     """A class representing the comment thread's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/commentThreads/list#response_1
     """
 
-    items: list[CommentThread] = field(repr=False)
+    items: list[CommentThread] = field(default_factory=list, repr=False)
@@ -1,12 +1,11 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import KW_ONLY, field
 from typing import Optional
 
 from ..utils.serializable import Serializable
 
 
-@dataclass
 class Thumbnail(Serializable):
     """A class representing the thumbnail resource info.
 
@@ -18,7 +17,6 @@ class Thumbnail(Serializable):
     height: Optional[int] = field(default=None, repr=False)
 
 
-@dataclass
 class Thumbnails(Serializable):
     """A class representing the multi thumbnail resource info.
 
@@ -32,7 +30,6 @@ class Thumbnails(Serializable):
     maxres: Optional[Thumbnail] = field(default=None, repr=False)
 
 
-@dataclass
 class Topic(Serializable):
     """A class representing the channel topic info. this model also suitable for video.
 
@@ -47,11 +44,10 @@ class Topic(Serializable):
     description: Optional[str] = field(default=None)
 
 
-@dataclass
 class BaseTopicDetails(Serializable):
     """This is the base model for channel or video topic details."""
 
-    topicIds: list[str] = field(repr=False)
+    topicIds: Optional[list[str]] = field(default=None, repr=False)
 
     def get_full_topics(self):  # noqa: ANN201, D102
         from pyyoutube.utils.constants import TOPICS
@@ -64,7 +60,6 @@ class BaseTopicDetails(Serializable):
         return r
 
 
-@dataclass
 class Localized(Serializable):
     """A class representing the channel or video snippet localized info.
 
@@ -77,7 +72,6 @@ class Localized(Serializable):
     description: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class PageInfo(Serializable):
     """This is data model for save paging data.
 
@@ -93,19 +87,6 @@ class PageInfo(Serializable):
     """The number of results included in the API response."""
 
 
-@dataclass
-class PaginationResponse(Serializable):
-    """A base model for pagination response types."""
-
-    nextPageToken: str = field(repr=False)
-    """The token that can be used as the value of the pageToken parameter to retrieve the next page in the result set."""
-    prevPageToken: str = field(repr=False)
-    """The token that can be used as the value of the pageToken parameter to retrieve the previous page in the result set."""  # noqa: E501
-    pageInfo: PageInfo = field(repr=False)
-    """The pageInfo object encapsulates paging information for the result set."""
-
-
-@dataclass
 class BaseList(Serializable):
     """A base model for list response types.
 
@@ -114,28 +95,41 @@ class BaseList(Serializable):
         https://developers.google.com/youtube/v3/docs/playlistItems/list#response_1
     """
 
-    kind: str = field()
+    kind: Optional[str] = field(default=None)
     """Identifies the API resource's type."""
-    etag: str = field(repr=False)
+    etag: Optional[str] = field(default=None, repr=False)
     """The Etag of this resource."""
 
 
-@dataclass
+class PaginationResponse(BaseList):
+    """A base model for pagination response types.
+
+    The pagination fields are keyword-only, so list responses can declare their own required fields after them.
+    """
+
+    _: KW_ONLY
+    nextPageToken: Optional[str] = field(default=None, repr=False)
+    """The token that can be used as the value of the pageToken parameter to retrieve the next page in the result set."""
+    prevPageToken: Optional[str] = field(default=None, repr=False)
+    """The token that can be used as the value of the pageToken parameter to retrieve the previous page in the result set."""  # noqa: E501
+    pageInfo: Optional[PageInfo] = field(default=None, repr=False)
+    """The pageInfo object encapsulates paging information for the result set."""
+
+
 class BaseResource(Serializable):
     """This is a base model for different resource type.
 
     Refer: https://developers.google.com/youtube/v3/docs#resource-types
     """
 
-    kind: str = field()
+    kind: Optional[str] = field(default=None)
     """Identifies the API resource's type."""
-    etag: str = field(repr=False)
+    etag: Optional[str] = field(default=None, repr=False)
     """The Etag of this resource."""
-    id: str = field()
+    id: Optional[str] = field(default=None)
     """The ID that YouTube uses to uniquely identify the resource."""
 
 
-@dataclass
 class ResourceId(Serializable):
     """A class representing the subscription snippet resource info.
 
@@ -151,7 +145,6 @@ class ResourceId(Serializable):
     playlistId: Optional[str] = field(default=None)
 
 
-@dataclass
 class Player(Serializable):
     """A class representing the video,playlist player info.
 
@@ -1,13 +1,12 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
 from .common import BaseList, BaseResource
 
 
-@dataclass
 class I18nRegionSnippet(Serializable):
     """A class representing the I18n region snippet info.
 
@@ -18,7 +17,6 @@ class I18nRegionSnippet(Serializable):
     name: Optional[str] = field(default=None)
 
 
-@dataclass
 class I18nRegion(BaseResource):
     """A class representing the I18n region info.
 
@@ -28,17 +26,15 @@ class I18nRegion(BaseResource):
     snippet: Optional[I18nRegionSnippet] = field(default=None)
 
 
-@dataclass
 class I18nRegionListResponse(BaseList):
     """A class representing the I18n region list response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/i18nLanguages/list#response_1
     """
 
-    items: list[I18nRegion] = field(repr=False)
+    items: list[I18nRegion] = field(default_factory=list, repr=False)
 
 
-@dataclass
 class I18nLanguageSnippet(Serializable):
     """A class representing the I18n language snippet info.
 
@@ -49,7 +45,6 @@ class I18nLanguageSnippet(Serializable):
     name: Optional[str] = field(default=None)
 
 
-@dataclass
 class I18nLanguage(BaseResource):
     """A class representing the I18n language info.
 
@@ -59,11 +54,10 @@ class I18nLanguage(BaseResource):
     snippet: Optional[I18nLanguageSnippet] = field(default=None)
 
 
-@dataclass
 class I18nLanguageListResponse(BaseList):
     """A class representing the I18n language list response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/i18nLanguages/list#response_1
     """
 
-    items: list[I18nLanguage] = field(repr=False)
+    items: list[I18nLanguage] = field(default_factory=list, repr=False)
@@ -1,14 +1,13 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
-from .common import BaseList
+from .common import PaginationResponse
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class MemberSnippetMemberDetails(Serializable):
     """A class representing the member snippet member detail.
 
@@ -21,7 +20,6 @@ class MemberSnippetMemberDetails(Serializable):
     profileImageUrl: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class MemberSnippetMembershipsDuration(Serializable, DatetimeTimeMixin):
     """A class representing the member snippet memberships duration."""
 
@@ -29,7 +27,6 @@ class MemberSnippetMembershipsDuration(Serializable, DatetimeTimeMixin):
     memberTotalDurationMonths: Optional[int] = field(default=None, repr=False)
 
 
-@dataclass
 class MemberSnippetMembershipsDurationAtLevel(Serializable):
     """A class representing the member snippet memberships duration at level."""
 
@@ -38,21 +35,19 @@ class MemberSnippetMembershipsDurationAtLevel(Serializable):
     memberTotalDurationMonths: Optional[int] = field(default=None, repr=False)
 
 
-@dataclass
 class MemberSnippetMembershipsDetails(Serializable):
     """A class representing the member snippet membership detail.
 
     Refer: https://developers.google.com/youtube/v3/docs/members#snippet.membershipsDetails
     """
 
-    membershipsDurationAtLevel: list[MemberSnippetMembershipsDurationAtLevel] = field(repr=False)
+    membershipsDurationAtLevel: list[MemberSnippetMembershipsDurationAtLevel] = field(default_factory=list, repr=False)
     accessibleLevels: Optional[list[str]] = field(default=None, repr=False)
     membershipsDuration: Optional[MemberSnippetMembershipsDuration] = field(default=None, repr=False)
     highestAccessibleLevel: Optional[str] = field(default=None)
     highestAccessibleLevelDisplayName: Optional[str] = field(default=None)
 
 
-@dataclass
 class MemberSnippet(Serializable):
     """A class representing the member snippet info.
 
@@ -64,7 +59,6 @@ class MemberSnippet(Serializable):
     membershipsDetails: Optional[MemberSnippetMembershipsDetails] = field(default=None, repr=False)
 
 
-@dataclass
 class Member(Serializable):
     """A class representing the member info.
 
@@ -76,11 +70,10 @@ class Member(Serializable):
     snippet: Optional[MemberSnippet] = field(default=None, repr=False)
 
 
-@dataclass
-class MemberListResponse(BaseList):
+class MemberListResponse(PaginationResponse):
     """A class representing the member's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/members/list#response
     """
 
-    items: list[Member] = field(repr=False)
+    items: list[Member] = field(default_factory=list, repr=False)
@@ -1,18 +1,16 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
 from .common import BaseList, BaseResource
 
 
-@dataclass
 class MembershipLevelSnippetLevelDetails(Serializable):  # noqa: D101
     displayName: Optional[str] = field(default=None)
 
 
-@dataclass
 class MembershipsLevelSnippet(Serializable):
     """A class representing the membership level snippet.
 
@@ -23,7 +21,6 @@ class MembershipsLevelSnippet(Serializable):
     levelDetails: Optional[MembershipLevelSnippetLevelDetails] = field(default=None, repr=False)
 
 
-@dataclass
 class MembershipsLevel(BaseResource):
     """A class representing the membership level.
 
@@ -33,11 +30,10 @@ class MembershipsLevel(BaseResource):
     snippet: Optional[MembershipsLevelSnippet] = field(default=None, repr=False)
 
 
-@dataclass
 class MembershipsLevelListResponse(BaseList):
     """A class representing the memberships level's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/membershipsLevels/list#response
     """
 
-    items: list[MembershipsLevel] = field(repr=False)
+    items: list[MembershipsLevel] = field(default_factory=list, repr=False)
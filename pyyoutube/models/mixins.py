@@ -3,6 +3,8 @@ from typing import Optional
 
 
 class DatetimeTimeMixin:  # noqa: D101
+    __slots__ = ()
+
     @staticmethod
     def string_to_datetime(dt_str: Optional[str]) -> Optional[datetime]:
         """Convert datetime string to datetime instance.
@@ -1,14 +1,13 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
-from .common import BaseList, BaseResource, Localized, Player, Thumbnails
+from .common import BaseResource, Localized, PaginationResponse, Player, Thumbnails
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class PlaylistContentDetails(Serializable):
     """A class representing playlist's content details info.
 
@@ -18,7 +17,6 @@ class PlaylistContentDetails(Serializable):
     itemCount: Optional[int] = field(default=None)
 
 
-@dataclass
 class PlaylistSnippet(Serializable, DatetimeTimeMixin):
     """A class representing the playlist snippet info.
 
@@ -35,7 +33,6 @@ class PlaylistSnippet(Serializable, DatetimeTimeMixin):
     localized: Optional[Localized] = field(default=None, repr=False)
 
 
-@dataclass
 class PlaylistStatus(Serializable):
     """A class representing the playlist status info.
 
@@ -45,7 +42,6 @@ class PlaylistStatus(Serializable):
     privacyStatus: Optional[str] = field(default=None)
 
 
-@dataclass
 class Playlist(BaseResource):
     """A class representing the playlist info.
 
@@ -58,11 +54,10 @@ class Playlist(BaseResource):
     player: Optional[Player] = field(default=None, repr=False)
 
 
-@dataclass
-class PlaylistListResponse(BaseList):
+class PlaylistListResponse(PaginationResponse):
     """A class representing the playlist's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/playlists/list#response_1
     """
 
-    items: list[Playlist] = field(repr=False)
+    items: list[Playlist] = field(default_factory=list, repr=False)
@@ -1,14 +1,13 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
-from .common import BaseList, BaseResource, ResourceId, Thumbnails
+from .common import BaseResource, PaginationResponse, ResourceId, Thumbnails
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class PlaylistItemContentDetails(Serializable, DatetimeTimeMixin):
     """A class representing the playlist item's content details info.
 
@@ -22,7 +21,6 @@ class PlaylistItemContentDetails(Serializable, DatetimeTimeMixin):
     endAt: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class PlaylistItemSnippet(Serializable, DatetimeTimeMixin):
     """A class representing the playlist item's snippet info.
 
@@ -42,7 +40,6 @@ class PlaylistItemSnippet(Serializable, DatetimeTimeMixin):
     resourceId: Optional[ResourceId] = field(default=None, repr=False)
 
 
-@dataclass
 class PlaylistItemStatus(Serializable):
     """A class representing the playlist item's status info.
 
@@ -52,7 +49,6 @@ class PlaylistItemStatus(Serializable):
     privacyStatus: Optional[str] = field(default=None)
 
 
-@dataclass
 class PlaylistItem(BaseResource):
     """A class representing the playlist item's info.
 
@@ -64,11 +60,10 @@ class PlaylistItem(BaseResource):
     status: Optional[PlaylistItemStatus] = field(default=None, repr=False)
 
 
-@dataclass
-class PlaylistItemListResponse(BaseList):
+class PlaylistItemListResponse(PaginationResponse):
     """A class representing the playlist item's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/playlistItems/list#response_1
     """
 
-    items: list[PlaylistItem] = field(repr=False)
+    items: list[PlaylistItem] = field(default_factory=list, repr=False)
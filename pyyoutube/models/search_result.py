@@ -1,14 +1,13 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
-from .common import BaseList, BaseResource, Thumbnails
+from .common import BaseResource, PaginationResponse, Thumbnails
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class SearchResultSnippet(Serializable, DatetimeTimeMixin):
     """A class representing the search result snippet info.
 
@@ -24,36 +23,33 @@ class SearchResultSnippet(Serializable, DatetimeTimeMixin):
     liveBroadcastContent: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class SearchResultId(Serializable):
     """A class representing the search result id info.
 
     Refer: https://developers.google.com/youtube/v3/docs/search#id
     """
 
-    kind: str = field()
+    kind: Optional[str] = field(default=None)
     videoId: Optional[str] = field(default=None, repr=False)
     channelId: Optional[str] = field(default=None, repr=False)
     playlistId: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class SearchResult(BaseResource):
     """A class representing the search result's info.
 
     Refer: https://developers.google.com/youtube/v3/docs/search
     """
 
-    id: SearchResultId = field(repr=False)
-    snippet: SearchResultSnippet = field(repr=False)
+    id: Optional[SearchResultId] = field(default=None, repr=False)
+    snippet: Optional[SearchResultSnippet] = field(default=None, repr=False)
 
 
-@dataclass
-class SearchListResponse(BaseList):
+class SearchListResponse(PaginationResponse):
     """A class representing the channel's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/channels/list#response_1
     """
 
-    items: list[SearchResult] = field(repr=False)
+    items: list[SearchResult] = field(default_factory=list, repr=False)
     regionCode: Optional[str] = field(default=None, repr=False)
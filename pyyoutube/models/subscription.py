@@ -1,14 +1,13 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils.serializable import Serializable
-from .common import BaseList, BaseResource, ResourceId, Thumbnails
+from .common import BaseResource, PaginationResponse, ResourceId, Thumbnails
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class SubscriptionSnippet(Serializable, DatetimeTimeMixin):
     """A class representing the subscription snippet info.
 
@@ -24,7 +23,6 @@ class SubscriptionSnippet(Serializable, DatetimeTimeMixin):
     thumbnails: Optional[Thumbnails] = field(default=None, repr=False)
 
 
-@dataclass
 class SubscriptionContentDetails(Serializable):
     """A class representing the subscription contentDetails info.
 
@@ -36,7 +34,6 @@ class SubscriptionContentDetails(Serializable):
     activityType: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class SubscriptionSubscriberSnippet(Serializable):
     """A class representing the subscription subscriberSnippet info.
 
@@ -49,7 +46,6 @@ class SubscriptionSubscriberSnippet(Serializable):
     thumbnails: Optional[Thumbnails] = field(default=None, repr=False)
 
 
-@dataclass
 class Subscription(BaseResource):
     """A class representing the subscription info.
 
@@ -61,11 +57,10 @@ class Subscription(BaseResource):
     subscriberSnippet: Optional[SubscriptionSubscriberSnippet] = field(default=None, repr=False)
 
 
-@dataclass
-class SubscriptionListResponse(BaseList):
+class SubscriptionListResponse(PaginationResponse):
     """A class representing the subscription's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/subscriptions/list#response_1
     """
 
-    items: list[Subscription] = field(repr=False)
+    items: list[Subscription] = field(default_factory=list, repr=False)
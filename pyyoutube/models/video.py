@@ -1,22 +1,21 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional
 
 from ..utils import get_video_duration
 from ..utils.serializable import Serializable
 from .common import (
-    BaseList,
     BaseResource,
     BaseTopicDetails,
     Localized,
+    PaginationResponse,
     Player,
     Thumbnails,
 )
 from .mixins import DatetimeTimeMixin
 
 
-@dataclass
 class RegionRestriction(Serializable):
     """A class representing the video content details region restriction info.
 
@@ -101,7 +100,6 @@ class ContentRating(Serializable):
     ytRating: Optional[str] = field(default=None)
 
 
-@dataclass
 class VideoContentDetails(Serializable):
     """A class representing the video content details info.
 
@@ -125,7 +123,6 @@ class VideoContentDetails(Serializable):
         return get_video_duration(self.duration)
 
 
-@dataclass
 class VideoTopicDetails(BaseTopicDetails):
     """A class representing video's topic detail info.
 
@@ -144,7 +141,6 @@ class VideoTopicDetails(BaseTopicDetails):
             self.topicIds = self.relevantTopicIds
 
 
-@dataclass
 class VideoSnippet(Serializable, DatetimeTimeMixin):
     """A class representing the video snippet info.
 
@@ -165,20 +161,18 @@ class VideoSnippet(Serializable, DatetimeTimeMixin):
     defaultAudioLanguage: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class VideoStatistics(Serializable):
     """A class representing the video statistics info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videos#statistics
     """
 
-    viewCount: int = field()
+    viewCount: Optional[int] = field(default=None)
     likeCount: Optional[int] = field(default=None)
     dislikeCount: Optional[int] = field(default=None, repr=False)
     commentCount: Optional[int] = field(default=None, repr=False)
 
 
-@dataclass
 class VideoStatus(Serializable, DatetimeTimeMixin):
     """A class representing the video status info.
 
@@ -197,7 +191,6 @@ class VideoStatus(Serializable, DatetimeTimeMixin):
     selfDeclaredMadeForKids: Optional[bool] = field(default=None, repr=False)
 
 
-@dataclass
 class VideoLiveStreamingDetails(Serializable, DatetimeTimeMixin):
     """A class representing the video live streaming details.
 
@@ -212,28 +205,26 @@ class VideoLiveStreamingDetails(Serializable, DatetimeTimeMixin):
     activeLiveChatId: Optional[str] = field(default=None, repr=False)
 
 
-@dataclass
 class Video(BaseResource):
     """A class representing the video info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videos
     """
 
-    snippet: VideoSnippet = field(repr=False)
-    contentDetails: VideoContentDetails = field(repr=False)
-    status: VideoStatus = field(repr=False)
-    statistics: VideoStatistics = field(repr=False)
-    topicDetails: VideoTopicDetails = field(repr=False)
-    player: Player = field(repr=False)
+    snippet: Optional[VideoSnippet] = field(default=None, repr=False)
+    contentDetails: Optional[VideoContentDetails] = field(default=None, repr=False)
+    status: Optional[VideoStatus] = field(default=None, repr=False)
+    statistics: Optional[VideoStatistics] = field(default=None, repr=False)
+    topicDetails: Optional[VideoTopicDetails] = field(default=None, repr=False)
+    player: Optional[Player] = field(default=None, repr=False)
     liveStreamingDetails: Optional[VideoLiveStreamingDetails] = field(default=None, repr=False)
 
 
-@dataclass
-class VideoListResponse(BaseList):
+class VideoListResponse(PaginationResponse):
     """A class representing the video's retrieve response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videos/list#response_1
     """
 
-    items: list[Video] = field(repr=False)
+    items: list[Video] = field(default_factory=list, repr=False)
     """A list of videos that match the request criteria."""
@@ -1,48 +1,45 @@
 # ruff: noqa: N815 (YouTube specific attributes)
 
-from dataclasses import dataclass, field
+from dataclasses import field
+from typing import Optional
 
 from ..utils.serializable import Serializable
 from .common import BaseList, BaseResource
 
 
-@dataclass
 class SecondaryReason(Serializable):
     """A class representing the video abuse report reason info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videoAbuseReportReasons#snippet.secondaryReasons
     """
 
-    id: str = field()
-    label: str = field(repr=True)
+    id: Optional[str] = field(default=None)
+    label: Optional[str] = field(default=None, repr=True)
 
 
-@dataclass
 class VideoAbuseReportReasonSnippet(Serializable):
     """A class representing the video abuse report snippet info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videoAbuseReportReasons#snippet
     """
 
-    label: str = field()
-    secondaryReasons: list[SecondaryReason] = field(repr=True)
+    label: Optional[str] = field(default=None)
+    secondaryReasons: list[SecondaryReason] = field(default_factory=list, repr=True)
 
 
-@dataclass
 class VideoAbuseReportReason(BaseResource):
     """A class representing the video abuse report info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videoAbuseReportReasons
     """
 
-    snippet: VideoAbuseReportReasonSnippet = field()
+    snippet: Optional[VideoAbuseReportReasonSnippet] = field(default=None)
 
 
-@dataclass
 class VideoAbuseReportReasonListResponse(BaseList):
     """A class representing the I18n language list response info.
 
     Refer: https://developers.google.com/youtube/v3/docs/videoAbuseReportReasons/list#response_1
     """
 
-    items: list[VideoAbuseReportReason] = field(repr=False)
+    items: list[VideoAbuseReportReason] = field(default_factory=list, repr=False)
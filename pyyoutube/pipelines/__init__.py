@@ -0,0 +1,15 @@
+"""High-level pipelines built on the resources, for the common multi-request workloads."""
+
+from .sync import Checkpoint, CheckpointStore, MemoryCheckpointStore, SQLiteCheckpointStore, UploadsSync
+from .uploads import DEFAULT_VIDEO_PARTS, get_uploads_playlist_id, harvest_uploads
+
+__all__ = [
+    "DEFAULT_VIDEO_PARTS",
+    "Checkpoint",
+    "CheckpointStore",
+    "MemoryCheckpointStore",
+    "SQLiteCheckpointStore",
+    "UploadsSync",
+    "get_uploads_playlist_id",
+    "harvest_uploads",
+]
@@ -0,0 +1,187 @@
+"""Incremental sync of the channel uploads, which reads only the uploads newer than the last sync."""
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, MutableSequence
+from dataclasses import dataclass
+from os import PathLike
+from typing import TYPE_CHECKING, Optional, Union
+
+from ..error import PyYouTubeIncorrectParamsError
+from ..utils.rfc3339 import parse_rfc3339
+from ..utils.sqlite import SQLiteDatabase
+from .uploads import DEFAULT_VIDEO_PARTS, get_uploads_playlist_id, harvest_uploads
+
+if TYPE_CHECKING:
+    from ..client import Client
+    from ..models import PlaylistItem, Video
+
+
+@dataclass
+class Checkpoint:
+    """The newest upload of a channel seen by the last sync."""
+
+    playlist_id: str
+    """The uploads playlist ID, so the channel isn't resolved again."""
+    video_id: Optional[str] = None
+    """The ID of the newest video. None if the channel had no uploads."""
+    published_at: Optional[str] = None
+    """The publish time of the newest video (`videoPublishedAt`)."""
+
+    def is_reached(self, item: "PlaylistItem") -> bool:
+        """Check whether the playlist item is the checkpoint video or older, so the rest was seen before."""
+        details = item.contentDetails
+        if details is None:
+            return False
+        if self.video_id is not None and details.videoId == self.video_id:
+            return True
+
+        # The checkpoint video may have been deleted, an older video ends the new uploads as well.
+        published_at, checkpoint_published_at = parse_rfc3339(details.videoPublishedAt), parse_rfc3339(self.published_at)
+        return published_at is not None and checkpoint_published_at is not None and published_at < checkpoint_published_at
+
+
+class CheckpointStore(ABC):
+    """Persistent storage of the checkpoints by the channel.
+
+    A sync reads the checkpoint of the channel when it starts and writes it when it ends, from the event loop.
+    """
+
+    @abstractmethod
+    def get(self, channel: str) -> Optional[Checkpoint]:
+        """Get the checkpoint of the channel, or None if it wasn't synced yet."""
+
+    @abstractmethod
+    def set(self, channel: str, checkpoint: Checkpoint) -> None:
+        """Store the checkpoint of the channel."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release the resources of the store."""
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Keeps the checkpoints in memory, for the lifetime of the process."""
+
+    def __init__(self) -> None:
+        self.checkpoints: dict[str, Checkpoint] = {}
+
+    def get(self, channel: str) -> Optional[Checkpoint]:  # noqa: D102
+        return self.checkpoints.get(channel)
+
+    def set(self, channel: str, checkpoint: Checkpoint) -> None:  # noqa: D102
+        self.checkpoints[channel] = checkpoint
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Keeps the checkpoints in the `checkpoints` table of an SQLite database, see `SQLiteDatabase`."""
+
+    def __init__(self, path: Union[str, PathLike[str]]):
+        """Initialize the store.
+
+        Args:
+            path: The database file path, or `:memory:`.
+        """
+        self.database = SQLiteDatabase(
+            path,
+            "CREATE TABLE IF NOT EXISTS checkpoints (channel TEXT PRIMARY KEY, playlist_id TEXT NOT NULL,"
+            " video_id TEXT, published_at TEXT, updated_at REAL NOT NULL)",
+        )
+
+    def get(self, channel: str) -> Optional[Checkpoint]:  # noqa: D102
+        row = self.database.fetchone(
+            "SELECT playlist_id, video_id, published_at FROM checkpoints WHERE channel = ?", (channel,)
+        )
+        return Checkpoint(playlist_id=row[0], video_id=row[1], published_at=row[2]) if row else None
+
+    def set(self, channel: str, checkpoint: Checkpoint) -> None:  # noqa: D102
+        self.database.execute(
+            "INSERT OR REPLACE INTO checkpoints (channel, playlist_id, video_id, published_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (channel, checkpoint.playlist_id, checkpoint.video_id, checkpoint.published_at, time.time()),
+        )
+
+    def close(self) -> None:  # noqa: D102
+        self.database.close()
+
+
+class UploadsSync:
+    """Streams the uploads of the channels published since their last sync.
+
+    Every sync stores the newest upload of the channel as its checkpoint. The next sync reads the uploads
+    playlist only until the checkpoint, so a channel without new uploads costs a single `playlistItems.list`
+    request. The checkpoint is stored only when the new uploads are consumed to the end, so an interrupted
+    sync is repeated by the next one.
+    """
+
+    def __init__(self, client: "Client", store: Union[CheckpointStore, str, PathLike[str]]):
+        """Initialize the sync.
+
+        Args:
+            client: The API client.
+            store: The storage of the checkpoints, or the path of the SQLite database to keep them in
+                (see `SQLiteCheckpointStore`).
+        """
+        self.client = client
+        self.store = store if isinstance(store, CheckpointStore) else SQLiteCheckpointStore(store)
+
+    async def sync(
+        self,
+        channel_id: Optional[str] = None,
+        for_handle: Optional[str] = None,
+        for_username: Optional[str] = None,
+        parts: Optional[Union[str, list[str]]] = DEFAULT_VIDEO_PARTS,
+        concurrency: int = 4,
+        missing: Optional[MutableSequence[str]] = None,
+    ) -> AsyncIterator["Video"]:
+        """Stream the videos uploaded by the channel since the last sync, the newest first.
+
+        The first sync of a channel streams all its uploads, see `harvest_uploads`. The checkpoints are stored by
+        the given identifier, so a channel should be always synced by the same one.
+
+        Args:
+            channel_id: The channel ID.
+            for_handle: The channel handle, e.g. `@GoogleDevelopers`.
+            for_username: The legacy username of the channel.
+            parts: The video parts to retrieve.
+            concurrency: The maximum number of `videos.list` requests made at once.
+            missing: If provided, the IDs of the uploads the API didn't return (e.g. private videos) are appended to it.
+
+        Yields:
+            The new videos in the order of the uploads playlist.
+        """
+        identifiers = [value for value in (channel_id, for_handle, for_username) if value]
+        if len(identifiers) != 1:
+            raise PyYouTubeIncorrectParamsError("Specify exactly one of channel_id, for_handle or for_username")
+        channel = identifiers[0]
+
+        checkpoint = self.store.get(channel)
+        if checkpoint is None:
+            playlist_id = await get_uploads_playlist_id(self.client, channel_id, for_handle, for_username)
+            checkpoint = Checkpoint(playlist_id=playlist_id)
+        newest: Optional[Checkpoint] = None
+
+        def until(item: "PlaylistItem") -> bool:
+            nonlocal newest
+            if checkpoint.is_reached(item):
+                return True
+
+            details = item.contentDetails
+            if newest is None and details and details.videoId and details.videoPublishedAt:
+                newest = Checkpoint(checkpoint.playlist_id, video_id=details.videoId, published_at=details.videoPublishedAt)
+            return False
+
+        async for video in harvest_uploads(
+            self.client,
+            playlist_id=checkpoint.playlist_id,
+            parts=parts,
+            concurrency=concurrency,
+            until=until,
+            missing=missing,
+        ):
+            yield video
+
+        self.store.set(channel, newest or checkpoint)
+
+    def close(self) -> None:
+        """Close the checkpoint store."""
+        self.store.close()
@@ -0,0 +1,166 @@
+"""Harvesting of the videos uploaded by a channel."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, MutableSequence
+from typing import TYPE_CHECKING, Optional, Union
+
+from ..error import PyYouTubeIncorrectParamsError
+from ..utils.constants import MAX_IDS_PER_REQUEST
+
+if TYPE_CHECKING:
+    from ..client import Client
+    from ..models import PlaylistItem, Video, VideoListResponse
+
+DEFAULT_VIDEO_PARTS = "contentDetails,snippet,statistics"
+"""The video parts retrieved by default. The other parts are rarely needed or available to the owner only."""
+
+
+async def get_uploads_playlist_id(
+    client: "Client",
+    channel_id: Optional[str] = None,
+    for_handle: Optional[str] = None,
+    for_username: Optional[str] = None,
+) -> str:
+    """Resolve the channel and get the ID of the playlist of its uploads.
+
+    Args:
+        client: The API client.
+        channel_id: The channel ID.
+        for_handle: The channel handle, e.g. `@GoogleDevelopers`.
+        for_username: The legacy username of the channel.
+
+    Returns:
+        The uploads playlist ID.
+
+    Raises:
+        PyYouTubeIncorrectParamsError: If not exactly one channel identifier is given, the channel isn't found or
+            the client doesn't return models.
+    """
+    client.channels._check_response_format("get_uploads_playlist_id")
+    identifiers = {"channel_id": channel_id, "for_handle": for_handle, "for_username": for_username}
+    given = {name: value for name, value in identifiers.items() if value}
+    if len(given) != 1:
+        raise PyYouTubeIncorrectParamsError("Specify exactly one of channel_id, for_handle or for_username")
+
+    response = await client.channels.list(parts="contentDetails", **given)
+    for channel in response.items or []:
+        details = channel.contentDetails
+        if details and details.relatedPlaylists and details.relatedPlaylists.uploads:
+            return details.relatedPlaylists.uploads
+
+    raise PyYouTubeIncorrectParamsError(f"Channel {next(iter(given.values()))} not found")
+
+
+async def _read_video_ids(
+    client: "Client",
+    playlist_id: str,
+    until: Optional[Callable[["PlaylistItem"], bool]],
+) -> AsyncIterator[str]:
+    """Read the video IDs of the playlist until the item `until` returns True for."""
+    # With `until`, the next page is requested only if the current one didn't reach the end, not to waste quota.
+    pages = client.playlists.items.iter_pages(
+        playlist_id=playlist_id, parts="contentDetails", max_results=MAX_IDS_PER_REQUEST, prefetch=until is None
+    )
+    try:
+        async for page in pages:
+            for item in page.items or []:
+                if until is not None and until(item):
+                    return
+                if item.contentDetails and item.contentDetails.videoId:
+                    yield item.contentDetails.videoId
+    finally:
+        await pages.aclose()
+
+
+async def harvest_uploads(
+    client: "Client",
+    channel_id: Optional[str] = None,
+    for_handle: Optional[str] = None,
+    for_username: Optional[str] = None,
+    playlist_id: Optional[str] = None,
+    parts: Optional[Union[str, list[str]]] = DEFAULT_VIDEO_PARTS,
+    concurrency: int = 4,
+    queue_size: int = 4,
+    until: Optional[Callable[["PlaylistItem"], bool]] = None,
+    missing: Optional[MutableSequence[str]] = None,
+) -> AsyncIterator["Video"]:
+    """Stream the videos uploaded by the channel, the newest first.
+
+    The work runs as a pipeline of overlapping stages: the pages of the uploads playlist are read (each page
+    prefetching the next one, unless `until` is given) into a bounded queue of 50-ID batches, which are retrieved
+    with `videos.list` concurrently, while the caller consumes the videos in the order of the playlist. A slow
+    consumer stops the pipeline once the queue and the in-flight requests are full.
+
+    Args:
+        client: The API client.
+        channel_id: The channel ID.
+        for_handle: The channel handle, e.g. `@GoogleDevelopers`.
+        for_username: The legacy username of the channel.
+        playlist_id: The uploads playlist ID, if it's already known. The channel isn't resolved then.
+        parts: The video parts to retrieve.
+        concurrency: The maximum number of `videos.list` requests made at once.
+        queue_size: The maximum number of ID batches read ahead of the `videos.list` requests.
+        until: If given, the playlist is read until an item for which it returns True, e.g. the newest video
+            already seen. That item and the older ones aren't retrieved.
+        missing: If provided, the IDs of the uploads the API didn't return (e.g. private videos) are appended to it.
+
+    Yields:
+        Videos in the order of the uploads playlist.
+
+    Raises:
+        PyYouTubeIncorrectParamsError: If the client doesn't return models (see `Client.response_format`).
+    """
+    client.videos._check_response_format("harvest_uploads")
+    if playlist_id is None:
+        playlist_id = await get_uploads_playlist_id(client, channel_id, for_handle, for_username)
+    batches: asyncio.Queue[Optional[list[str]]] = asyncio.Queue(maxsize=queue_size)
+
+    async def read_playlist() -> None:
+        try:
+            batch: list[str] = []
+            async for video_id in _read_video_ids(client, playlist_id, until):
+                batch.append(video_id)
+                if len(batch) == MAX_IDS_PER_REQUEST:
+                    await batches.put(batch)
+                    batch = []
+            if batch:
+                await batches.put(batch)
+        except Exception:
+            # The consumer raises the error after the batches read so far.
+            await batches.put(None)
+            raise
+        await batches.put(None)
+
+    reader = asyncio.ensure_future(read_playlist())
+    pending: deque[tuple[list[str], asyncio.Future[VideoListResponse]]] = deque()
+    exhausted = False
+
+    try:
+        while True:
+            # Start the requests of the batches read so far, waiting for a batch only when nothing is in flight.
+            while not exhausted and len(pending) < concurrency and (not pending or not batches.empty()):
+                batch = await batches.get()
+                if batch is None:
+                    exhausted = True
+                else:
+                    pending.append((batch, asyncio.ensure_future(client.videos.list(video_id=batch, parts=parts))))
+
+            if not pending:
+                break
+
+            batch, task = pending.popleft()
+            response = await task
+            videos = {video.id: video for video in response.items or []}
+            for video_id in batch:
+                if video_id in videos:
+                    yield videos[video_id]
+                elif missing is not None:
+                    missing.append(video_id)
+
+        await reader  # Raise the error of the playlist reading, if any.
+    finally:
+        reader.cancel()
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(reader, *(task for _, task in pending), return_exceptions=True)
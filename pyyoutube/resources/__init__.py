@@ -1,39 +1,57 @@
-from .captions import CaptionsResource
-from .channel_sections import ChannelSectionsResource
-from .channels import ChannelsResource
-from .comment_threads import CommentThreadsResource
-from .comments import CommentsResource
-from .i18n_languages import I18nLanguagesResource
-from .i18n_regions import I18nRegionsResource
-from .members import MembersResource
-from .membership_levels import MembershipLevelsResource
-from .playlist_items import PlaylistItemsResource
-from .playlists import PlaylistsResource
-from .resource import APIClientProto, Resource
-from .search import SearchResource
-from .subscriptions import SubscriptionsResource
-from .video_abuse_report_reasons import VideoAbuseReportReasonsResource
-from .video_categories import VideoCategoriesResource
-from .videos import VideosResource
-
-resources: list[type[Resource]] = [
-    CaptionsResource,
-    ChannelsResource,
-    ChannelSectionsResource,
-    CommentsResource,
-    CommentThreadsResource,
-    I18nLanguagesResource,
-    I18nRegionsResource,
-    MembersResource,
-    MembershipLevelsResource,
-    PlaylistItemsResource,
-    PlaylistsResource,
-    SearchResource,
-    SubscriptionsResource,
-    VideoAbuseReportReasonsResource,
-    VideoCategoriesResource,
-    VideosResource,
-]
+"""The resources of the API.
+
+The resource modules (and the models they use) are imported on the first access to their resources.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .captions import CaptionsResource
+    from .channel_sections import ChannelSectionsResource
+    from .channels import ChannelsResource
+    from .comment_threads import CommentThreadsResource
+    from .comments import CommentsResource
+    from .i18n_languages import I18nLanguagesResource
+    from .i18n_regions import I18nRegionsResource
+    from .members import MembersResource
+    from .membership_levels import MembershipLevelsResource
+    from .playlist_items import PlaylistItemsResource
+    from .playlists import PlaylistsResource
+    from .resource import APIClientProto, BulkResult, PaginatedResource, Resource
+    from .search import SearchResource
+    from .subscriptions import SubscriptionsResource
+    from .video_abuse_report_reasons import VideoAbuseReportReasonsResource
+    from .video_categories import VideoCategoriesResource
+    from .videos import VideosResource
+
+    resources: list[type[Resource]]
+
+_MODULES: dict[str, str] = {
+    "CaptionsResource": "captions",
+    "ChannelsResource": "channels",
+    "ChannelSectionsResource": "channel_sections",
+    "CommentsResource": "comments",
+    "CommentThreadsResource": "comment_threads",
+    "I18nLanguagesResource": "i18n_languages",
+    "I18nRegionsResource": "i18n_regions",
+    "MembersResource": "members",
+    "MembershipLevelsResource": "membership_levels",
+    "PlaylistItemsResource": "playlist_items",
+    "PlaylistsResource": "playlists",
+    "SearchResource": "search",
+    "SubscriptionsResource": "subscriptions",
+    "VideoAbuseReportReasonsResource": "video_abuse_report_reasons",
+    "VideoCategoriesResource": "video_categories",
+    "VideosResource": "videos",
+}
+"""The module of every resource."""
+
+_BASE_MODULES: dict[str, str] = {
+    "Resource": "resource",
+    "PaginatedResource": "resource",
+    "BulkResult": "resource",
+    "APIClientProto": "resource",
+}
 
 __all__ = [
     "CaptionsResource",
@@ -53,5 +71,27 @@ __all__ = [
     "VideoCategoriesResource",
     "VideosResource",
     "Resource",
+    "PaginatedResource",
+    "BulkResult",
     "APIClientProto",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of the resource on the first access."""
+    value: Any
+    if name == "resources":
+        # All resource classes, which imports all resource modules.
+        value = [__getattr__(resource) for resource in _MODULES]
+    elif name in _MODULES or name in _BASE_MODULES:
+        module = _MODULES.get(name) or _BASE_MODULES[name]
+        value = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES, *_BASE_MODULES, "resources"})
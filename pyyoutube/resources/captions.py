@@ -11,12 +11,15 @@ class CaptionsResource(Resource):
     References: https://developers.google.com/youtube/v3/docs/captions
     """
 
+    _id_parameter = "caption_id"
+
     async def list(
         self,
         parts: Optional[Union[str, list[str]]] = None,
         video_id: Optional[str] = None,
         caption_id: Optional[Union[str, list[str]]] = None,
         on_behalf_of_content_owner: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> CaptionListResponse:
         """Returns a list of caption tracks that are associated with a specified video.
 
@@ -32,12 +35,15 @@ class CaptionsResource(Resource):
             on_behalf_of_content_owner:
                 This parameter can only be used in a properly authorized request.
                 Note: This parameter is intended exclusively for YouTube content partners.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(language,name))`.
 
         Returns:
             Caption data
         """
         params = {
             "part": enf_parts(resource="captions", value=parts),
+            "fields": fields,
             "videoId": video_id,
             "id": enf_comma_separated(field="caption_id", value=caption_id),
             "onBehalfOfContentOwner": on_behalf_of_content_owner,
@@ -12,6 +12,8 @@ class ChannelSectionsResource(Resource):
     References: https://developers.google.com/youtube/v3/docs/channelSections
     """
 
+    _id_parameter = "section_id"
+
     async def list(
         self,
         parts: Optional[Union[str, list[str]]] = None,
@@ -20,6 +22,7 @@ class ChannelSectionsResource(Resource):
         mine: Optional[bool] = None,
         hl: Optional[str] = None,
         on_behalf_of_content_owner: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> ChannelSectionListResponse:
         """Returns a list of channelSection resources that match the API request criteria.
 
@@ -44,12 +47,15 @@ class ChannelSectionsResource(Resource):
                 content owners to authenticate once and get access to all their video and channel
                 data, without having to provide authentication credentials for each individual channel.
                 The CMS account that the user authenticates with must be linked to the specified YouTube content owner.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(type,position))`.
 
         Returns:
             Channel section data.
         """
         params = {
             "part": enf_parts(resource="channelSections", value=parts),
+            "fields": fields,
             "hl": hl,
             "onBehalfOfContentOwner": on_behalf_of_content_owner,
         }
@@ -1,24 +1,29 @@
-from typing import Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Union
 
 from ..error import PyYouTubeIncorrectParamsError
 from ..models import ChannelListResponse
-from ..protocols import APIClientProto
-from ..resources.resource import Resource
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_comma_separated, enf_parts
-from .channel_sections import ChannelSectionsResource
 
+if TYPE_CHECKING:
+    from .channel_sections import ChannelSectionsResource
 
-class ChannelsResource(Resource):
+
+class ChannelsResource(PaginatedResource):
     """A channel resource contains information about a YouTube channel.
 
     References: https://developers.google.com/youtube/v3/docs/channels
     """
 
-    sections: ChannelSectionsResource
+    _id_parameter = "channel_id"
+
+    @cached_property
+    def sections(self) -> "ChannelSectionsResource":
+        """The channel sections."""
+        from .channel_sections import ChannelSectionsResource
 
-    def __init__(self, client: APIClientProto) -> None:
-        super().__init__(client)
-        self.sections = ChannelSectionsResource(client)
+        return ChannelSectionsResource(self._client)
 
     async def list(
         self,
@@ -32,6 +37,7 @@ class ChannelsResource(Resource):
         max_results: Optional[int] = None,
         on_behalf_of_content_owner: Optional[str] = None,
         page_token: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> ChannelListResponse:
         """Returns a collection of zero or more channel resources that match the request criteria.
 
@@ -78,12 +84,16 @@ class ChannelsResource(Resource):
                 The CMS account that the user authenticates with must be linked to the specified YouTube content owner.
             page_token:
                 The parameter identifies a specific page in the result set that should be returned.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,statistics(subscriberCount))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Channel data
         """
         params = {
             "part": enf_parts(resource="channels", value=parts),
+            "fields": fields,
             "hl": hl,
             "maxResults": max_results,
             "onBehalfOfContentOwner": on_behalf_of_content_owner,
@@ -2,16 +2,18 @@ from typing import Optional, Union
 
 from ..error import PyYouTubeIncorrectParamsError
 from ..models import CommentThreadListResponse
-from ..resources.resource import Resource
-from ..utils.params_checker import enf_parts
+from ..resources.resource import PaginatedResource
+from ..utils.params_checker import enf_comma_separated, enf_parts
 
 
-class CommentThreadsResource(Resource):
+class CommentThreadsResource(PaginatedResource):
     """A commentThread resource contains information about a YouTube comment thread, which comprises a top-level comment and replies, if any exist, to that comment.
 
     References: https://developers.google.com/youtube/v3/docs/commentThreads
     """  # noqa: E501
 
+    _id_parameter = "thread_id"
+
     async def list(
         self,
         parts: Optional[Union[str, list[str]]] = None,
@@ -25,6 +27,7 @@ class CommentThreadsResource(Resource):
         page_token: Optional[str] = None,
         search_terms: Optional[str] = None,
         text_format: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> CommentThreadListResponse:
         """Returns a list of comment threads that match the API request parameters.
 
@@ -67,6 +70,9 @@ class CommentThreadsResource(Resource):
                     - html: Returns the comments in HTML format. This is the default value.
                     - plainText: Returns the comments in plain text format.
                 Notes: This parameter is not supported for use in conjunction with the `id` parameter.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(totalReplyCount))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Comment threads data.
@@ -74,6 +80,7 @@ class CommentThreadsResource(Resource):
         """
         params = {
             "part": enf_parts(resource="commentThreads", value=parts),
+            "fields": fields,
             "maxResults": max_results,
             "moderationStatus": moderation_status,
             "order": order,
@@ -86,7 +93,7 @@ class CommentThreadsResource(Resource):
         elif channel_id:
             params["channelId"] = channel_id
         elif thread_id:
-            params["id"] = thread_id
+            params["id"] = enf_comma_separated(field="thread_id", value=thread_id)
         elif video_id:
             params["videoId"] = video_id
         else:
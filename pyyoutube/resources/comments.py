@@ -1,26 +1,31 @@
 """Comment resource implementation."""
 
-from typing import Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Union
 
 from ..error import PyYouTubeIncorrectParamsError
 from ..models import CommentListResponse
-from ..protocols import APIClientProto
-from ..resources.resource import Resource
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_comma_separated, enf_parts
-from .comment_threads import CommentThreadsResource
 
+if TYPE_CHECKING:
+    from .comment_threads import CommentThreadsResource
 
-class CommentsResource(Resource):
+
+class CommentsResource(PaginatedResource):
     """A comment resource contains information about a single YouTube comment.
 
     References: https://developers.google.com/youtube/v3/docs/comments
     """
 
-    threads: CommentThreadsResource
+    _id_parameter = "comment_id"
+
+    @cached_property
+    def threads(self) -> "CommentThreadsResource":
+        """The comment threads."""
+        from .comment_threads import CommentThreadsResource
 
-    def __init__(self, client: APIClientProto) -> None:
-        super().__init__(client)
-        self.threads = CommentThreadsResource(client)
+        return CommentThreadsResource(self._client)
 
     async def list(
         self,
@@ -30,6 +35,7 @@ class CommentsResource(Resource):
         max_results: Optional[int] = None,
         text_format: Optional[str] = None,
         page_token: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> CommentListResponse:
         """Returns a list of comments that match the API request parameters.
 
@@ -53,12 +59,16 @@ class CommentsResource(Resource):
                     - plainText: Returns the comments in plain text format.
             page_token:
                 The parameter identifies a specific page in the result set that should be returned.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(textDisplay))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Comments data
         """
         params = {
             "part": enf_parts(resource="comments", value=parts),
+            "fields": fields,
             "maxResults": max_results,
             "textFormat": text_format,
             "pageToken": page_token,
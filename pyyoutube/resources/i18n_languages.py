@@ -19,6 +19,7 @@ class I18nLanguagesResource(Resource):
         self,
         parts: Optional[Union[str, list[str]]] = None,
         hl: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> I18nLanguageListResponse:
         """Returns a list of application languages that the YouTube website supports.
 
@@ -29,12 +30,15 @@ class I18nLanguagesResource(Resource):
             hl:
                 Specifies the language that should be used for text values in the API response.
                 The default value is en_US.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(name))`.
 
         Returns:
             i18n language data
         """
         params = {
             "part": enf_parts(resource="i18nLanguages", value=parts),
+            "fields": fields,
             "hl": hl,
         }
 
@@ -17,6 +17,7 @@ class I18nRegionsResource(Resource):
         self,
         parts: Optional[Union[str, list[str]]] = None,
         hl: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> I18nRegionListResponse:
         """Returns a list of content regions that the YouTube website supports.
 
@@ -27,12 +28,15 @@ class I18nRegionsResource(Resource):
             hl:
                 Specifies the language that should be used for text values in the API response.
                 The default value is en_US.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(gl,name))`.
 
         Returns:
             i18n regions data.
         """
         params = {
             "part": enf_parts(resource="i18nRegions", value=parts),
+            "fields": fields,
             "hl": hl,
         }
 
@@ -1,23 +1,26 @@
-from typing import Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Union
 
 from ..models import MemberListResponse
-from ..protocols import APIClientProto
-from ..resources.resource import Resource
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_comma_separated, enf_parts
-from .membership_levels import MembershipLevelsResource
 
+if TYPE_CHECKING:
+    from .membership_levels import MembershipLevelsResource
 
-class MembersResource(Resource):
+
+class MembersResource(PaginatedResource):
     """A member resource represents a channel member for a YouTube channel.
 
     References: https://developers.google.com/youtube/v3/docs/members
     """
 
-    levels: MembershipLevelsResource
+    @cached_property
+    def levels(self) -> "MembershipLevelsResource":
+        """The membership levels of the channel."""
+        from .membership_levels import MembershipLevelsResource
 
-    def __init__(self, client: APIClientProto) -> None:
-        super().__init__(client)
-        self.levels = MembershipLevelsResource(client)
+        return MembershipLevelsResource(self._client)
 
     async def list(
         self,
@@ -27,6 +30,7 @@ class MembersResource(Resource):
         page_token: Optional[str] = None,
         has_access_to_level: Optional[str] = None,
         filter_by_member_channel_id: Optional[Union[str, list[str]]] = None,
+        fields: Optional[str] = None,
     ) -> MemberListResponse:
         """Lists members (formerly known as "sponsors") for a channel.
 
@@ -51,12 +55,16 @@ class MembersResource(Resource):
                 specifies a comma-separated list of channel IDs that can be used to check the membership
                 status of specific users.
                 Maximum of 100 channels can be specified per call.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(snippet(memberDetails))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Members data.
         """
         params = {
             "part": enf_parts(resource="members", value=parts),
+            "fields": fields,
             "mode": mode,
             "maxResults": max_results,
             "pageToken": page_token,
@@ -14,6 +14,7 @@ class MembershipLevelsResource(Resource):
     async def list(
         self,
         parts: Optional[Union[str, list[str]]] = None,
+        fields: Optional[str] = None,
     ) -> MembershipsLevelListResponse:
         """Lists membership levels for the channel that authorized the request.
 
@@ -21,6 +22,8 @@ class MembershipLevelsResource(Resource):
             parts:
                 Comma-separated list of one or more channel resource properties.
                 Accepted values: id,snippet
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(levelDetails))`.
 
         Returns:
             Membership levels data.
@@ -28,6 +31,7 @@ class MembershipLevelsResource(Resource):
         """
         params = {
             "part": enf_parts(resource="membershipsLevels", value=parts),
+            "fields": fields,
         }
 
         return await self._client.list(MembershipsLevelListResponse, "membershipsLevels", params)
@@ -4,11 +4,11 @@ from typing import Optional, Union
 
 from ..error import PyYouTubeIncorrectParamsError
 from ..models import PlaylistItemListResponse
-from ..resources.resource import Resource
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_comma_separated, enf_parts
 
 
-class PlaylistItemsResource(Resource):
+class PlaylistItemsResource(PaginatedResource):
     """A playlistItem resource identifies another resource, such as a video, that is included in a playlist.
 
     In addition, the playlistItem resource contains details about the included resource
@@ -17,6 +17,8 @@ class PlaylistItemsResource(Resource):
     References: https://developers.google.com/youtube/v3/docs/playlistItems
     """
 
+    _id_parameter = "playlist_item_id"
+
     async def list(
         self,
         parts: Optional[Union[str, list[str]]] = None,
@@ -26,6 +28,7 @@ class PlaylistItemsResource(Resource):
         on_behalf_of_content_owner: Optional[str] = None,
         page_token: Optional[str] = None,
         video_id: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> PlaylistItemListResponse:
         """Returns a collection of playlist items that match the API request parameters.
 
@@ -53,12 +56,16 @@ class PlaylistItemsResource(Resource):
                 The parameter identifies a specific page in the result set that should be returned.
             video_id:
                 Specifies that the request should return only the playlist items that contain the specified video.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(contentDetails(videoId))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Playlist items data.
         """
         params = {
             "part": enf_parts(resource="playlistItems", value=parts),
+            "fields": fields,
             "maxResults": max_results,
             "onBehalfOfContentOwner": on_behalf_of_content_owner,
             "videoId": video_id,
@@ -1,24 +1,29 @@
-from typing import Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Union
 
 from ..error import PyYouTubeIncorrectParamsError
 from ..models import PlaylistListResponse
-from ..protocols import APIClientProto
-from ..resources.resource import Resource
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_comma_separated, enf_parts
-from .playlist_items import PlaylistItemsResource
 
+if TYPE_CHECKING:
+    from .playlist_items import PlaylistItemsResource
 
-class PlaylistsResource(Resource):
+
+class PlaylistsResource(PaginatedResource):
     """A playlist resource represents a YouTube playlist.
 
     References: https://developers.google.com/youtube/v3/docs/playlists
     """
 
-    items: PlaylistItemsResource
+    _id_parameter = "playlist_id"
+
+    @cached_property
+    def items(self) -> "PlaylistItemsResource":
+        """The playlist items."""
+        from .playlist_items import PlaylistItemsResource
 
-    def __init__(self, client: APIClientProto) -> None:
-        super().__init__(client)
-        self.items = PlaylistItemsResource(client)
+        return PlaylistItemsResource(self._client)
 
     async def list(
         self,
@@ -31,6 +36,7 @@ class PlaylistsResource(Resource):
         on_behalf_of_content_owner: Optional[str] = None,
         on_behalf_of_content_owner_channel: Optional[str] = None,
         page_token: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> PlaylistListResponse:
         """Returns a collection of playlists that match the API request parameters.
 
@@ -73,12 +79,16 @@ class PlaylistsResource(Resource):
                 owner that the onBehalfOfContentOwner parameter specifies.
             page_token:
                 The parameter identifies a specific page in the result set that should be returned.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,contentDetails(itemCount))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Playlist data.
         """
         params = {
             "part": enf_parts(resource="playlists", value=parts),
+            "fields": fields,
             "hl": hl,
             "maxResults": max_results,
             "onBehalfOfContentOwner": on_behalf_of_content_owner,
@@ -1,6 +1,29 @@
+import asyncio
 from abc import ABC
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, ClassVar, Generic, Optional, TypeVar, Union
 
+from ..error import PyYouTubeIncorrectParamsError
 from ..protocols import APIClientProto
+from ..utils.constants import MAX_IDS_PER_REQUEST
+from ..utils.loader import BatchLoader
+from ..utils.params_checker import enf_id_chunks
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """Result of the retrieval of resources by IDs."""
+
+    items: list[T] = field(default_factory=list)
+    """Retrieved resources in the order of the requested IDs."""
+    missing: list[str] = field(default_factory=list)
+    """Requested IDs that the API didn't return, e.g. deleted or private resources."""
 
 
 class Resource(ABC):
@@ -12,5 +35,212 @@ class Resource(ABC):
     _client: APIClientProto
     """The API client that is used to access the resource."""
 
+    _id_parameter: ClassVar[Optional[str]] = None
+    """The `list` method parameter that accepts comma-separated IDs. Required for the bulk retrieval."""
+
+    _max_concurrent_chunks: ClassVar[int] = 10
+    """The default maximum number of chunks requested concurrently by the bulk retrieval."""
+
+    _batch_delay: ClassVar[float] = 0.002
+    """The time in seconds `get` waits for other lookups to join its request."""
+
     def __init__(self, client: APIClientProto) -> None:
         self._client = client
+        self._loaders: dict[tuple, BatchLoader] = {}
+
+    def _check_response_format(self, helper: str) -> None:
+        """Check that the client returns models, which the helpers read, and not dictionaries or bytes."""
+        response_format = getattr(self._client, "response_format", "model")
+        if response_format not in {"model", "lazy"}:
+            raise PyYouTubeIncorrectParamsError(
+                f"{helper} requires the model or lazy response format, the client returns {response_format}"
+            )
+
+    async def get(self, item_id: str, **kwargs) -> Optional[Any]:
+        """Retrieve a single resource by its ID.
+
+        Lookups with the same `list` arguments issued concurrently (within a few milliseconds) are coalesced
+        into a single request with comma-separated IDs.
+
+        Args:
+            item_id: The resource ID.
+            **kwargs: Keyword arguments for the `list` method, e.g. `parts`.
+
+        Returns:
+            The resource or None if the API didn't return it.
+        """
+        if self._id_parameter is None:
+            raise PyYouTubeIncorrectParamsError(f"{self.__class__.__name__} doesn't support retrieval by IDs")
+        self._check_response_format("get")
+
+        key = tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+        loader = self._loaders.get(key)
+        if loader is None:
+
+            async def batch(ids: list[str]) -> dict[str, Any]:
+                # The batch is sent, the next lookups start a new loader, so the loaders don't pile up by arguments.
+                if self._loaders.get(key) is loader:
+                    del self._loaders[key]
+                response = await self.list(**{self._id_parameter: ids}, **kwargs)  # type: ignore
+                return {item.id: item for item in response.items or []}
+
+            loader = self._loaders[key] = BatchLoader(
+                batch, max_batch_size=MAX_IDS_PER_REQUEST, max_delay=self._batch_delay
+            )
+
+        return await loader.load(item_id)
+
+    async def iter_many(
+        self,
+        ids: Union[str, Iterable[str]],
+        concurrency: Optional[int] = None,
+        missing: Optional[list[str]] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Retrieve resources for an arbitrary number of IDs and stream them in the order of the IDs.
+
+        The IDs are de-duplicated and split into chunks of 50, the `id` limit of the API. Chunks are requested
+        concurrently, but no more than `concurrency` at once.
+
+        Args:
+            ids: Comma-separated str or an iterable of the resource IDs.
+            concurrency: The maximum number of chunks requested at once.
+            missing: If provided, the IDs that the API didn't return are appended to it.
+            **kwargs: Keyword arguments for the `list` method, e.g. `parts`.
+
+        Yields:
+            Resource items in the order of the given IDs.
+        """
+        if self._id_parameter is None:
+            raise PyYouTubeIncorrectParamsError(f"{self.__class__.__name__} doesn't support retrieval by IDs")
+        self._check_response_format("iter_many")
+
+        chunks = iter(enf_id_chunks(field="ids", value=ids, chunk_size=MAX_IDS_PER_REQUEST))
+        pending: deque[tuple[list[str], asyncio.Future]] = deque()
+
+        def request(chunk: list[str]) -> None:
+            task = asyncio.ensure_future(self.list(**{self._id_parameter: chunk}, **kwargs))  # type: ignore
+            pending.append((chunk, task))
+
+        try:
+            for chunk in islice(chunks, concurrency or self._max_concurrent_chunks):
+                request(chunk)
+
+            while pending:
+                chunk, task = pending.popleft()
+                response = await task
+
+                # Keep the window of in-flight chunks full.
+                next_chunk: Optional[list[str]] = next(chunks, None)
+                if next_chunk is not None:
+                    request(next_chunk)
+
+                items = {item.id: item for item in response.items or []}
+                for item_id in chunk:
+                    if item_id in items:
+                        yield items[item_id]
+                    elif missing is not None:
+                        missing.append(item_id)
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    async def get_many(
+        self,
+        ids: Union[str, Iterable[str]],
+        concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> BulkResult:
+        """Retrieve resources for an arbitrary number of IDs.
+
+        Args:
+            ids: Comma-separated str or an iterable of the resource IDs.
+            concurrency: The maximum number of chunks requested at once.
+            **kwargs: Keyword arguments for the `list` method, e.g. `parts`.
+
+        Returns:
+            Retrieved resources and the IDs that the API didn't return.
+        """
+        result = BulkResult()
+        async for item in self.iter_many(ids, concurrency=concurrency, missing=result.missing, **kwargs):
+            result.items.append(item)
+        return result
+
+
+class PaginatedResource(Resource):
+    """Base class for resources whose `list` method returns paginated responses.
+
+    Provides the `iter_pages` and `iter_items` helpers which follow `nextPageToken` automatically.
+    Like the other helpers, they read the models, so they require the `model` or `lazy` response format.
+    """
+
+    async def iter_pages(
+        self,
+        *args,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the pages of the `list` method results following `nextPageToken`.
+
+        While the caller processes the page N, the page N+1 is already being requested.
+
+        Args:
+            *args: Positional arguments for the `list` method.
+            max_pages: The maximum number of pages to retrieve. All pages are retrieved by default.
+            prefetch: Whether to request the next page before the current one is yielded.
+            **kwargs: Keyword arguments for the `list` method. `page_token` sets the page to start from.
+
+        Yields:
+            List responses, one per page.
+        """
+        self._check_response_format("iter_pages")
+        page_token: Optional[str] = kwargs.pop("page_token", None)
+        pending: Optional[asyncio.Future] = asyncio.ensure_future(self.list(*args, page_token=page_token, **kwargs))
+        pages: int = 0
+
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                pages += 1
+
+                next_page_token: Optional[str] = getattr(page, "nextPageToken", None)
+                has_next: bool = bool(next_page_token) and (max_pages is None or pages < max_pages)
+
+                if has_next and prefetch:
+                    pending = asyncio.ensure_future(self.list(*args, page_token=next_page_token, **kwargs))
+
+                yield page
+
+                if has_next and not prefetch:
+                    pending = asyncio.ensure_future(self.list(*args, page_token=next_page_token, **kwargs))
+        finally:
+            # The caller stopped iterating before the prefetched page was consumed.
+            if pending is not None:
+                pending.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await pending
+
+    async def iter_items(
+        self,
+        *args,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of all pages of the `list` method results.
+
+        Args:
+            *args: Positional arguments for the `list` method.
+            max_pages: The maximum number of pages to retrieve. All pages are retrieved by default.
+            prefetch: Whether to request the next page before the items of the current one are yielded.
+            **kwargs: Keyword arguments for the `list` method.
+
+        Yields:
+            Resource items, in the order they are returned by the API.
+        """
+        async for page in self.iter_pages(*args, max_pages=max_pages, prefetch=prefetch, **kwargs):
+            for item in page.items:
+                yield item
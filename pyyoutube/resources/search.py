@@ -1,11 +1,33 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, MutableSequence
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from typing import Optional, Union
 
-from ..models import SearchListResponse
-from ..resources.resource import Resource
+from ..models import SearchListResponse, SearchResult
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_parts
+from ..utils.quota import get_quota_cost
+from ..utils.rfc3339 import format_rfc3339, to_utc
 
 
-class SearchResource(Resource):
+@dataclass(frozen=True)
+class SearchWindow:
+    """A publish time window of the search crawl."""
+
+    published_after: datetime
+    published_before: datetime
+    page_token: Optional[str] = None
+    """The page to continue from, None for the first page."""
+
+    def split(self) -> tuple["SearchWindow", "SearchWindow"]:
+        """Bisect the window into two halves."""
+        middle = self.published_after + (self.published_before - self.published_after) / 2
+        return SearchWindow(self.published_after, middle), SearchWindow(middle, self.published_before)
+
+
+class SearchResource(PaginatedResource):
     """A search result contains information about a YouTube video, channel, or playlist that matches the search parameters specified in an API request.
 
     References: https://developers.google.com/youtube/v3/docs/search
@@ -45,6 +67,7 @@ class SearchResource(Resource):
         video_paid_product_placement: Optional[str] = None,
         video_syndicated: Optional[str] = None,
         video_type: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> SearchListResponse:
         """Returns a collection of search results that match the query parameters specified in the API request.
 
@@ -195,6 +218,9 @@ class SearchResource(Resource):
                     - any: Return all videos.
                     - episode: Only retrieve episodes of shows.
                     - movie: Only retrieve movies.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id(videoId),snippet(title))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Search result data
@@ -202,6 +228,7 @@ class SearchResource(Resource):
         """
         params = {
             "part": enf_parts(resource="search", value=parts),
+            "fields": fields,
             "channelId": channel_id,
             "channelType": channel_type,
             "eventType": event_type,
@@ -241,3 +268,98 @@ class SearchResource(Resource):
             params["relatedToVideoId"] = related_to_video_id
 
         return await self._client.list(SearchListResponse, "search", params)
+
+    async def crawl(
+        self,
+        published_after: datetime,
+        published_before: datetime,
+        concurrency: int = 4,
+        quota_budget: Optional[int] = None,
+        reachable_results: int = 500,
+        min_window: timedelta = timedelta(minutes=1),
+        skipped: Optional[MutableSequence[SearchWindow]] = None,
+        **kwargs,
+    ) -> AsyncIterator[SearchResult]:
+        """Find all videos matching the search published in the time range, past the limit of the pagination.
+
+        The search pagination stops after about 500 results. When the `totalResults` of a window exceeds
+        `reachable_results`, the window is bisected by its publish time and the halves are searched instead,
+        recursively. The windows are searched concurrently and the videos found in several windows are
+        yielded once.
+
+        Notes:
+            Every request costs 100 quota units. A `SearchCache` with `granularity` widens the windows to it, so
+            the windows shorter than the granularity can't be bisected. Crawl with a cache without `granularity`.
+
+        Args:
+            published_after: The start of the publish time range. Naive times are considered UTC.
+            published_before: The end of the publish time range. Naive times are considered UTC.
+            concurrency: The maximum number of requests made at once.
+            quota_budget: The maximum quota units to spend. Unlimited by default.
+            reachable_results: The number of results the pagination can reach in a window.
+            min_window: The windows shorter than this aren't split, only their reachable results are retrieved.
+            skipped: If provided, the windows (and the pages) that weren't searched because of the quota budget
+                are appended to it, so the crawl can be continued later.
+            **kwargs: Keyword arguments for the `list` method, e.g. `q` or `region_code`.
+                The `type` is always `video`.
+
+        Yields:
+            Search results with unique `id.videoId`, in the order they are found.
+        """
+        self._check_response_format("crawl")
+        cost = get_quota_cost("search")
+        spent = 0
+        kwargs.setdefault("max_results", 50)
+        kwargs["type"] = "video"
+
+        # The windows are bisected by subtracting their bounds, which requires both to be aware.
+        windows: deque[SearchWindow] = deque([SearchWindow(to_utc(published_after), to_utc(published_before))])
+        running: dict[asyncio.Future, SearchWindow] = {}
+        seen: set[str] = set()
+
+        def request(window: SearchWindow) -> asyncio.Future:
+            return asyncio.ensure_future(
+                self.list(
+                    published_after=format_rfc3339(window.published_after),
+                    published_before=format_rfc3339(window.published_before),
+                    page_token=window.page_token,
+                    **kwargs,
+                )
+            )
+
+        try:
+            while windows or running:
+                while windows and len(running) < concurrency:
+                    window = windows.popleft()
+                    if quota_budget is not None and spent + cost > quota_budget:
+                        if skipped is not None:
+                            skipped.append(window)
+                        continue
+                    spent += cost
+                    running[request(window)] = window
+
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    window = running.pop(task)
+                    response: SearchListResponse = task.result()
+
+                    total = response.pageInfo.totalResults if response.pageInfo else None
+                    too_many = window.page_token is None and (total or 0) > reachable_results
+                    if too_many and window.published_before - window.published_after > min_window:
+                        windows.extend(window.split())
+                    elif response.nextPageToken:
+                        # Finish the started windows first, so the pages of fewer windows are pending.
+                        windows.appendleft(replace(window, page_token=response.nextPageToken))
+
+                    for item in response.items or []:
+                        video_id = item.id.videoId if item.id else None
+                        if video_id and video_id not in seen:
+                            seen.add(video_id)
+                            yield item
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
@@ -2,11 +2,11 @@ from typing import Optional, Union
 
 from ..error import PyYouTubeIncorrectParamsError
 from ..models import SubscriptionListResponse
-from ..resources.resource import Resource
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_comma_separated, enf_parts
 
 
-class SubscriptionsResource(Resource):
+class SubscriptionsResource(PaginatedResource):
     """A subscription resource contains information about a YouTube user subscription.
 
     References: https://developers.google.com/youtube/v3/docs/subscriptions
@@ -26,6 +26,7 @@ class SubscriptionsResource(Resource):
         on_behalf_of_content_owner_channel: Optional[str] = None,
         order: Optional[str] = None,
         page_token: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> SubscriptionListResponse:
         """Returns subscription resources that match the API request criteria.
 
@@ -77,12 +78,16 @@ class SubscriptionsResource(Resource):
                     - unread: Sort by order of activity.
             page_token:
                 The parameter identifies a specific page in the result set that should be returned.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(snippet(resourceId))`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Subscriptions data.
         """
         params = {
             "part": enf_parts(resource="subscriptions", value=parts),
+            "fields": fields,
             "forChannelId": enf_comma_separated(field="for_channel_id", value=for_channel_id),
             "maxResults": max_results,
             "onBehalfOfContentOwner": on_behalf_of_content_owner,
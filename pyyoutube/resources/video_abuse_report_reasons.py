@@ -15,6 +15,7 @@ class VideoAbuseReportReasonsResource(Resource):
         self,
         parts: Optional[Union[str, list[str]]] = None,
         hl: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> VideoAbuseReportReasonListResponse:
         """Retrieve a list of reasons that can be used to report abusive videos.
 
@@ -25,12 +26,15 @@ class VideoAbuseReportReasonsResource(Resource):
             hl:
                 Specifies the language that should be used for text values in the API response.
                 The default value is en_US.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(label))`.
 
         Returns:
             reasons data.
         """
         params = {
             "part": enf_parts(resource="videoAbuseReportReasons", value=parts),
+            "fields": fields,
             "hl": hl,
         }
 
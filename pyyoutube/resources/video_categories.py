@@ -14,12 +14,15 @@ class VideoCategoriesResource(Resource):
     References: https://developers.google.com/youtube/v3/docs/videoCategories
     """
 
+    _id_parameter = "category_id"
+
     async def list(
         self,
         parts: Optional[Union[str, list[str]]] = None,
         category_id: Optional[Union[str, list[str]]] = None,
         region_code: Optional[str] = None,
         hl: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> VideoCategoryListResponse:
         """Returns a list of categories that can be associated with YouTube videos.
 
@@ -35,12 +38,15 @@ class VideoCategoriesResource(Resource):
             hl:
                 Specifies the language that should be used for text values in the API response.
                 The default value is en_US.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,snippet(title))`.
 
         Returns:
             Video category data.
         """
         params = {
             "part": enf_parts(resource="videoCategories", value=parts),
+            "fields": fields,
             "hl": hl,
         }
 
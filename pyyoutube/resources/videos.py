@@ -1,31 +1,64 @@
 """Videos resource implementation."""
 
-from typing import Optional, Union
+from collections.abc import Iterable
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Union
 
 from ..error import PyYouTubeIncorrectParamsError
 from ..models import (
     VideoListResponse,
 )
-from ..protocols import APIClientProto
-from ..resources.resource import Resource
+from ..resources.resource import PaginatedResource
 from ..utils.params_checker import enf_comma_separated, enf_parts
-from .video_abuse_report_reasons import VideoAbuseReportReasonsResource
-from .video_categories import VideoCategoriesResource
 
+if TYPE_CHECKING:
+    from .video_abuse_report_reasons import VideoAbuseReportReasonsResource
+    from .video_categories import VideoCategoriesResource
 
-class VideosResource(Resource):
+
+class VideosResource(PaginatedResource):
     """A video resource represents a YouTube video.
 
     References: https://developers.google.com/youtube/v3/docs/videos
     """
 
-    categories: VideoCategoriesResource
-    abuse_report_reasons: VideoAbuseReportReasonsResource
+    _id_parameter = "video_id"
+
+    @cached_property
+    def categories(self) -> "VideoCategoriesResource":
+        """The video categories."""
+        from .video_categories import VideoCategoriesResource
+
+        return VideoCategoriesResource(self._client)
+
+    @cached_property
+    def abuse_report_reasons(self) -> "VideoAbuseReportReasonsResource":
+        """The reasons that can be used to report abusive videos."""
+        from .video_abuse_report_reasons import VideoAbuseReportReasonsResource
+
+        return VideoAbuseReportReasonsResource(self._client)
+
+    async def list_many(
+        self,
+        video_ids: Union[str, Iterable[str]],
+        concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> VideoListResponse:
+        """Retrieves videos for an arbitrary number of IDs and merges them into a single response.
+
+        Args:
+            video_ids:
+                Comma-separated str or an iterable of the YouTube video IDs.
+            concurrency:
+                The maximum number of 50-ID chunks requested at once.
+            **kwargs:
+                Keyword arguments for the `list` method, e.g. `parts`.
 
-    def __init__(self, client: APIClientProto) -> None:
-        super().__init__(client)
-        self.categories = VideoCategoriesResource(client)
-        self.abuse_report_reasons = VideoAbuseReportReasonsResource(client)
+        Returns:
+            Videos data. The items keep the order of the given IDs, unknown IDs are skipped.
+        """
+        items = [video async for video in self.iter_many(video_ids, concurrency=concurrency, **kwargs)]
+        return VideoListResponse(kind="youtube#videoListResponse", etag="", items=items)
 
     async def list(
         self,
@@ -41,6 +74,7 @@ class VideosResource(Resource):
         page_token: Optional[str] = None,
         region_code: Optional[str] = None,
         video_category_id: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> VideoListResponse:
         """Returns a list of videos that match the API request parameters.
 
@@ -85,12 +119,16 @@ class VideosResource(Resource):
                 Instructs the API to select a video chart available in the specified region.
             video_category_id:
                 Identifies the video category for which the chart should be retrieved.
+            fields:
+                Selector of the response fields to return (partial response), e.g. `items(id,statistics)`.
+                Include `nextPageToken` to keep the pagination working.
 
         Returns:
             Videos data.
         """
         params = {
             "part": enf_parts(resource="videos", value=parts),
+            "fields": fields,
             "hl": hl,
             "maxHeight": max_height,
             "maxResults": max_results,
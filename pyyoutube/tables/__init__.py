@@ -0,0 +1,4 @@
+# Columnar tables require the optional NumPy dependency: `pip install python-youtube[numpy]`.
+from .video import MISSING_VALUE, VideoTable
+
+__all__ = ["MISSING_VALUE", "VideoTable"]
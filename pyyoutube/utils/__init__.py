@@ -1,5 +1,5 @@
 from .duration import get_video_duration
-from .params_checker import enf_comma_separated, enf_parts
+from .params_checker import enf_comma_separated, enf_id_chunks, enf_parts
 from .serializable import Serializable
 
-__all__ = ["get_video_duration", "enf_comma_separated", "enf_parts", "Serializable"]
+__all__ = ["get_video_duration", "enf_comma_separated", "enf_id_chunks", "enf_parts", "Serializable"]
@@ -0,0 +1,161 @@
+# ruff: noqa: E721, PLR2004
+"""Typed JSON decoding of the `Serializable` models.
+
+With msgspec installed, the response bytes are decoded straight into typed structs mirroring the models, which
+are then copied into the model instances. It skips building the intermediate dictionaries and converting their
+values, so the responses are decoded up to twice as fast as by `orjson.loads` and `deserialize`.
+Without msgspec, or when the data doesn't match the field types, the models are deserialized by `deserialize`.
+"""
+
+from dataclasses import is_dataclass
+from importlib.util import find_spec
+from typing import Any, Callable, Literal, Optional, Union, get_args, get_origin
+
+from orjson import loads
+
+from ..error import PyYouTubeIncorrectParamsError
+
+CodecBackend = Literal["msgspec", "orjson"]
+
+PRIMITIVE_TYPES = (str, int, float, bool)
+"""Field types decoded by msgspec as they are. Other scalar types are decoded as any values and converted."""
+
+# msgspec itself is imported only when the first decoder is compiled, so it doesn't slow down the package import.
+_backend: CodecBackend = "orjson" if find_spec("msgspec") is None else "msgspec"
+
+# The compiled decoders by model. They're compiled on the first use, so importing the models stays cheap.
+_decoders: dict[type, Callable[[bytes], Any]] = {}
+_structs: dict[type, type] = {}
+
+
+def get_backend() -> CodecBackend:
+    """Get the name of the backend decoding the JSON responses into the models."""
+    return _backend
+
+
+def set_backend(backend: CodecBackend) -> None:
+    """Select the backend decoding the JSON responses into the models.
+
+    Args:
+        backend: `msgspec` for the typed decoding (requires the `msgspec` extra) or `orjson` for `orjson.loads`
+            followed by `deserialize`.
+    """
+    global _backend  # noqa: PLW0603
+
+    if backend not in {"msgspec", "orjson"}:
+        raise PyYouTubeIncorrectParamsError(f"Unknown codec backend: {backend}")
+    if backend == "msgspec" and find_spec("msgspec") is None:
+        raise PyYouTubeIncorrectParamsError("The msgspec backend requires msgspec, install `python-youtube[msgspec]`")
+    _backend = backend
+
+
+def _unwrap_optional(ftype: Any) -> Any:
+    """Get the type wrapped into `Optional`, or the type itself."""
+    args = get_args(ftype)
+    if get_origin(ftype) == Union and len(args) == 2 and args[1] is type(None):
+        return args[0]
+    return ftype
+
+
+def _compile_struct(cls: type, msgspec: Any) -> type:
+    """Build the msgspec struct mirroring the model, and the function copying the structs into the model instances.
+
+    All struct fields are optional: the missing and null values are replaced with the model defaults while copying.
+    """
+    if cls in _structs:
+        return _structs[cls]
+
+    struct_fields: list[tuple[str, Any, None]] = []
+    prologue: list[str] = ["def _from_structs_fn(cls, sources):", "    new = cls.__new__"]
+    body: list[str] = [
+        "    result = []",
+        "    append = result.append",
+        "    for source in sources:",
+        "        instance = new(cls)",
+    ]
+
+    for name, field in cls._schema.items():
+        ftype = _unwrap_optional(field.type)
+        origin = get_origin(ftype)
+        args = get_args(ftype)
+        convert = cls._map[name]
+        default = cls._defaults[name]
+
+        # The value copied from the struct, where `value` is the struct field value.
+        copy: str
+        if is_dataclass(convert):
+            struct = _compile_struct(convert, msgspec)
+            prologue.append(f"    convert_{name} = cls._map['{name}']")
+            prologue.append(f"    nested_{name} = convert_{name}._from_structs_fn")
+            if origin in {list, set, tuple}:
+                struct_type = list[struct]
+                copy = f"nested_{name}(convert_{name}, value)"
+                if origin is not list:
+                    copy = f"{origin.__name__}({copy})"
+            elif origin == dict:
+                struct_type = dict[args[0], struct]
+                copy = f"dict(zip(value, nested_{name}(convert_{name}, value.values())))"
+            else:
+                struct_type = struct
+                copy = f"nested_{name}(convert_{name}, (value,))[0]"
+        elif convert in PRIMITIVE_TYPES or convert in {list, set, tuple, dict}:
+            struct_type = convert
+            copy = "value"
+        else:
+            prologue.append(f"    convert_{name} = cls._map['{name}']")
+            struct_type = Any
+            copy = f"convert_{name}(value)"
+
+        struct_fields.append((name, Optional[struct_type], None))
+        body.append(f"        value = source.{name}")
+        if copy == "value" and default == "None":
+            body.append(f"        instance.{name} = value")
+        else:
+            body.append(f"        instance.{name} = {copy} if value is not None else {default}")
+
+    if hasattr(cls, "__post_init__"):
+        body.append("        instance.__post_init__()")
+    body.append("        append(instance)")
+    body.append("    return result")
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(prologue + body), namespace)  # noqa: S102
+    type.__setattr__(cls, "_from_structs_fn", namespace["_from_structs_fn"])
+
+    _structs[cls] = msgspec.defstruct(f"{cls.__name__}Struct", struct_fields, kw_only=True)
+    return _structs[cls]
+
+
+def _compile_decoder(cls: type) -> Callable[[bytes], Any]:
+    """Compile the decoder of the JSON object into the model instance."""
+    import msgspec
+
+    decode = msgspec.json.Decoder(_compile_struct(cls, msgspec), strict=False).decode
+    from_structs = cls._from_structs_fn
+
+    def decoder(data: bytes) -> Any:
+        try:
+            source = decode(data)
+        except msgspec.DecodeError:
+            # The values of unexpected types are converted by `deserialize`, and invalid JSON is reported by orjson.
+            return cls.deserialize(loads(data))
+        return from_structs(cls, (source,))[0]
+
+    _decoders[cls] = decoder
+    return decoder
+
+
+def decode(cls: type, data: Union[bytes, str]) -> Any:
+    """Decode the JSON object into the `Serializable` model instance.
+
+    Args:
+        cls: The model class.
+        data: The JSON object, e.g. the API response body.
+
+    Returns:
+        An instance of the model, equal to `cls.deserialize(orjson.loads(data))`.
+    """
+    if _backend == "msgspec":
+        return (_decoders.get(cls) or _compile_decoder(cls))(data)
+
+    return cls.deserialize(loads(data))
@@ -85,6 +85,9 @@ RESOURCE_PARTS_MAPPING = {
     "guideCategories": GUIDE_CATEGORY_RESOURCE_PROPERTIES,
 }
 
+# The maximum number of comma-separated values the API accepts in the `id` parameter.
+MAX_IDS_PER_REQUEST = 50
+
 TOPICS = {
     # Music topics
     "/m/04rlf": "Music (parent topic)",
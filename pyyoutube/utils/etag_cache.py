@@ -0,0 +1,178 @@
+"""Conditional requests (ETag) for the resources that rarely change."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from os import PathLike
+from typing import Any, Optional, Union
+
+from .quota import get_endpoint
+from .sqlite import SQLiteDatabase
+
+ETAG_RESOURCES = frozenset(
+    {
+        "i18nLanguages",
+        "i18nRegions",
+        "videoCategories",
+        "videoAbuseReportReasons",
+        "channelSections",
+        "membershipsLevels",
+    }
+)
+"""The API endpoints whose responses are cached by default. Their data changes rarely, so staleness isn't a concern."""
+
+
+@dataclass
+class ETagEntry:
+    """The cached response of a request."""
+
+    etag: str
+    """The ETag of the response."""
+    body: bytes
+    """The raw response body."""
+    objects: dict[tuple[type, str], Any] = field(default_factory=dict, repr=False)
+    """The deserialized responses by the resource class and the response format, created on the first use."""
+
+
+class ETagStore(ABC):
+    """Persistent storage of the ETags and the bodies of the cached responses.
+
+    The client calls it synchronously, to read the responses that aren't kept in memory and to write the new ones,
+    so the store should be local.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[tuple[str, bytes]]:
+        """Get the ETag and the body of the response to the request, or None if it isn't stored."""
+
+    @abstractmethod
+    def set(self, key: str, etag: str, body: bytes) -> None:
+        """Store the ETag and the body of the response to the request."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release the resources of the store."""
+
+
+class MemoryETagStore(ETagStore):
+    """Keeps the responses in memory, for the lifetime of the process."""
+
+    def __init__(self) -> None:
+        self.responses: dict[str, tuple[str, bytes]] = {}
+
+    def get(self, key: str) -> Optional[tuple[str, bytes]]:  # noqa: D102
+        return self.responses.get(key)
+
+    def set(self, key: str, etag: str, body: bytes) -> None:  # noqa: D102
+        self.responses[key] = (etag, body)
+
+
+class SQLiteETagStore(ETagStore):
+    """Keeps the responses in the `etags` table of an SQLite database, see `SQLiteDatabase`."""
+
+    def __init__(self, path: Union[str, PathLike[str]]):
+        """Initialize the store.
+
+        Args:
+            path: The database file path, or `:memory:`.
+        """
+        self.database = SQLiteDatabase(
+            path,
+            "CREATE TABLE IF NOT EXISTS etags (key TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL,"
+            " updated_at REAL NOT NULL)",
+        )
+
+    def get(self, key: str) -> Optional[tuple[str, bytes]]:  # noqa: D102
+        row = self.database.fetchone("SELECT etag, body FROM etags WHERE key = ?", (key,))
+        return (row[0], bytes(row[1])) if row else None
+
+    def set(self, key: str, etag: str, body: bytes) -> None:  # noqa: D102
+        self.database.execute(
+            "INSERT OR REPLACE INTO etags (key, etag, body, updated_at) VALUES (?, ?, ?, ?)",
+            (key, etag, body, time.time()),
+        )
+
+    def close(self) -> None:  # noqa: D102
+        self.database.close()
+
+
+class ETagCache:
+    """Revalidates the cached responses with `If-None-Match` instead of downloading them again.
+
+    When the API replies `304 Not Modified`, the client serves the cached response, deserialized only once.
+    Only the requests to the configured endpoints are cached. The request key doesn't include the credentials,
+    so a store shouldn't be shared by clients of different users (e.g. for `channelSections` with `mine`).
+
+    Note that conditional requests are still charged against the quota, they save the bandwidth and the decoding.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ETagStore] = None,
+        resources: Iterable[str] = ETAG_RESOURCES,
+        max_entries: int = 1024,
+    ):
+        """Initialize the cache.
+
+        Args:
+            store: The storage of the responses. Defaults to `MemoryETagStore`, use `SQLiteETagStore` to keep the
+                responses between restarts.
+            resources: The API endpoints (e.g. `videoCategories`) whose responses are cached.
+            max_entries: The maximum number of the responses (and their deserialized objects) kept in memory.
+        """
+        self.store = store or MemoryETagStore()
+        self.resources = frozenset(resources)
+        self.max_entries = max_entries
+
+        self.hits: int = 0
+        """The number of the responses served from the cache after a `304 Not Modified`."""
+        self.misses: int = 0
+        """The number of the responses downloaded, including the ones with an outdated ETag."""
+
+        self._entries: OrderedDict[str, ETagEntry] = OrderedDict()
+
+    def is_cacheable(self, path: str) -> bool:
+        """Check whether the requests to the API endpoint are cached."""
+        return get_endpoint(path) in self.resources
+
+    def get(self, key: str) -> Optional[ETagEntry]:
+        """Get the cached response to the request.
+
+        Args:
+            key: The canonical request key, see `canonical_request_key`.
+
+        Returns:
+            The cached response or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            stored = self.store.get(key)
+            if stored is None:
+                return None
+            entry = self._remember(key, ETagEntry(etag=stored[0], body=stored[1]))
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, etag: str, body: bytes) -> ETagEntry:
+        """Cache the response to the request.
+
+        Args:
+            key: The canonical request key.
+            etag: The ETag of the response.
+            body: The raw response body.
+
+        Returns:
+            The cached response.
+        """
+        self.store.set(key, etag, body)
+        return self._remember(key, ETagEntry(etag=etag, body=body))
+
+    def _remember(self, key: str, entry: ETagEntry) -> ETagEntry:
+        """Keep the response in memory, evicting the least recently used ones."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
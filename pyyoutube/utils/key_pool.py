@@ -0,0 +1,94 @@
+"""Pool of API keys rotated by their remaining quota."""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from ..error import PyYouTubeIncorrectParamsError, PyYouTubeQuotaReachedError
+from .quota import next_quota_reset
+
+
+@dataclass
+class APIKeyState:
+    """The quota state of a single API key."""
+
+    api_key: str
+    """The API key."""
+    quota_remaining: int
+    """The estimate of the quota units left for today."""
+    exhausted_until: Optional[datetime] = None
+    """The quota reset time if the API reported that the key's quota is exceeded."""
+
+
+class APIKeyPool:
+    """Picks the API key with the most remaining quota for every request.
+
+    The remaining quota of each key is estimated by charging the quota cost of the requests made with it.
+    A key is taken out of rotation when the API reports `quotaExceeded` for it, and all keys are re-armed
+    at the daily quota reset (midnight Pacific Time).
+    """
+
+    def __init__(self, api_keys: list[str], daily_quota: int):
+        """Initialize the pool.
+
+        Args:
+            api_keys: The API keys. Each key should belong to a separate Google Cloud project.
+            daily_quota: The daily quota of each key in units.
+        """
+        if not api_keys:
+            raise PyYouTubeIncorrectParamsError("At least one API key is required")
+
+        self.daily_quota = daily_quota
+        self.keys: dict[str, APIKeyState] = {
+            api_key: APIKeyState(api_key=api_key, quota_remaining=daily_quota) for api_key in dict.fromkeys(api_keys)
+        }
+        self.reset_at: datetime = next_quota_reset()
+
+    def _reset(self, now: datetime) -> None:
+        """Re-arm all keys after the daily quota reset."""
+        if now < self.reset_at:
+            return
+
+        for state in self.keys.values():
+            state.quota_remaining = self.daily_quota
+            state.exhausted_until = None
+        self.reset_at = next_quota_reset(now)
+
+    def acquire(self, cost: int = 1) -> str:
+        """Pick the healthiest key for a request and reserve the request's cost on it.
+
+        Args:
+            cost: The quota cost of the request.
+
+        Returns:
+            The API key to use.
+
+        Raises:
+            PyYouTubeQuotaReachedError: If the quota of all keys is exceeded.
+        """
+        self._reset(datetime.now(timezone.utc))
+
+        available = [state for state in self.keys.values() if state.exhausted_until is None]
+        if not available:
+            raise PyYouTubeQuotaReachedError(403, f"Quota of all API keys is exceeded until {self.reset_at}")
+
+        state = max(available, key=lambda state: state.quota_remaining)
+        state.quota_remaining -= cost
+        return state.api_key
+
+    def mark_exhausted(self, api_key: str) -> None:
+        """Take the key out of rotation until the daily quota reset.
+
+        Args:
+            api_key: The API key the API reported `quotaExceeded` for.
+        """
+        state = self.keys.get(api_key)
+        if state is not None:
+            state.quota_remaining = 0
+            state.exhausted_until = self.reset_at
+
+    @property
+    def available(self) -> list[str]:
+        """The keys that can be used right now."""
+        self._reset(datetime.now(timezone.utc))
+        return [state.api_key for state in self.keys.values() if state.exhausted_until is None]
@@ -0,0 +1,94 @@
+"""Request coalescing for single-ID lookups."""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BatchLoader(Generic[T]):
+    """Collects single-key loads issued within a short window and resolves them with a single batch call.
+
+    The batch is dispatched when either `max_delay` seconds passed since the first load of the batch or
+    `max_batch_size` distinct keys were collected, whichever comes first. Concurrent loads of the same key
+    share one slot of the batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[str]], Awaitable[dict[str, T]]],
+        max_batch_size: int = 50,
+        max_delay: float = 0.002,
+    ):
+        """Initialize the loader.
+
+        Args:
+            batch_fn: Coroutine function that receives a list of unique keys and returns the found values by key.
+            max_batch_size: The maximum number of keys in a single batch.
+            max_delay: The maximum time in seconds a load waits for other loads to join its batch.
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: str) -> Optional[T]:
+        """Load a single value.
+
+        Args:
+            key: The key to load.
+
+        Returns:
+            The value for the key or None if the batch function didn't return it.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Send the collected keys to the batch function."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._resolve(batch))
+
+        # Keep a reference to the task until it's done to protect it from garbage collection.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict[str, list[asyncio.Future]]) -> None:
+        """Run the batch function and resolve the waiting futures."""
+        try:
+            values = await self.batch_fn(list(batch.keys()))
+        except asyncio.CancelledError:
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as ex:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(ex)
+            return
+
+        for key, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(values.get(key))
@@ -1,9 +1,11 @@
 """function's params checker."""
 
 import logging
-from typing import Optional, Union
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional, Union
+from urllib.parse import urlencode
 
-from pyyoutube.utils.constants import RESOURCE_PARTS_MAPPING
+from pyyoutube.utils.constants import MAX_IDS_PER_REQUEST, RESOURCE_PARTS_MAPPING
 
 from ..error import PyYouTubeIncorrectParamsError
 
@@ -56,12 +58,61 @@ def enf_parts(resource: str, value: Optional[Union[str, list]], check: bool = Tr
         parts = set(value)
 
     # Remove leading/trailing whitespaces
-    parts = set({part.strip() for part in parts})
+    parts = {part.strip() for part in parts}
 
     # Check parts whether support
     if check:
         support_parts = RESOURCE_PARTS_MAPPING[resource]
         if not support_parts.issuperset(parts):
-            not_support_parts = ",".join(parts.difference(support_parts))
+            not_support_parts = ",".join(sorted(parts.difference(support_parts)))
             raise PyYouTubeIncorrectParamsError(f"Parts {not_support_parts} for resource {resource} not support")
-    return ",".join(parts)
+
+    # Sort parts to keep the value (and so the request) deterministic.
+    return ",".join(sorted(parts))
+
+
+def enf_id_chunks(field: str, value: Union[str, Iterable[str]], chunk_size: int = MAX_IDS_PER_REQUEST) -> list[list[str]]:
+    """De-duplicate the given IDs and split them into chunks the API accepts in a single request.
+
+    Args:
+        field (str):
+            Name of the parameter, used in the error message.
+        value (str, Iterable[str]):
+            Comma-separated str or an iterable of IDs.
+        chunk_size (int, optional):
+            The maximum number of IDs in a single chunk.
+
+    Returns:
+        Chunks of unique IDs in the order of their first occurrence.
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+
+    try:
+        ids = list(dict.fromkeys(item.strip() for item in value))
+    except (TypeError, AttributeError) as ex:
+        raise PyYouTubeIncorrectParamsError(f"Parameter ({field}) must be comma-separated str or iterable of str") from ex
+
+    ids = [item for item in ids if item]
+    return [ids[index : index + chunk_size] for index in range(0, len(ids), chunk_size)]
+
+
+def canonical_request_key(path: str, params: Optional[Mapping[str, Any]]) -> str:
+    """Build a key that is equal for requests to the same path with the same parameters.
+
+    The parameters are sorted and `None` values are dropped, so the key doesn't depend on their order.
+
+    Args:
+        path (str):
+            The API endpoint path.
+        params (Mapping, optional):
+            Query parameters for the request.
+
+    Returns:
+        Canonical request key
+    """
+    if not params:
+        return path
+
+    query = urlencode(sorted((key, str(value)) for key, value in params.items() if value is not None))
+    return f"{path}?{query}"
@@ -0,0 +1,67 @@
+"""YouTube Data API quota costs and reset times.
+
+References: https://developers.google.com/youtube/v3/determine_quota_cost
+"""
+
+from datetime import datetime, time, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+DEFAULT_DAILY_QUOTA = 10_000
+"""The default daily quota of a Google Cloud project."""
+
+DEFAULT_QUOTA_COST = 1
+"""The cost of a request to an endpoint missing in `QUOTA_COSTS`."""
+
+QUOTA_COSTS = {
+    "captions": 50,
+    "channels": 1,
+    "channelSections": 1,
+    "comments": 1,
+    "commentThreads": 1,
+    "i18nLanguages": 1,
+    "i18nRegions": 1,
+    "members": 1,
+    "membershipsLevels": 1,
+    "playlistItems": 1,
+    "playlists": 1,
+    "search": 100,
+    "subscriptions": 1,
+    "videoAbuseReportReasons": 1,
+    "videoCategories": 1,
+    "videos": 1,
+}
+"""The quota cost of a `list` request to the endpoint."""
+
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+"""The daily quota is reset at midnight Pacific Time."""
+
+
+def get_endpoint(path: str) -> str:
+    """Get the API endpoint name (e.g. `videos`) from the endpoint path or the full URL."""
+    return path.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+
+
+def get_quota_cost(path: str) -> int:
+    """Get the quota cost of a `list` request to the API endpoint.
+
+    Args:
+        path: The API endpoint path or the full URL.
+
+    Returns:
+        The quota cost in units.
+    """
+    return QUOTA_COSTS.get(get_endpoint(path), DEFAULT_QUOTA_COST)
+
+
+def next_quota_reset(now: Optional[datetime] = None) -> datetime:
+    """Get the time of the next daily quota reset.
+
+    Args:
+        now: The current time. Defaults to the current system time.
+
+    Returns:
+        The timezone-aware time of the next midnight Pacific Time.
+    """
+    now = (now or datetime.now(timezone.utc)).astimezone(QUOTA_TIMEZONE)
+    return datetime.combine(now.date() + timedelta(days=1), time(0), tzinfo=QUOTA_TIMEZONE)
@@ -0,0 +1,114 @@
+"""Client-side rate limiting against the YouTube Data API quota."""
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Optional
+
+from ..error import PyYouTubeIncorrectParamsError
+from .quota import DEFAULT_DAILY_QUOTA, get_endpoint, get_quota_cost, next_quota_reset
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Admits requests against a per-second request budget (token bucket) and a daily quota budget.
+
+    Requests that exceed the budget wait until it's replenished instead of failing. Waiting requests are admitted
+    in the order they arrived. The daily quota is counted in units using the quota cost of each endpoint and is
+    replenished at midnight Pacific Time, together with the API quota.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        daily_quota: Optional[int] = DEFAULT_DAILY_QUOTA,
+        burst: Optional[int] = None,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_second: The sustained number of requests per second. Unlimited if None.
+            daily_quota: The number of quota units that can be spent per day. Unlimited if None.
+            burst: The number of requests that can be made at once. Defaults to `requests_per_second`.
+        """
+        self.requests_per_second = requests_per_second
+        self.daily_quota = daily_quota
+        self.burst = max(burst or int(requests_per_second or 1), 1)
+
+        self.quota_used: int = 0
+        """The number of quota units spent since the last quota reset."""
+        self.quota_used_by_endpoint: dict[str, int] = defaultdict(int)
+        """The number of quota units spent per endpoint since the last quota reset."""
+        self.quota_reset_at: datetime = next_quota_reset()
+        """The time of the next daily quota reset."""
+
+        self._tokens: float = float(self.burst)
+        self._updated_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def quota_remaining(self) -> Optional[int]:
+        """The number of quota units left for today. None if the daily quota is unlimited."""
+        if self.daily_quota is None:
+            return None
+        return max(self.daily_quota - self.quota_used, 0)
+
+    async def acquire(self, path: str) -> None:
+        """Wait until a request to the API endpoint fits into the budgets and charge its cost.
+
+        Args:
+            path: The API endpoint path or the full URL.
+
+        Raises:
+            PyYouTubeIncorrectParamsError: If the request costs more than the whole daily quota, so it never fits.
+        """
+        cost = get_quota_cost(path)
+        endpoint = get_endpoint(path)
+        if self.daily_quota is not None and cost > self.daily_quota:
+            raise PyYouTubeIncorrectParamsError(
+                f"A request to {endpoint} costs {cost} units, more than the daily quota of {self.daily_quota} units"
+            )
+
+        async with self._lock:
+            await self._wait_for_quota(cost)
+            await self._wait_for_token()
+
+            self.quota_used += cost
+            self.quota_used_by_endpoint[endpoint] += cost
+
+    async def _wait_for_quota(self, cost: int) -> None:
+        """Wait until the daily quota has enough units for the request."""
+        while True:
+            now = datetime.now(timezone.utc)
+            if now >= self.quota_reset_at:
+                self.quota_used = 0
+                self.quota_used_by_endpoint.clear()
+                self.quota_reset_at = next_quota_reset(now)
+
+            if self.daily_quota is None or self.quota_used + cost <= self.daily_quota:
+                return
+
+            delay = (self.quota_reset_at - now).total_seconds()
+            logger.warning("Daily quota of %d units is spent, waiting %.0fs for the reset", self.daily_quota, delay)
+            await asyncio.sleep(delay)
+
+    async def _wait_for_token(self) -> None:
+        """Wait until the token bucket has a token for the request and take it."""
+        if self.requests_per_second is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if self._updated_at is not None:
+                elapsed = now - self._updated_at
+                self._tokens = min(float(self.burst), self._tokens + elapsed * self.requests_per_second)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / self.requests_per_second)
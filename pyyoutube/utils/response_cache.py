@@ -0,0 +1,268 @@
+"""Time-limited cache of the API responses, which saves the quota spent on repeated requests."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from os import PathLike
+from typing import Any, Optional, Union
+
+from .params_checker import canonical_request_key
+from .quota import get_endpoint
+from .sqlite import SQLiteDatabase
+
+DEFAULT_TTLS: dict[str, float] = {
+    "channels": 24 * 3600,
+    "channels.statistics": 3600,
+    "channelSections": 24 * 3600,
+    "commentThreads": 600,
+    "comments": 600,
+    "i18nLanguages": 7 * 24 * 3600,
+    "i18nRegions": 7 * 24 * 3600,
+    "playlistItems": 900,
+    "playlists": 3600,
+    "subscriptions": 3600,
+    "videoAbuseReportReasons": 7 * 24 * 3600,
+    "videoCategories": 7 * 24 * 3600,
+    "videos": 3600,
+    "videos.statistics": 60,
+    "videos.liveStreamingDetails": 30,
+}
+"""The time to live in seconds of the responses by the API endpoint (e.g. `videos`) or by the endpoint and the part
+(e.g. `videos.statistics`). The responses of the endpoints missing here (e.g. `search`) aren't cached."""
+
+PRIVATE_PARAMS = frozenset(
+    {
+        "forContentOwner",
+        "forMine",
+        "managedByMe",
+        "mine",
+        "myRating",
+        "myRecentSubscribers",
+        "mySubscribers",
+        "onBehalfOfContentOwner",
+        "onBehalfOfContentOwnerChannel",
+    }
+)
+"""The parameters which make the response depend on the credentials. The cache key doesn't include the credentials,
+so such requests aren't cached."""
+
+
+class CacheBackend(ABC):
+    """Storage of the cached response bodies.
+
+    The methods are asynchronous, so a network store can implement them directly, see `RedisCacheBackend`.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get the response body, or None if it isn't cached or has expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Cache the response body for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove the response body from the cache."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the resources of the backend."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """Keeps the responses in memory, evicting the least recently used ones when the size limit is reached."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: Optional[int] = None):
+        """Initialize the backend.
+
+        Args:
+            max_bytes: The maximum total size of the cached response bodies.
+            max_entries: The maximum number of the cached responses. Unlimited if None.
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.size: int = 0
+        """The total size of the cached response bodies."""
+
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[bytes]:  # noqa: D102
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:  # noqa: D102
+        if len(value) > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self.size += len(value)
+        while self.size > self.max_bytes or (self.max_entries is not None and len(self._entries) > self.max_entries):
+            self._remove(next(iter(self._entries)))
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Keeps the responses in the `responses` table of an SQLite database, see `SQLiteDatabase`.
+
+    The queries run in a worker thread (`asyncio.to_thread`), so a slow disk doesn't block the event loop.
+    """
+
+    def __init__(self, path: Union[str, PathLike[str]]):
+        """Initialize the backend.
+
+        Args:
+            path: The database file path, or `:memory:`.
+        """
+        self.database = SQLiteDatabase(
+            path,
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)",
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:  # noqa: D102
+        row = await asyncio.to_thread(
+            self.database.fetchone, "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, time.time())
+        )
+        return bytes(row[0]) if row else None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:  # noqa: D102
+        await asyncio.to_thread(
+            self.database.execute,
+            "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl),
+        )
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        await asyncio.to_thread(self.database.execute, "DELETE FROM responses WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Delete the expired responses.
+
+        Returns:
+            The number of the deleted responses.
+        """
+        return self.database.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+    async def close(self) -> None:  # noqa: D102
+        await asyncio.to_thread(self.database.close)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Keeps the responses in Redis or a Redis-compatible store (Valkey, KeyDB, etc.).
+
+    It works with any asynchronous client with the `get`, `set` (with `px`) and `delete` commands of
+    `redis.asyncio.Redis`, which isn't a dependency of this package.
+    """
+
+    def __init__(self, redis: Any, prefix: str = "pyyoutube:"):
+        """Initialize the backend.
+
+        Args:
+            redis: The asynchronous Redis client, e.g. `redis.asyncio.Redis.from_url("redis://localhost")`.
+            prefix: The prefix of the keys.
+        """
+        self.redis = redis
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:  # noqa: D102
+        return await self.redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:  # noqa: D102
+        await self.redis.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        await self.redis.delete(self.prefix + key)
+
+
+class ResponseCache:
+    """Serves the repeated requests from the cache for a time which depends on the requested resource and parts.
+
+    The cache key is the request path with the sorted parameters, without the API key. The responses are cached
+    as raw bodies, so they can be served in any response format.
+
+    The key doesn't include the credentials, so the requests with `PRIVATE_PARAMS` (e.g. `mine`) are never cached,
+    and the requests of the OAuth clients only with `cache_authorized`.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        cache_authorized: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            backend: The storage of the responses. Defaults to `LRUCacheBackend`.
+            ttls: The time to live in seconds by the API endpoint or by the endpoint and the part, e.g.
+                `{"channels": 86400, "videos": 3600, "videos.statistics": 60}`. The TTL of a request is the shortest
+                TTL of its parts. Defaults to `DEFAULT_TTLS`.
+            cache_authorized: Whether to cache the requests of the clients with `AccessTokenAuthentication`.
+                Enable it only if the backend isn't shared by the clients of different users.
+        """
+        self.backend = backend or LRUCacheBackend()
+        self.ttls: dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.cache_authorized = cache_authorized
+
+        self.hits: int = 0
+        """The number of the responses served from the cache."""
+        self.misses: int = 0
+        """The number of the cacheable requests sent to the API."""
+
+    def get_ttl(self, path: str, params: Optional[Mapping[str, Any]] = None) -> Optional[float]:
+        """Get the time to live of the response to the request.
+
+        Args:
+            path: The API endpoint path or the full URL.
+            params: The query parameters, including `part`.
+
+        Returns:
+            The TTL in seconds, or None if the response shouldn't be cached.
+        """
+        if PRIVATE_PARAMS.intersection(params or {}):
+            return None
+
+        endpoint = get_endpoint(path)
+        parts = str((params or {}).get("part") or "").split(",")
+        ttls = [self.ttls.get(f"{endpoint}.{part.strip()}", self.ttls.get(endpoint)) for part in parts]
+        if any(ttl is None for ttl in ttls):
+            return None
+        return min(ttls)  # type: ignore
+
+    @staticmethod
+    def get_key(path: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Build the cache key of the request, which doesn't include the API key."""
+        return canonical_request_key(path, {key: value for key, value in (params or {}).items() if key != "key"})
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get the cached response body, counting the hits and the misses."""
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Cache the response body for `ttl` seconds."""
+        if ttl > 0:
+            await self.backend.set(key, value, ttl)
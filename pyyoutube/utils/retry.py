@@ -0,0 +1,106 @@
+"""Retry policy for failed API requests."""
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+from ..error import PyYouTubeQuotaReachedError, PyYouTubeServiceError
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse the `Retry-After` header value into a delay in seconds.
+
+    The header holds either a number of seconds or an HTTP date.
+
+    Returns:
+        The delay in seconds or None if the value is missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class RetryPolicy:
+    """Configuration of the request retries with exponential backoff and full jitter.
+
+    The delay before the retry N (starting from 0) is a random value between 0 and
+    `min(max_delay, base_delay * 2 ** N)`. If the response has the `Retry-After` header, its value is used instead.
+    Quota errors (`PyYouTubeQuotaReachedError`) are never retried.
+    """
+
+    max_attempts: int = 4
+    """The maximum number of attempts, including the first one. Set to 1 to disable retries."""
+
+    base_delay: float = 0.5
+    """The base delay in seconds of the exponential backoff."""
+
+    max_delay: float = 30.0
+    """The maximum delay in seconds between attempts. Longer `Retry-After` values aren't waited for."""
+
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 500, 502, 503, 504}))
+    """HTTP statuses of the responses that should be retried."""
+
+    retry_reasons: frozenset[str] = field(
+        default_factory=lambda: frozenset({"rateLimitExceeded", "userRateLimitExceeded", "backendError"})
+    )
+    """YouTube Data API error reasons that should be retried regardless of the HTTP status."""
+
+    retry_exceptions: tuple[type[BaseException], ...] = (
+        asyncio.TimeoutError,
+        ClientConnectionError,
+        ClientPayloadError,
+    )
+    """Exceptions (timeouts, connection resets, etc.) that should be retried."""
+
+    respect_retry_after: bool = True
+    """Whether to wait for the time given in the `Retry-After` response header."""
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Check whether the request that failed with the error should be retried."""
+        if isinstance(error, PyYouTubeQuotaReachedError):
+            return False
+
+        if isinstance(error, PyYouTubeServiceError):
+            return error.status_code in self.retry_statuses or error.reason in self.retry_reasons
+
+        return isinstance(error, self.retry_exceptions)
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Calculate the delay before the next attempt.
+
+        Args:
+            attempt: The number of the failed attempt, starting from 0.
+            retry_after: The delay requested by the server via the `Retry-After` header.
+
+        Returns:
+            The delay in seconds or None if the request shouldn't be retried anymore.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        if retry_after is not None and self.respect_retry_after:
+            return retry_after if retry_after <= self.max_delay else None
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))  # noqa: S311
@@ -0,0 +1,32 @@
+"""RFC 3339 times, the format of the times in the API requests and responses (e.g. `2024-05-01T10:17:00Z`)."""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+
+def parse_rfc3339(value: Any) -> Optional[datetime]:
+    """Parse the RFC 3339 time. Naive times are considered UTC, so the results can always be compared.
+
+    Returns:
+        The timezone-aware time, or None if the value is missing or isn't a valid time.
+    """
+    try:
+        # `fromisoformat` accepts the `Z` suffix since Python 3.11.
+        moment = datetime.fromisoformat(str(value).replace("Z", "+00:00")) if value else None
+    except ValueError:
+        return None
+    if moment is not None and moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def to_utc(value: datetime) -> datetime:
+    """Convert the time to an aware UTC time, so it can be compared with the others. Naive times are considered UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_rfc3339(value: datetime) -> str:
+    """Format the time as the RFC 3339 UTC time the API accepts. Naive times are considered UTC."""
+    return to_utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -0,0 +1,161 @@
+"""Cache of the search results, which serves the equivalent queries of the 100-unit `search.list` once."""
+
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from .quota import get_endpoint
+from .response_cache import PRIVATE_PARAMS, CacheBackend, ResponseCache
+from .rfc3339 import format_rfc3339, parse_rfc3339
+
+SEARCH_DEFAULTS: dict[str, str] = {
+    "channelType": "any",
+    "maxResults": "5",
+    "order": "relevance",
+    "safeSearch": "moderate",
+    "videoCaption": "any",
+    "videoDefinition": "any",
+    "videoDimension": "any",
+    "videoDuration": "any",
+    "videoEmbeddable": "any",
+    "videoLicense": "any",
+    "videoPaidProductPlacement": "any",
+    "videoSyndicated": "any",
+    "videoType": "any",
+}
+"""The default values of the search parameters. The parameters with these values are dropped from the query."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def normalize_query(q: str) -> str:
+    """Normalize the query term: collapse the whitespace and lowercase it, the search is case-insensitive."""
+    return " ".join(q.split()).lower()
+
+
+def round_time(value: str, granularity: timedelta, up: bool = False) -> str:
+    """Round the RFC 3339 time down (or up) to the granularity.
+
+    Args:
+        value: The time, e.g. `2024-05-01T10:17:00Z`.
+        granularity: The rounding step, e.g. an hour.
+        up: Round up instead of down.
+
+    Returns:
+        The rounded UTC time, or the value unchanged if it isn't a valid time.
+    """
+    moment = parse_rfc3339(value)
+    if moment is None:
+        return value
+
+    remainder = (moment - _EPOCH) % granularity
+    if remainder:
+        moment += granularity - remainder if up else -remainder
+    return format_rfc3339(moment)
+
+
+class SearchCache(ResponseCache):
+    """Serves the equivalent `search.list` queries from the cache.
+
+    The queries are canonicalized before they're sent, so the queries which differ only in the letter case or
+    the whitespace of `q`, the order of `type` or the default values share a single cached response. These changes
+    don't change the results.
+
+    With `granularity`, the `publishedAfter`/`publishedBefore` times are also rounded outwards, so the queries of
+    overlapping windows share a response too. The widened query is the one sent, so the results (and
+    `pageInfo.totalResults`) may include videos published up to one granularity outside the requested window.
+
+    The time to live depends on how fast the results of the query change:
+        - live and upcoming broadcasts: `live_ttl`.
+        - windows which ended more than `archive_after` ago: `archive_ttl`, the old results barely change.
+        - the newest uploads (`order=date` or a window reaching the present): `recent_ttl`.
+        - the other queries: `ttl`.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        granularity: Optional[timedelta] = None,
+        ttl: float = 3600,
+        recent_ttl: float = 300,
+        live_ttl: float = 60,
+        archive_ttl: float = 7 * 24 * 3600,
+        archive_after: timedelta = timedelta(days=7),
+        normalize: Callable[[str], str] = normalize_query,
+        cache_authorized: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            backend: The storage of the responses. Defaults to `LRUCacheBackend`. Use a shared backend (e.g.
+                `RedisCacheBackend`) to share the results between the services.
+            granularity: The step `publishedAfter` and `publishedBefore` are rounded outwards to, which widens
+                the searched window. The published times are kept exact by default.
+            ttl: The time to live in seconds of the results.
+            recent_ttl: The time to live of the results of the newest uploads.
+            live_ttl: The time to live of the results of the live and upcoming broadcasts.
+            archive_ttl: The time to live of the results of the windows which ended `archive_after` ago.
+            archive_after: The age of the window end after which the results are considered final.
+            normalize: The function which normalizes the query term `q`.
+            cache_authorized: Whether to cache the searches of the clients with `AccessTokenAuthentication`.
+        """
+        super().__init__(backend, ttls={"search": ttl}, cache_authorized=cache_authorized)
+        self.granularity = granularity
+        self.ttl = ttl
+        self.recent_ttl = recent_ttl
+        self.live_ttl = live_ttl
+        self.archive_ttl = archive_ttl
+        self.archive_after = archive_after
+        self.normalize = normalize
+
+    def canonicalize(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        """Build the canonical parameters of the search query.
+
+        Args:
+            params: The query parameters of the search request.
+
+        Returns:
+            The parameters to send, equal for the equivalent queries.
+        """
+        canonical = {
+            key: value
+            for key, value in params.items()
+            if value is not None and str(value) != SEARCH_DEFAULTS.get(key) and not (key == "q" and not value)
+        }
+
+        if "q" in canonical:
+            canonical["q"] = self.normalize(str(canonical["q"]))
+        if "type" in canonical:
+            types = canonical["type"].split(",") if isinstance(canonical["type"], str) else canonical["type"]
+            canonical["type"] = ",".join(sorted({item.strip() for item in types if item.strip()}))
+        if self.granularity:
+            if "publishedAfter" in canonical:
+                canonical["publishedAfter"] = round_time(str(canonical["publishedAfter"]), self.granularity)
+            if "publishedBefore" in canonical:
+                canonical["publishedBefore"] = round_time(str(canonical["publishedBefore"]), self.granularity, up=True)
+        return canonical
+
+    def get_ttl(self, path: str, params: Optional[Mapping[str, Any]] = None) -> Optional[float]:
+        """Get the time to live of the search results by the freshness policy.
+
+        Args:
+            path: The API endpoint path or the full URL.
+            params: The canonical query parameters.
+
+        Returns:
+            The TTL in seconds, or None if the response shouldn't be cached.
+        """
+        params = params or {}
+        if get_endpoint(path) != "search" or PRIVATE_PARAMS.intersection(params):
+            return None
+
+        if params.get("eventType") in {"live", "upcoming"}:
+            return self.live_ttl
+
+        now = datetime.now(timezone.utc)
+        published_before = parse_rfc3339(params.get("publishedBefore"))
+        if published_before is not None and published_before < now - self.archive_after:
+            return self.archive_ttl
+        if params.get("order") == "date" or (published_before is None and "publishedAfter" in params):
+            return self.recent_ttl
+        return self.ttl
@@ -1,24 +1,77 @@
 # ruff: noqa: E721, E501, PLR2004, PLR0912, PLR0915
-from dataclasses import MISSING, Field, asdict, dataclass, fields, is_dataclass
-from typing import Any, Callable, ClassVar, Union, get_args, get_origin
+from collections.abc import Iterable
+from dataclasses import MISSING, Field, asdict, dataclass, field, fields, is_dataclass
+from typing import Any, Callable, ClassVar, Union, dataclass_transform, get_args, get_origin
+
+from orjson import dumps
+
+from .codec import decode
+
+
+def _compile_on_first_call(cls: type, name: str, source: str) -> Callable[..., Any]:
+    """Create a stub which compiles the generated class function, replaces itself with it and calls it."""
+
+    def stub(*args: Any) -> Any:
+        namespace: dict[str, Any] = {}
+        exec(source, globals(), namespace)  # noqa: S102
+        setattr(cls, name, namespace[name])
+        return namespace[name](*args)
+
+    return stub
+
+
+@dataclass_transform(field_specifiers=(field, Field))
+class SerializableMeta(type):
+    """A metaclass which turns the `Serializable` subclasses into slotted dataclasses.
+
+    Assigning `__slots__` to an already created class has no effect, so the class is rebuilt by
+    `dataclass(slots=True)`, which creates it again through this metaclass with `__slots__` in its namespace.
+    Slotted instances have no per-instance `__dict__`, which makes them several times smaller.
+    """
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any):  # noqa: D102
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        if "__slots__" in namespace:
+            return cls
+
+        return dataclass(cls, slots=True)
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        # The `@dataclass` decorator applied to the rebuilt class would collect its fields again, but slots replace
+        # the default values on the class, so the fields would lose their defaults. Keep the original fields.
+        # The methods generated by the decorator are kept anyway, because it doesn't overwrite the existing ones.
+        if name == "__dataclass_fields__" and name in cls.__dict__ and "__slots__" in cls.__dict__:
+            return
+        super().__setattr__(name, value)
 
 
 @dataclass
-class Serializable:
+class Serializable(metaclass=SerializableMeta):
     """A base class for serializable dataclasses.
 
     It compiles (optional) the serialization and deserialization code into class functions to make it faster.
+    Subclasses are slotted dataclasses, so mixins used with them should declare empty `__slots__`.
     """
 
+    __slots__ = ("_pending",)
+
     _schema: ClassVar[dict[str, Field]]
     _map: ClassVar[dict[str, type]]
+    _defaults: ClassVar[dict[str, str]]
 
     _serialize_fn: ClassVar[Callable[[Any], dict[str, Any]]]
     _deserialize_fn: ClassVar[Callable[[type, dict[str, Any]], Any]]
+    _deserialize_many_fn: ClassVar[Callable[[type, Iterable[dict[str, Any]]], list[Any]]]
+    _lazy_deserialize_fn: ClassVar[Callable[[type, dict[str, Any]], Any]]
+    _materialize_fn: ClassVar[Callable[[type, str, Any], Any]]
 
     def __init_subclass__(cls, /, **kwargs) -> None:
         """Meta class for making dataclasses serializable."""
-        cls = dataclass(cls)  # noqa: PLW0642
+        # The class without `__slots__` is rebuilt by the metaclass, the code is generated for the slotted one.
+        if "__slots__" not in cls.__dict__:
+            return
+        if "__dataclass_fields__" not in cls.__dict__:
+            cls = dataclass(cls)  # noqa: PLW0642
 
         # Create a schema with field names and types, including inherited fields.
         cls._schema = {}
@@ -32,16 +85,28 @@ class Serializable:
 
                     cls._schema.update({field.name: field})
 
-        # Automatically generate __slots__ based on dataclass fields.
-        if "__slots__" not in cls.__dict__:
-            cls.__slots__ = tuple(cls._schema.keys())  # type: ignore
-
         # Generate custom serialization and deserialization code and compile it into a class function.
         serializer: list[str] = ["def _serialize_fn(instance):", "    result = {}"]
         deserializer: list[str] = ["def _deserialize_fn(cls, data):", "    result = {}"]
+        # The batch deserializer resolves the converters, nested classes and default factories once per call,
+        # and builds the instances without `cls(**result)`, setting the slots directly.
+        many_prologue: list[str] = ["def _deserialize_many_fn(cls, items):", "    new = cls.__new__"]
+        many_deserializer: list[str] = [
+            "    result = []",
+            "    append = result.append",
+            "    for data in items:",
+            "        instance = new(cls)",
+        ]
+        lazy_deserializer: list[str] = [
+            "def _lazy_deserialize_fn(cls, data):",
+            "    instance = cls.__new__(cls)",
+            "    pending = {}",
+        ]
+        materializer: list[str] = ["def _materialize_fn(cls, name, value):"]
 
         # Iterate over schema, build types map and generate serialization & deserialization code.
         cls._map = {}
+        cls._defaults = {}
         for name, field in cls._schema.items():
             ftype: type = field.type  # type: ignore
 
@@ -51,8 +116,16 @@ class Serializable:
             is_optional: bool = origin == Union and len(args) == 2 and args[1] == type(None)
             if is_optional:
                 ftype = args[0]
-
-            _default_value = "None" if field.default == MISSING else repr(field.default)
+                origin = get_origin(ftype)
+                args = get_args(ftype)
+
+            # Fields missing in the data (e.g. in partial responses requested with `fields`) get their default value.
+            if field.default is not MISSING:
+                _default_value = repr(field.default)
+            elif field.default_factory is not MISSING:
+                _default_value = f"cls._schema['{name}'].default_factory()"
+            else:
+                _default_value = "None"
 
             if_nested_dataclass: bool = False
             if origin and origin in {list, set, tuple}:
@@ -60,49 +133,132 @@ class Serializable:
                 if is_dataclass(args[0]):
                     if_nested_dataclass = True
                     cls._map[name] = args[0]
-                if _default_value == MISSING:
-                    _default_value = "[]"
+                if not is_optional and field.default is MISSING and field.default_factory is MISSING:
+                    _default_value = f"{origin.__name__}()"
             elif origin and origin == dict:
                 cls._map[name] = origin
                 if is_dataclass(args[1]):
                     if_nested_dataclass = True
                     cls._map[name] = args[1]
-                if _default_value == MISSING:
+                if not is_optional and field.default is MISSING and field.default_factory is MISSING:
                     _default_value = "{}"
             else:
                 cls._map[name] = ftype
 
-            _sopt: str = f" if instance.{name} is not None else None" if is_optional else ""
+            cls._defaults[name] = _default_value
+
+            # Nested values can be None in sparse data even if the field isn't optional.
+            _nested: bool = is_dataclass(ftype) or if_nested_dataclass
+            _sopt: str = f" if instance.{name} is not None else None" if is_optional or _nested else ""
             _def: str = f" if ('{name}' in data and data['{name}'] is not None) else {_default_value}"
             _debug: str = f"    print('Field: {name}, {origin.__name__ if origin else 'None'} - {ftype.__name__}', is_dataclass({ftype.__name__}))\n"
 
             _serialize: str = f"    result['{name}'] = "
-            _deserialize: str = f"    result['{name}'] = "
 
+            # The value conversion, where `__src__` is the source value and `__fn__` is the nested deserializer.
+            _convert: str
             if is_dataclass(ftype):
                 _serialize += f"instance.{name}.serialize()" + _sopt
-                _deserialize += f"cls._map['{name}'].deserialize(data['{name}'])" + _def
+                _convert = f"cls._map['{name}'].__fn__(__src__)"
             elif if_nested_dataclass and origin and origin in {list, set, tuple}:
                 _serialize += f"{origin.__name__}(item.serialize() for item in instance.{name})" + _sopt
-                _deserialize += f"{origin.__name__}(cls._map['{name}'].deserialize(item) for item in data['{name}'])" + _def
+                _convert = f"{origin.__name__}(cls._map['{name}'].__fn__(item) for item in __src__)"
             elif if_nested_dataclass and origin and origin == dict:
                 _serialize += f"{{k: v.serialize() for k, v in instance.{name}.items()}}" + _sopt
-                _deserialize += f"{{k: cls._map['{name}'].deserialize(v) for k, v in data['{name}'].items()}}" + _def
+                _convert = f"{{k: cls._map['{name}'].__fn__(v) for k, v in __src__.items()}}"
             else:
                 _serialize += f"instance.{name}" + _sopt
-                _deserialize += f"cls._map['{name}'](data['{name}'])" + _def
+                _convert = f"cls._map['{name}'](__src__)"
+
+            # Lists of nested dataclasses are deserialized in a single batch.
+            if if_nested_dataclass and origin and origin in {list, set, tuple}:
+                _eager_convert = f"cls._map['{name}'].deserialize_many(__src__)"
+                if origin is not list:
+                    _eager_convert = f"{origin.__name__}({_eager_convert})"
+            else:
+                _eager_convert = _convert.replace("__fn__", "deserialize")
+            _eager: str = _eager_convert.replace("__src__", f"data['{name}']") + _def
 
             serializer.append(_serialize)
-            deserializer.append(_deserialize)
+
+            deserializer.append(f"    result['{name}'] = {_eager}")
+
+            many_prologue.append(f"    convert_{name} = cls._map['{name}']")
+            if is_dataclass(ftype):
+                # Even a batch of one is built faster than by `cls(**result)` of the nested `_deserialize_fn`.
+                many_prologue.append(f"    nested_{name} = convert_{name}._deserialize_many_fn")
+                _many = f"nested_{name}(convert_{name}, (value,))[0]"
+            elif if_nested_dataclass and origin and origin in {list, set, tuple}:
+                many_prologue.append(f"    nested_{name} = convert_{name}._deserialize_many_fn")
+                _many = f"nested_{name}(convert_{name}, value)"
+                if origin is not list:
+                    _many = f"{origin.__name__}({_many})"
+            elif if_nested_dataclass and origin and origin == dict:
+                many_prologue.append(f"    nested_{name} = convert_{name}._deserialize_many_fn")
+                _many = f"dict(zip(value, nested_{name}(convert_{name}, value.values())))"
+            else:
+                _many = f"convert_{name}(value)"
+            if field.default is MISSING and field.default_factory is not MISSING:
+                many_prologue.append(f"    default_{name} = cls._schema['{name}'].default_factory")
+                _many_default = f"default_{name}()"
+            else:
+                _many_default = _default_value
+
+            many_deserializer.append(f"        value = data.get('{name}')")
+            many_deserializer.append(f"        instance.{name} = {_many} if value is not None else {_many_default}")
+
+            # The lazy deserializer keeps the nested data aside until the attribute is read for the first time.
+            if _nested:
+                lazy_deserializer.append(f"    if '{name}' in data and data['{name}'] is not None:")
+                lazy_deserializer.append(f"        pending['{name}'] = data['{name}']")
+                lazy_deserializer.append("    else:")
+                lazy_deserializer.append(f"        instance.{name} = {_default_value}")
+                materializer.append(f"    if name == '{name}':")
+                materializer.append(
+                    f"        return {_convert.replace('__src__', 'value').replace('__fn__', 'deserialize_lazy')}"
+                )
+            else:
+                lazy_deserializer.append(f"    instance.{name} = {_eager}")
 
         serializer.append("    return result")
         deserializer.append("    return cls(**result)")
+        if hasattr(cls, "__post_init__"):
+            many_deserializer.append("        instance.__post_init__()")
+        many_deserializer.append("        append(instance)")
+        many_deserializer.append("    return result")
+        lazy_deserializer.append("    instance._pending = pending or None")
+        if hasattr(cls, "__post_init__"):
+            lazy_deserializer.append("    instance.__post_init__()")
+        lazy_deserializer.append("    return instance")
+        materializer.append("    raise AttributeError(name)")
+
+        # The functions are compiled on their first call: compiling all of them for every model would take most
+        # of the package import time, while an application usually uses only a few models and functions.
+        sources: dict[str, list[str]] = {
+            "_serialize_fn": serializer,
+            "_deserialize_fn": deserializer,
+            "_deserialize_many_fn": many_prologue + many_deserializer,
+            "_lazy_deserialize_fn": lazy_deserializer,
+            "_materialize_fn": materializer,
+        }
+        for fn_name, source in sources.items():
+            setattr(cls, fn_name, _compile_on_first_call(cls, fn_name, "\n".join(source)))
+
+    def __getattr__(self, name: str) -> Any:
+        """Materialize the nested field of a lazily deserialized instance on the first access.
+
+        It's only called for the attributes which aren't set, i.e. the empty slots of the pending fields.
+        """
+        if name == "_pending":
+            raise AttributeError(name)
 
-        exec("\n".join(serializer), globals(), locals())  # noqa: S102
-        cls._serialize_fn = locals()["_serialize_fn"]
+        pending: dict[str, Any] | None = getattr(self, "_pending", None)
+        if not pending or name not in pending:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
-        exec("\n".join(deserializer), globals(), locals())  # noqa: S102
-        cls._deserialize_fn = locals()["_deserialize_fn"]
+        value = self.__class__._materialize_fn(self.__class__, name, pending.pop(name))
+        setattr(self, name, value)
+        return value
 
     def serialize(self) -> dict[str, Any]:
         """Serialize the dataclass into a dictionary with Python types.
@@ -112,6 +268,19 @@ class Serializable:
         """
         return self.__class__._serialize_fn(self)
 
+    def to_json(self, skip_none: bool = False) -> bytes:
+        """Serialize the dataclass into JSON, i.e. `orjson.dumps(instance.serialize())`.
+
+        Args:
+            skip_none: Whether to omit the None values of the dataclass and the nested ones, which makes the output
+                much smaller for partially filled models (e.g. partial responses).
+
+        Returns:
+            The UTF-8 encoded JSON object.
+        """
+        data = self.serialize()
+        return dumps(_drop_none(data) if skip_none else data, default=_json_default)
+
     @classmethod
     def deserialize(cls, data: dict[str, Any]):  # noqa: ANN206
         """Deserialize the dictionary into a dataclass with Python types.
@@ -124,6 +293,68 @@ class Serializable:
         """
         return cls._deserialize_fn(cls, data)
 
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]):  # noqa: ANN206
+        """Decode the JSON object into a dataclass.
+
+        With the `msgspec` codec backend (see `pyyoutube.utils.codec`) the JSON is decoded straight into the typed
+        fields, without the intermediate dictionaries. Otherwise, it's `deserialize(orjson.loads(data))`.
+
+        Args:
+            data: The JSON object, e.g. the API response body.
+
+        Returns:
+            An instance of the dataclass.
+        """
+        return decode(cls, data)
+
+    @classmethod
+    def deserialize_many(cls, items: Iterable[dict[str, Any]]) -> list:
+        """Deserialize the dictionaries of the same type (e.g. the `items` of a response) into dataclasses.
+
+        It gives the same result as calling `deserialize` for every item, but the field converters, the nested
+        classes and the defaults are resolved once for the whole batch, and the instances are filled directly.
+
+        Args:
+            items: The dictionaries to deserialize.
+
+        Returns:
+            A list of the dataclass instances.
+        """
+        return cls._deserialize_many_fn(cls, items)
+
+    @classmethod
+    def deserialize_lazy(cls, data: dict[str, Any]):  # noqa: ANN206
+        """Deserialize the dictionary into a dataclass, deferring the nested dataclasses until they're accessed.
+
+        The plain fields are converted right away, while the nested dataclasses (e.g. `Video.snippet`) keep
+        their data aside and are deserialized, lazily as well, the first time their attribute is read.
+        It's much cheaper than `deserialize` when only a few parts of a large response are used.
+
+        Args:
+            data: The dictionary to deserialize. It shouldn't be modified while the instance is in use.
+
+        Returns:
+            An instance of the dataclass.
+        """
+        return cls._lazy_deserialize_fn(cls, data)
+
+
+def _drop_none(value: Any) -> Any:
+    """Omit the None values of the serialized dictionaries, recursively."""
+    if isinstance(value, dict):
+        return {key: _drop_none(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_drop_none(item) for item in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """Convert the serialized values orjson doesn't support, i.e. the sets."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
 
 def performance_test() -> None:
     """Test the performance of the serialization and deserialization."""
@@ -178,6 +409,10 @@ def performance_test() -> None:
         ],
     )
 
+    # Warm up every path, the class functions are compiled on their first call and shouldn't count in the timings.
+    root.serialize()
+    asdict(root)
+
     start = perf_counter()
     for _ in range(100):
         root.serialize()
@@ -0,0 +1,40 @@
+"""SQLite database of the persistent stores, which keeps their data between restarts and shares it by processes."""
+
+import sqlite3
+import threading
+from os import PathLike
+from typing import Any, Optional, Union
+
+
+class SQLiteDatabase:
+    """A connection to the SQLite database of a store.
+
+    The connection is in autocommit mode and can be used by any thread (e.g. from `asyncio.to_thread`),
+    the statements are serialized by a lock.
+    """
+
+    def __init__(self, path: Union[str, PathLike[str]], schema: str):
+        """Open (and create if needed) the database and its table.
+
+        Args:
+            path: The database file path, or `:memory:`.
+            schema: The `CREATE TABLE IF NOT EXISTS` statement of the table of the store.
+        """
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self.execute(schema)
+
+    def fetchone(self, sql: str, parameters: tuple[Any, ...] = ()) -> Optional[tuple[Any, ...]]:
+        """Run the query and get its first row, or None if it has no rows."""
+        with self._lock:
+            return self.connection.execute(sql, parameters).fetchone()
+
+    def execute(self, sql: str, parameters: tuple[Any, ...] = ()) -> int:
+        """Run the statement and get the number of the modified rows."""
+        with self._lock:
+            return self.connection.execute(sql, parameters).rowcount
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self.connection.close()
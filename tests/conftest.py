@@ -1,6 +1,41 @@
+from collections.abc import AsyncIterator
+
 import pytest
+from aiohttp.test_utils import TestServer
+
+from pyyoutube import APIKeyAuthentication, Client
+from tests.fake_api import FakeClient, FakeYouTubeAPI
 
 
 @pytest.fixture(scope="session", autouse=True)
 def initialize_test_environment(request) -> None:  # noqa: ANN001
     """Initialize the test environment dependencies."""
+
+
+@pytest.fixture
+async def fake_api() -> AsyncIterator[FakeYouTubeAPI]:
+    """Run the fake YouTube Data API server."""
+    api = FakeYouTubeAPI()
+    server = TestServer(api.app)
+    await server.start_server()
+    api.url = str(server.make_url("/"))
+
+    yield api
+
+    await server.close()
+
+
+@pytest.fixture
+def fake_client() -> FakeClient:
+    """A client which replies to the resources without the HTTP requests."""
+    return FakeClient()
+
+
+@pytest.fixture
+async def client(fake_api: FakeYouTubeAPI) -> AsyncIterator[Client]:
+    """An API client connected to the fake YouTube Data API server."""
+    client = Client(APIKeyAuthentication(api_key="test-key"))
+    client.base_url = fake_api.url  # type: ignore
+
+    async with client:
+        yield client
@@ -0,0 +1,75 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from pyyoutube.export import ParquetExporter, arrow_schema, to_record_batch, write_parquet  # noqa: E402
+from pyyoutube.models import SearchListResponse, Video, VideoListResponse  # noqa: E402
+
+
+def make_page(*video_ids: str) -> VideoListResponse:
+    return VideoListResponse.deserialize(
+        {
+            "items": [
+                {
+                    "id": video_id,
+                    "snippet": {"title": f"Title {video_id}", "thumbnails": {"default": {"url": "url", "width": 120}}},
+                    "statistics": {"viewCount": "100"},
+                    "topicDetails": {"topicCategories": ["Music"]},
+                }
+                for video_id in video_ids
+            ]
+        }
+    )
+
+
+@pytest.mark.structure
+def test_arrow_schema():
+    schema = arrow_schema(VideoListResponse)
+
+    assert schema == arrow_schema(Video)
+    assert schema.field("id").type == pa.string()
+    assert schema.field("statistics").type.field("viewCount").type == pa.int64()
+    assert schema.field("snippet").type.field("thumbnails").type.field("default").type.field("width").type == pa.int64()
+    assert schema.field("snippet").type.field("tags").type == pa.list_(pa.string())
+    assert arrow_schema(SearchListResponse).field("id").type.field("videoId").type == pa.string()
+
+
+@pytest.mark.structure
+def test_to_record_batch():
+    batch = to_record_batch(make_page("a", "b"), arrow_schema(Video))
+
+    assert batch.num_rows == 2
+    assert batch.column("id").to_pylist() == ["a", "b"]
+    assert batch.column("statistics").to_pylist()[0]["viewCount"] == 100
+    assert batch.column("snippet").to_pylist()[1]["thumbnails"]["default"]["url"] == "url"
+
+
+@pytest.mark.structure
+def test_parquet_exporter(tmp_path: Path):
+    path = tmp_path / "videos.parquet"
+
+    with ParquetExporter(path, VideoListResponse) as exporter:
+        exporter.write(make_page("a", "b"))
+        exporter.write(make_page())
+        exporter.write(make_page("c"))
+
+    table = pq.read_table(path)
+    assert exporter.rows == 3
+    assert table.column("id").to_pylist() == ["a", "b", "c"]
+    assert table.column("topicDetails").to_pylist()[2]["topicCategories"] == ["Music"]
+
+
+@pytest.mark.structure
+async def test_write_parquet(tmp_path: Path):
+    async def pages() -> AsyncIterator[VideoListResponse]:
+        yield make_page("a")
+        yield make_page("b", "c")
+
+    rows = await write_parquet(pages(), tmp_path / "videos.parquet", VideoListResponse, compression="zstd")
+
+    assert rows == 3
+    assert pq.read_metadata(tmp_path / "videos.parquet").num_row_groups == 2
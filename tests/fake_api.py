@@ -0,0 +1,110 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any, Optional
+
+import orjson
+from aiohttp import web
+
+
+class FakeYouTubeAPI:
+    """An in-process fake of the YouTube Data API serving scripted responses."""
+
+    def __init__(self):
+        self.url: str = ""
+        self.delay: float = 0.0
+        self.requests: list[tuple[str, dict[str, str], dict[str, str]]] = []
+        self.responses: dict[str, list[tuple[int, Any, dict[str, str], float]]] = defaultdict(list)
+        self.handlers: dict[str, Callable[[dict[str, str]], Any]] = {}
+
+        self.app = web.Application()
+        self.app.router.add_get("/{path}", self.handle)
+
+    def add_response(
+        self,
+        path: str,
+        status: int = 200,
+        body: Any = None,
+        headers: Optional[dict[str, str]] = None,
+        delay: float = 0.0,
+    ) -> None:
+        """Queue a response for the path. Without queued responses an empty list response is returned."""
+        self.responses[path].append((status, body, headers or {}, delay))
+
+    def add_error(self, path: str, status: int, reason: str, headers: Optional[dict[str, str]] = None) -> None:
+        """Queue a YouTube Data API error response for the path."""
+        body = {"error": {"code": status, "errors": [{"message": reason, "domain": "youtube", "reason": reason}]}}
+        self.add_response(path, status=status, body=body, headers=headers)
+
+    def set_handler(self, path: str, handler: Callable[[dict[str, str]], Any]) -> None:
+        """Reply to the requests to the path with the body built from their query parameters."""
+        self.handlers[path] = handler
+
+    def requested(self, path: str) -> list[dict[str, str]]:
+        """Query parameters of the requests made to the path."""
+        return [params for request_path, params, _ in self.requests if request_path == path]
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Record the request and reply with the next queued response."""
+        path = request.match_info["path"]
+        self.requests.append((path, dict(request.query), dict(request.headers)))
+        await asyncio.sleep(self.delay)
+
+        if self.responses[path]:
+            status, body, headers, delay = self.responses[path].pop(0)
+            await asyncio.sleep(delay)
+        elif path in self.handlers:
+            status, body, headers = 200, self.handlers[path](dict(request.query)), {}
+        else:
+            status, body, headers = 200, {"kind": f"youtube#{path}", "etag": "etag", "items": []}, {}
+
+        if isinstance(body, BaseException):
+            # Drop the connection without any response.
+            request.transport.close()  # type: ignore
+            raise body
+
+        if status == 304:  # noqa: PLR2004
+            return web.Response(status=status, headers=headers)
+
+        data = body if isinstance(body, bytes) else orjson.dumps(body)
+        return web.Response(status=status, body=data, headers=headers, content_type="application/json")
+
+
+class FakeClient:
+    """A client which replies to the resources directly, without the HTTP requests.
+
+    The requests by IDs get an item for every ID except the `unknown` ones, in the reverse order to make sure the
+    results are re-ordered by the resource. The other requests get the pages of a list of `pages` pages.
+    """
+
+    def __init__(self, unknown: frozenset[str] = frozenset(), pages: int = 1, delay: float = 0.01):
+        self.unknown = unknown
+        self.pages = pages
+        self.delay = delay
+        self.requests: list[dict[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list(self, resource: type, path: str, params: dict[str, Any]) -> Any:
+        """Record the request and reply with the deserialized response."""
+        self.requests.append(params)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+        if "id" in params:
+            ids = [item_id for item_id in reversed(params["id"].split(",")) if item_id not in self.unknown]
+            return resource.deserialize({"kind": path, "etag": "", "items": [{"id": item_id} for item_id in ids]})
+
+        page = int(params.get("pageToken") or 0)
+        return resource.deserialize(
+            {
+                "kind": path,
+                "etag": str(page),
+                "nextPageToken": str(page + 1) if page + 1 < self.pages else None,
+                "pageInfo": {"totalResults": self.pages * 2, "resultsPerPage": 2},
+                "items": [{"id": f"{page}-{index}"} for index in range(2)],
+            }
+        )
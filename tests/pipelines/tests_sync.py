@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from pyyoutube import Client
+from pyyoutube.error import PyYouTubeIncorrectParamsError
+from pyyoutube.models import PlaylistItem
+from pyyoutube.pipelines import Checkpoint, MemoryCheckpointStore, UploadsSync
+from tests.fake_api import FakeYouTubeAPI
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Channel:
+    """A channel whose uploads can be changed between the syncs."""
+
+    def __init__(self, count: int):
+        self.uploads: list[tuple[str, str]] = []
+        self.count = 0
+        for _ in range(count):
+            self.upload()
+
+    def upload(self) -> str:
+        video_id = f"v{self.count}"
+        published_at = (START + timedelta(days=self.count)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.uploads.insert(0, (video_id, published_at))
+        self.count += 1
+        return video_id
+
+    def channels(self, params: dict[str, str]) -> dict:
+        channel = {"kind": "youtube#channel", "etag": "", "contentDetails": {"relatedPlaylists": {"uploads": "UU1"}}}
+        return {"kind": "youtube#channelListResponse", "etag": "", "items": [channel]}
+
+    def playlist_items(self, params: dict[str, str]) -> dict:
+        offset = int(params.get("pageToken", 0))
+        end = offset + int(params["maxResults"])
+        items = [
+            {
+                "kind": "youtube#playlistItem",
+                "etag": "",
+                "contentDetails": {"videoId": video_id, "videoPublishedAt": published_at},
+            }
+            for video_id, published_at in self.uploads[offset:end]
+        ]
+        next_page = str(end) if end < len(self.uploads) else None
+        return {"kind": "youtube#playlistItemListResponse", "etag": "", "nextPageToken": next_page, "items": items}
+
+    def videos(self, params: dict[str, str]) -> dict:
+        items = [{"kind": "youtube#video", "etag": "", "id": video_id} for video_id in params["id"].split(",")]
+        return {"kind": "youtube#videoListResponse", "etag": "", "items": items}
+
+    def serve(self, api: FakeYouTubeAPI) -> None:
+        api.set_handler("channels", self.channels)
+        api.set_handler("playlistItems", self.playlist_items)
+        api.set_handler("videos", self.videos)
+
+
+@pytest.mark.structure
+async def test_sync_reads_only_new_uploads(fake_api: FakeYouTubeAPI, client: Client, tmp_path: Path):
+    channel = Channel(120)
+    channel.serve(fake_api)
+
+    first = [video.id async for video in UploadsSync(client, tmp_path / "checkpoints.db").sync(for_handle="@channel")]
+    assert first == [video_id for video_id, _ in channel.uploads]
+    assert len(fake_api.requested("playlistItems")) == 3
+
+    # The checkpoints are kept between the runs, the channel isn't resolved again.
+    new = [channel.upload(), channel.upload()]
+    fake_api.requests.clear()
+    sync = UploadsSync(client, tmp_path / "checkpoints.db")
+    assert [video.id async for video in sync.sync(for_handle="@channel")] == new[::-1]
+    assert [path for path, _, _ in fake_api.requests] == ["playlistItems", "videos"]
+
+    fake_api.requests.clear()
+    assert [video async for video in sync.sync(for_handle="@channel")] == []
+    assert [path for path, _, _ in fake_api.requests] == ["playlistItems"]
+    assert sync.store.get("@channel") == Checkpoint("UU1", video_id="v121", published_at="2024-05-01T00:00:00Z")
+    sync.close()
+
+
+@pytest.mark.structure
+async def test_sync_after_checkpoint_video_is_deleted(fake_api: FakeYouTubeAPI, client: Client):
+    channel = Channel(3)
+    channel.serve(fake_api)
+    sync = UploadsSync(client, MemoryCheckpointStore())
+
+    assert len([video async for video in sync.sync(channel_id="UC1")]) == 3
+    channel.uploads.pop(0)
+    new = channel.upload()
+
+    assert [video.id async for video in sync.sync(channel_id="UC1")] == [new]
+    assert sync.store.get("UC1").video_id == new
+
+
+@pytest.mark.structure
+async def test_interrupted_sync_keeps_checkpoint(fake_api: FakeYouTubeAPI, client: Client):
+    channel = Channel(3)
+    channel.serve(fake_api)
+    sync = UploadsSync(client, MemoryCheckpointStore())
+
+    async for _ in sync.sync(channel_id="UC1"):
+        break
+    assert sync.store.get("UC1") is None
+
+    assert len([video async for video in sync.sync(channel_id="UC1")]) == 3
+    assert [video async for video in UploadsSync(client, MemoryCheckpointStore()).sync(channel_id="UC2")] != []
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        [video async for video in sync.sync()]
+
+
+@pytest.mark.structure
+def test_checkpoint_is_reached():
+    checkpoint = Checkpoint("UU1", video_id="v1", published_at="2024-05-01T10:00:00")
+
+    def item(video_id: str, published_at: str) -> PlaylistItem:
+        details = {"videoId": video_id, "videoPublishedAt": published_at}
+        return PlaylistItem.deserialize({"kind": "youtube#playlistItem", "etag": "", "contentDetails": details})
+
+    assert checkpoint.is_reached(item("v1", "2024-05-01T10:00:00Z"))
+    assert checkpoint.is_reached(item("v0", "2024-05-01T09:00:00Z"))
+    assert not checkpoint.is_reached(item("v2", "2024-05-01T11:00:00Z"))
@@ -0,0 +1,114 @@
+import pytest
+
+from pyyoutube import Client
+from pyyoutube.error import PyYouTubeIncorrectParamsError, PyYouTubeServiceError
+from pyyoutube.pipelines import get_uploads_playlist_id, harvest_uploads
+from tests.fake_api import FakeYouTubeAPI
+
+UPLOADS = [f"v{index}" for index in range(120)]
+PRIVATE = {"v7"}
+
+
+def channels(params: dict[str, str]) -> dict:
+    """The channel `UC1` with the handle `@channel`."""
+    found = params.get("id") == "UC1" or params.get("forHandle") == "@channel"
+    channel = {
+        "kind": "youtube#channel",
+        "etag": "",
+        "id": "UC1",
+        "contentDetails": {"relatedPlaylists": {"uploads": "UU1"}},
+    }
+    return {"kind": "youtube#channelListResponse", "etag": "", "items": [channel] if found else []}
+
+
+def playlist_items(params: dict[str, str]) -> dict:
+    """The uploads playlist, newest first, in pages of 50 items."""
+    offset = int(params.get("pageToken", 0))
+    end = offset + int(params["maxResults"])
+    items = [
+        {"kind": "youtube#playlistItem", "etag": "", "id": f"item-{video_id}", "contentDetails": {"videoId": video_id}}
+        for video_id in UPLOADS[offset:end]
+    ]
+    next_page = str(end) if end < len(UPLOADS) else None
+    return {"kind": "youtube#playlistItemListResponse", "etag": "", "nextPageToken": next_page, "items": items}
+
+
+def videos(params: dict[str, str]) -> dict:
+    """The requested public videos, in an arbitrary order."""
+    ids = [video_id for video_id in params["id"].split(",") if video_id not in PRIVATE]
+    items = [{"kind": "youtube#video", "etag": "", "id": video_id} for video_id in reversed(ids)]
+    return {"kind": "youtube#videoListResponse", "etag": "", "items": items}
+
+
+@pytest.fixture
+def channel_api(fake_api: FakeYouTubeAPI) -> FakeYouTubeAPI:
+    fake_api.set_handler("channels", channels)
+    fake_api.set_handler("playlistItems", playlist_items)
+    fake_api.set_handler("videos", videos)
+    return fake_api
+
+
+@pytest.mark.structure
+async def test_harvest_uploads(channel_api: FakeYouTubeAPI, client: Client):
+    missing: list[str] = []
+    harvested = [video.id async for video in harvest_uploads(client, for_handle="@channel", missing=missing)]
+
+    assert harvested == [video_id for video_id in UPLOADS if video_id not in PRIVATE]
+    assert missing == ["v7"]
+    assert channel_api.requested("channels")[0]["part"] == "contentDetails"
+    assert [params["playlistId"] for params in channel_api.requested("playlistItems")] == ["UU1"] * 3
+    assert [len(params["id"].split(",")) for params in channel_api.requested("videos")] == [50, 50, 20]
+    assert channel_api.requested("videos")[0]["part"] == "contentDetails,snippet,statistics"
+
+
+@pytest.mark.structure
+async def test_harvest_uploads_until(channel_api: FakeYouTubeAPI, client: Client):
+    harvested = [
+        video.id
+        async for video in harvest_uploads(
+            client, channel_id="UC1", until=lambda item: item.contentDetails.videoId == "v60", parts="id"
+        )
+    ]
+
+    assert harvested == [video_id for video_id in UPLOADS[:60] if video_id not in PRIVATE]
+    assert [len(params["id"].split(",")) for params in channel_api.requested("videos")] == [50, 10]
+
+
+@pytest.mark.structure
+async def test_harvest_uploads_errors(channel_api: FakeYouTubeAPI, client: Client):
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        [video async for video in harvest_uploads(client, channel_id="UC2")]
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        [video async for video in harvest_uploads(client, channel_id="UC1", for_handle="@channel")]
+
+    channel_api.add_error("playlistItems", 404, "playlistNotFound")
+    with pytest.raises(PyYouTubeServiceError):
+        [video async for video in harvest_uploads(client, channel_id="UC1")]
+
+
+@pytest.mark.structure
+async def test_harvest_uploads_yields_batches_read_before_error(channel_api: FakeYouTubeAPI, client: Client):
+    for page_token in ("0", "50"):
+        channel_api.add_response("playlistItems", body=playlist_items({"maxResults": "50", "pageToken": page_token}))
+    channel_api.add_error("playlistItems", 404, "playlistNotFound")
+    # The reading fails while the first batch is retrieved, the second batch is read by then.
+    channel_api.add_response("videos", body=videos({"id": ",".join(UPLOADS[:50])}), delay=0.1)
+    harvested: list[str] = []
+
+    with pytest.raises(PyYouTubeServiceError):
+        async for video in harvest_uploads(client, playlist_id="UU1"):
+            harvested.append(video.id)
+
+    assert harvested == [video_id for video_id in UPLOADS[:100] if video_id not in PRIVATE]
+
+
+@pytest.mark.structure
+@pytest.mark.parametrize("response_format", ["json", "bytes"])
+async def test_harvest_uploads_requires_models(channel_api: FakeYouTubeAPI, client: Client, response_format: str):
+    client.response_format = response_format  # type: ignore
+
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        [video async for video in harvest_uploads(client, channel_id="UC1")]
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        await get_uploads_playlist_id(client, channel_id="UC1")
+    assert not channel_api.requests
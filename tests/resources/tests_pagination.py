@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from pyyoutube.models import PlaylistItemListResponse
+from pyyoutube.resources import PlaylistItemsResource
+from tests.fake_api import FakeClient
+
+
+@pytest.mark.structure
+async def test_iter_pages_follows_next_page_token(fake_client: FakeClient):
+    fake_client.pages = 3
+    resource = PlaylistItemsResource(fake_client)
+
+    pages = [page async for page in resource.iter_pages(playlist_id="PL")]
+
+    assert [page.etag for page in pages] == ["0", "1", "2"]
+    assert all(isinstance(page, PlaylistItemListResponse) for page in pages)
+    assert pages[0].pageInfo.totalResults == 6
+    assert [params.get("pageToken") for params in fake_client.requests] == [None, "1", "2"]
+
+
+@pytest.mark.structure
+async def test_iter_items(fake_client: FakeClient):
+    fake_client.pages = 2
+    resource = PlaylistItemsResource(fake_client)
+
+    items = [item.id async for item in resource.iter_items(playlist_id="PL")]
+
+    assert items == ["0-0", "0-1", "1-0", "1-1"]
+
+
+@pytest.mark.structure
+async def test_iter_pages_max_pages(fake_client: FakeClient):
+    fake_client.pages = 5
+    resource = PlaylistItemsResource(fake_client)
+
+    pages = [page async for page in resource.iter_pages(playlist_id="PL", max_pages=2)]
+
+    assert len(pages) == 2
+    assert [params.get("pageToken") for params in fake_client.requests] == [None, "1"]
+
+
+@pytest.mark.structure
+async def test_iter_pages_prefetches_next_page(fake_client: FakeClient):
+    fake_client.pages = 3
+    resource = PlaylistItemsResource(fake_client)
+
+    iterator = resource.iter_pages(playlist_id="PL")
+    await iterator.__anext__()
+    await asyncio.sleep(0)
+
+    # The second page is requested while the caller still holds the first one.
+    assert [params.get("pageToken") for params in fake_client.requests] == [None, "1"]
+    await iterator.aclose()
+
+
+@pytest.mark.structure
+async def test_iter_pages_without_prefetch(fake_client: FakeClient):
+    fake_client.pages = 3
+    resource = PlaylistItemsResource(fake_client)
+
+    iterator = resource.iter_pages(playlist_id="PL", prefetch=False)
+    await iterator.__anext__()
+    await asyncio.sleep(0)
+
+    assert [params.get("pageToken") for params in fake_client.requests] == [None]
+    await iterator.aclose()
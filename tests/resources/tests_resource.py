@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from pyyoutube.error import PyYouTubeIncorrectParamsError
+from pyyoutube.resources import ChannelsResource, CommentThreadsResource, I18nRegionsResource
+from tests.fake_api import FakeClient
+
+
+@pytest.mark.structure
+async def test_get_many_reports_missing_ids(fake_client: FakeClient):
+    fake_client.unknown = frozenset({"c1", "c3"})
+    resource = ChannelsResource(fake_client)
+
+    result = await resource.get_many(["c0", "c1", "c2", "c3"], parts="id")
+
+    assert [channel.id for channel in result.items] == ["c0", "c2"]
+    assert result.missing == ["c1", "c3"]
+    assert fake_client.requests[0]["part"] == "id"
+
+
+@pytest.mark.structure
+async def test_get_many_bounds_concurrency(fake_client: FakeClient):
+    resource = CommentThreadsResource(fake_client)
+
+    result = await resource.get_many([f"t{index}" for index in range(500)], concurrency=2)
+
+    assert len(result.items) == 500
+    assert not result.missing
+    assert len(fake_client.requests) == 10
+    assert fake_client.max_in_flight == 2
+
+
+@pytest.mark.structure
+async def test_get_many_not_supported(fake_client: FakeClient):
+    resource = I18nRegionsResource(fake_client)
+
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        await resource.get_many(["US"])
+
+
+@pytest.mark.structure
+@pytest.mark.parametrize("response_format", ["json", "bytes"])
+async def test_helpers_require_models(response_format: str, fake_client: FakeClient):
+    fake_client.response_format = response_format  # type: ignore
+    resource = ChannelsResource(fake_client)
+
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        await resource.get("c0")
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        await resource.get_many(["c0"])
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        [page async for page in resource.iter_pages(channel_id="c0")]
+    assert not fake_client.requests
+
+
+@pytest.mark.structure
+async def test_get_coalesces_concurrent_lookups(fake_client: FakeClient):
+    fake_client.unknown = frozenset({"c2"})
+    resource = ChannelsResource(fake_client)
+
+    channels = await asyncio.gather(*(resource.get(f"c{index % 3}", parts="id") for index in range(30)))
+
+    assert [channel.id if channel else None for channel in channels[:3]] == ["c0", "c1", None]
+    assert len(fake_client.requests) == 1
+    assert fake_client.requests[0]["id"] == "c0,c1,c2"
+
+
+@pytest.mark.structure
+async def test_get_splits_batches_by_size_and_arguments(fake_client: FakeClient):
+    resource = ChannelsResource(fake_client)
+
+    lookups = [resource.get(f"c{index}") for index in range(60)]
+    lookups.append(resource.get("c0", parts="id"))
+    channels = await asyncio.gather(*lookups)
+
+    assert all(channel is not None for channel in channels)
+    assert sorted(len(request["id"].split(",")) for request in fake_client.requests) == [1, 10, 50]
+    assert not resource._loaders
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyyoutube import Client
+from pyyoutube.resources.search import SearchWindow
+from tests.fake_api import FakeYouTubeAPI
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+VIDEOS = {f"v{index}": START + timedelta(days=9 * index) for index in range(40)}
+PAGE_SIZE = 5
+REACHABLE = 10
+
+
+def search(params: dict[str, str]) -> dict:
+    """Search the videos published in the window, the pagination stops after `REACHABLE` results."""
+    after = datetime.fromisoformat(params["publishedAfter"].replace("Z", "+00:00"))
+    before = datetime.fromisoformat(params["publishedBefore"].replace("Z", "+00:00"))
+    found = [video_id for video_id, published_at in VIDEOS.items() if after <= published_at <= before]
+
+    offset = int(params.get("pageToken", 0))
+    end = offset + PAGE_SIZE
+    return {
+        "kind": "youtube#searchListResponse",
+        "etag": "",
+        "nextPageToken": str(end) if end < min(len(found), REACHABLE) else None,
+        "pageInfo": {"totalResults": len(found), "resultsPerPage": PAGE_SIZE},
+        "items": [
+            {"kind": "youtube#searchResult", "etag": "", "id": {"kind": "youtube#video", "videoId": video_id}}
+            for video_id in found[offset:end]
+        ],
+    }
+
+
+@pytest.mark.structure
+async def test_search_crawl_splits_windows(fake_api: FakeYouTubeAPI, client: Client):
+    fake_api.set_handler("search", search)
+
+    results = [
+        item
+        async for item in client.search.crawl(
+            START, START + timedelta(days=360), reachable_results=REACHABLE, q="cats", concurrency=3
+        )
+    ]
+
+    assert sorted(item.id.videoId for item in results) == sorted(VIDEOS)
+    requested = fake_api.requested("search")
+    assert all(params["type"] == "video" and params["q"] == "cats" for params in requested)
+    assert requested[0]["publishedAfter"] == "2024-01-01T00:00:00Z"
+    assert requested[0]["publishedBefore"] == "2024-12-26T00:00:00Z"
+
+
+@pytest.mark.structure
+async def test_search_crawl_accepts_naive_times(fake_api: FakeYouTubeAPI, client: Client):
+    fake_api.set_handler("search", search)
+    published_after = datetime(2024, 1, 1)  # noqa: DTZ001
+    published_before = (START + timedelta(days=360)).astimezone(timezone(timedelta(hours=2)))
+
+    results = [item async for item in client.search.crawl(published_after, published_before, reachable_results=REACHABLE)]
+
+    assert sorted(item.id.videoId for item in results) == sorted(VIDEOS)
+    assert fake_api.requested("search")[0]["publishedAfter"] == "2024-01-01T00:00:00Z"
+
+
+@pytest.mark.structure
+async def test_search_crawl_stops_at_quota_budget(fake_api: FakeYouTubeAPI, client: Client):
+    fake_api.set_handler("search", search)
+    skipped: list[SearchWindow] = []
+
+    results = [
+        item
+        async for item in client.search.crawl(
+            START, START + timedelta(days=360), quota_budget=300, reachable_results=REACHABLE, skipped=skipped
+        )
+    ]
+
+    assert len(fake_api.requested("search")) == 3
+    assert 0 < len(results) < len(VIDEOS)
+    assert skipped
+    assert all(window.published_after >= START for window in skipped)
+
+
+@pytest.mark.structure
+def test_search_window_split():
+    window = SearchWindow(START, START + timedelta(days=2), page_token="CAUQAA")  # noqa: S106
+
+    assert window.split() == (
+        SearchWindow(START, START + timedelta(days=1)),
+        SearchWindow(START + timedelta(days=1), START + timedelta(days=2)),
+    )
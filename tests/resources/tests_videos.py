@@ -0,0 +1,40 @@
+import pytest
+
+from pyyoutube.models import VideoListResponse
+from pyyoutube.resources import VideosResource
+from pyyoutube.utils import enf_id_chunks
+from tests.fake_api import FakeClient
+
+
+@pytest.mark.structure
+def test_enf_id_chunks():
+    assert enf_id_chunks("video_ids", "a, b,a,,c", chunk_size=2) == [["a", "b"], ["c"]]
+    assert enf_id_chunks("video_ids", (str(index) for index in range(120))) == [
+        [str(index) for index in range(50)],
+        [str(index) for index in range(50, 100)],
+        [str(index) for index in range(100, 120)],
+    ]
+    assert enf_id_chunks("video_ids", []) == []
+
+
+@pytest.mark.structure
+async def test_list_many_chunks_and_merges(fake_client: FakeClient):
+    resource = VideosResource(fake_client)
+    video_ids = [f"v{index}" for index in range(120)] + ["v0", "v1"]
+
+    response = await resource.list_many(video_ids)
+
+    assert isinstance(response, VideoListResponse)
+    assert [video.id for video in response.items] == [f"v{index}" for index in range(120)]
+    assert [len(params["id"].split(",")) for params in fake_client.requests] == [50, 50, 20]
+    assert fake_client.max_in_flight == 3
+
+
+@pytest.mark.structure
+async def test_iter_many_keeps_input_order_and_skips_unknown(fake_client: FakeClient):
+    fake_client.unknown = frozenset({"b"})
+    resource = VideosResource(fake_client)
+
+    ids = [video.id async for video in resource.iter_many(["c", "b", "a"])]
+
+    assert ids == ["c", "a"]
@@ -0,0 +1,68 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyyoutube.models import Video, VideoListResponse  # noqa: E402
+from pyyoutube.tables import MISSING_VALUE, VideoTable  # noqa: E402
+
+
+def make_item(video_id: str, views: int, likes: int | None = 10, duration: str = "PT1M5S") -> dict:
+    statistics = {"viewCount": str(views), "commentCount": "5"}
+    if likes is not None:
+        statistics["likeCount"] = str(likes)
+    return {
+        "kind": "youtube#video",
+        "etag": "",
+        "id": video_id,
+        "snippet": {"title": f"Title {video_id}", "channelId": "c1", "publishedAt": "2024-01-01T10:00:00Z"},
+        "contentDetails": {"duration": duration},
+        "statistics": statistics,
+    }
+
+
+ITEMS = [make_item("a", 100), make_item("b", 1000, likes=None), make_item("c", 10, duration="PT1H"), make_item("d", 0)]
+
+
+@pytest.mark.structure
+def test_video_table_from_raw_items_and_models():
+    raw = VideoTable.from_responses([{"items": ITEMS[:2]}, {"items": ITEMS[2:]}])
+    models = VideoTable.from_responses([VideoListResponse.deserialize({"items": ITEMS})])
+
+    for table in (raw, models):
+        assert len(table) == 4
+        assert table.id.tolist() == ["a", "b", "c", "d"]
+        assert table.title[0] == "Title a"
+        assert table.view_count.dtype == np.int64
+        assert table.like_count.tolist() == [10, MISSING_VALUE, 10, 10]
+        assert table.duration.dtype == np.int32
+        assert table.duration.tolist() == [65, 65, 3600, 65]
+        assert table.published_at[0] == np.datetime64("2024-01-01T10:00:00")
+
+    sparse = VideoTable.from_items([Video.deserialize({"id": "x"}), {"id": "y"}])
+    assert sparse.view_count.tolist() == [MISSING_VALUE, MISSING_VALUE]
+    assert np.isnat(sparse.published_at).all()
+    assert len(VideoTable.from_items([])) == 0
+
+
+@pytest.mark.structure
+def test_video_table_filter_sort_top_k():
+    table = VideoTable.from_items(ITEMS)
+
+    assert table.filter(table.view_count >= 100).id.tolist() == ["a", "b"]
+    assert table[table.duration > 60].id.tolist() == ["a", "b", "c", "d"]
+    assert table.sort("view_count").id.tolist() == ["d", "c", "a", "b"]
+    assert table.sort("view_count", descending=True).id.tolist() == ["b", "a", "c", "d"]
+    assert table.top_k("view_count", 2).id.tolist() == ["b", "a"]
+    assert table.top_k("view_count", 10).id.tolist() == ["b", "a", "c", "d"]
+    assert len(table.top_k("view_count", 0)) == 0
+    assert VideoTable.concat([table[:1], table[3:]]).id.tolist() == ["a", "d"]
+
+
+@pytest.mark.structure
+def test_video_table_engagement_rate():
+    rates = VideoTable.from_items(ITEMS).engagement_rate()
+
+    assert rates[0] == pytest.approx(0.15)
+    assert np.isnan(rates[1])
+    assert rates[2] == pytest.approx(1.5)
+    assert np.isnan(rates[3])
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from pyyoutube import Client
+from pyyoutube.models import ChannelListResponse
+from pyyoutube.utils.params_checker import canonical_request_key, enf_parts
+from tests.fake_api import FakeYouTubeAPI
+
+
+@pytest.mark.structure
+def test_enf_parts_is_deterministic():
+    assert enf_parts("videos", "statistics, id,snippet") == "id,snippet,statistics"
+    assert enf_parts("videos", ["snippet", "statistics", "id"]) == "id,snippet,statistics"
+    assert enf_parts("channels", None) == enf_parts("channels", None)
+
+
+@pytest.mark.structure
+def test_canonical_request_key():
+    assert canonical_request_key("videos", {"id": "a", "part": "id", "hl": None}) == canonical_request_key(
+        "videos", {"part": "id", "id": "a"}
+    )
+    assert canonical_request_key("videos", {"id": "a"}) != canonical_request_key("videos", {"id": "b"})
+
+
+@pytest.mark.structure
+async def test_list_deduplicates_concurrent_requests(fake_api: FakeYouTubeAPI, client: Client):
+    fake_api.delay = 0.05
+
+    responses = await asyncio.gather(
+        *(client.channels.list(channel_id="c1", parts=["snippet", "id"]) for _ in range(10)),
+        client.channels.list(channel_id="c1", parts="id,snippet"),
+        client.channels.list(channel_id="c2", parts="id,snippet"),
+    )
+
+    assert all(isinstance(response, ChannelListResponse) for response in responses)
+    assert all(response is responses[0] for response in responses[:11])
+    assert len(fake_api.requested("channels")) == 2
+    assert fake_api.requested("channels")[0]["key"] == "test-key"
+
+
+@pytest.mark.structure
+async def test_list_without_deduplication(fake_api: FakeYouTubeAPI, client: Client):
+    fake_api.delay = 0.05
+    client.deduplicate_requests = False
+
+    await asyncio.gather(*(client.channels.list(channel_id="c1") for _ in range(3)))
+
+    assert len(fake_api.requested("channels")) == 3
+
+
+@pytest.mark.structure
+async def test_list_sends_fields_selector(fake_api: FakeYouTubeAPI, client: Client):
+    await client.videos.list(video_id="v1", parts="statistics", fields="items(id,statistics)")
+
+    assert fake_api.requested("videos")[0]["fields"] == "items(id,statistics)"
+    await client.channels.list(channel_id="c1")
+    assert "fields" not in fake_api.requested("channels")[0]
+
+
+@pytest.mark.structure
+async def test_list_raw_response_formats(fake_api: FakeYouTubeAPI, client: Client):
+    body = b'{"kind":"youtube#channelListResponse","etag":"etag","items":[{"kind":"youtube#channel","id":"c1"}]}'
+    fake_api.add_response("channels", 200, body)
+    fake_api.add_response("channels", 200, body)
+
+    raw = await client.list(ChannelListResponse, "channels", {"id": "c1"}, response_format="bytes")
+    assert raw == body
+
+    data = await client.list(ChannelListResponse, "channels", {"id": "c1"}, response_format="json")
+    assert data["items"][0]["id"] == "c1"
+
+
+@pytest.mark.structure
+async def test_client_default_response_format(fake_api: FakeYouTubeAPI, client: Client):
+    client.response_format = "json"
+
+    data = await client.channels.list(channel_id="c1")
+
+    assert data == {"kind": "youtube#channels", "etag": "etag", "items": []}
+    assert isinstance(await client.channels.list(channel_id="c1", parts="id"), dict)
+    assert isinstance(await client.list(ChannelListResponse, "channels", {}, response_format="model"), ChannelListResponse)
+
+
+@pytest.mark.structure
+async def test_list_lazy_response_format(fake_api: FakeYouTubeAPI, client: Client):
+    body = {"kind": "youtube#videoListResponse", "items": [{"id": "v1", "statistics": {"viewCount": "10"}}]}
+    fake_api.add_response("videos", 200, body)
+    client.response_format = "lazy"
+
+    response = await client.videos.list(video_id="v1")
+
+    assert response.items[0].id == "v1"
+    assert "statistics" in response.items[0]._pending
+    assert response.items[0].statistics.viewCount == 10
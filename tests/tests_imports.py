@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from statistics import median
+
+import pytest
+
+import pyyoutube
+import pyyoutube.models
+import pyyoutube.resources
+from pyyoutube import APIKeyAuthentication, Client
+
+IMPORT_TIME_LIMIT = 0.2
+"""The limit of the import time of the client and a model in seconds. It takes about 0.07 s with the model functions
+compiled on their first call, and about 0.3 s when they're compiled at import time."""
+
+
+def imported_modules(code: str) -> set[str]:
+    """Run the code in a fresh interpreter and collect the modules reported by `-X importtime`."""
+    command = [sys.executable, "-X", "importtime", "-c", code]
+    result = subprocess.run(command, capture_output=True, check=True, text=True)  # noqa: S603
+    return {line.rsplit("|", 1)[1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+@pytest.mark.structure
+def test_imports_only_used_resources():
+    """Test that a client calling only `videos.list` doesn't import the other resources and models."""
+    modules = imported_modules(
+        "from pyyoutube import APIKeyAuthentication, Client\n"
+        "client = Client(auth=APIKeyAuthentication(api_key='key'))\n"
+        "client.videos.list\n"
+    )
+
+    assert {"pyyoutube.client", "pyyoutube.resources.videos", "pyyoutube.models.video"} <= modules
+    for name in ("subscription", "member", "caption", "channel", "search_result"):
+        assert f"pyyoutube.models.{name}" not in modules
+    for name in ("subscriptions", "members", "captions", "video_categories"):
+        assert f"pyyoutube.resources.{name}" not in modules
+
+
+@pytest.mark.structure
+def test_import_time():
+    """Test that importing the client and a model stays fast. The dependencies are imported beforehand."""
+    code = (
+        "from time import perf_counter\n"
+        "import aiohttp, orjson\n"
+        "start = perf_counter()\n"
+        "from pyyoutube import Client\n"
+        "from pyyoutube.models import VideoListResponse\n"
+        "print(perf_counter() - start)\n"
+    )
+    command = [sys.executable, "-c", code]
+    times = [float(subprocess.run(command, capture_output=True, check=True, text=True).stdout) for _ in range(3)]  # noqa: S603
+
+    assert median(times) < IMPORT_TIME_LIMIT
+
+
+@pytest.mark.structure
+def test_imports_models_without_client():
+    """Test that importing a model doesn't import the HTTP client."""
+    modules = imported_modules("from pyyoutube.models import VideoListResponse")
+
+    assert "pyyoutube.models.video" in modules
+    assert "pyyoutube.client" not in modules
+    assert "aiohttp" not in modules
+
+
+@pytest.mark.structure
+def test_lazy_attributes():
+    """Test the lazily imported attributes of the packages and the client."""
+    assert "Client" in dir(pyyoutube)
+    assert "VideoListResponse" in dir(pyyoutube.models)
+    assert pyyoutube.models.Thumbnails.__module__ == "pyyoutube.models.common"
+    assert len(pyyoutube.resources.resources) == 16
+    with pytest.raises(AttributeError):
+        pyyoutube.models.Unknown  # noqa: B018
+
+    client = Client(auth=APIKeyAuthentication(api_key="key"))
+    assert client.videos is client.videos
+    assert isinstance(client.videos, pyyoutube.resources.VideosResource)
+    assert client.videos.categories is client.videos.categories
+    assert client.playlists.items._client is client
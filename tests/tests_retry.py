@@ -0,0 +1,156 @@
+from time import perf_counter
+
+import pytest
+from aiohttp import ClientTimeout
+
+from pyyoutube import APIKeyAuthentication, Client, RetryPolicy
+from pyyoutube.error import PyYouTubeQuotaReachedError, PyYouTubeServiceError
+from pyyoutube.models import VideoListResponse
+from pyyoutube.utils.retry import parse_retry_after
+from tests.fake_api import FakeYouTubeAPI
+
+
+@pytest.fixture
+def retrying_client(client: Client) -> Client:
+    client.retry = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.5)
+    return client
+
+
+@pytest.mark.structure
+def test_retry_policy_delays():
+    policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=5)
+
+    for attempt in range(9):
+        assert 0 <= policy.get_delay(attempt) <= min(5, 2**attempt)
+    assert policy.get_delay(9) is None
+    assert policy.get_delay(0, retry_after=3) == 3
+    assert policy.get_delay(0, retry_after=60) is None
+
+
+@pytest.mark.structure
+def test_retry_policy_never_retries_quota_errors():
+    policy = RetryPolicy(retry_statuses=frozenset({403}))
+
+    assert not policy.is_retryable(PyYouTubeQuotaReachedError(403, "quotaExceeded"))
+    assert policy.is_retryable(PyYouTubeServiceError(403, "forbidden"))
+    assert not policy.is_retryable(ValueError())
+
+
+@pytest.mark.structure
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+@pytest.mark.structure
+async def test_retries_server_errors(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    fake_api.add_error("videos", 503, "backendError")
+    fake_api.add_error("videos", 500, "backendError")
+
+    response = await retrying_client.videos.list(video_id="v1")
+
+    assert isinstance(response, VideoListResponse)
+    assert len(fake_api.requested("videos")) == 3
+
+
+@pytest.mark.structure
+async def test_gives_up_after_max_attempts(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    for _ in range(3):
+        fake_api.add_error("videos", 502, "badGateway")
+
+    with pytest.raises(PyYouTubeServiceError) as error:
+        await retrying_client.videos.list(video_id="v1")
+
+    assert error.value.status_code == 502
+    assert len(fake_api.requested("videos")) == 3
+
+
+@pytest.mark.structure
+async def test_does_not_retry_quota_errors(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    fake_api.add_error("videos", 403, "quotaExceeded")
+
+    with pytest.raises(PyYouTubeQuotaReachedError):
+        await retrying_client.videos.list(video_id="v1")
+
+    assert len(fake_api.requested("videos")) == 1
+
+
+@pytest.mark.structure
+async def test_does_not_retry_client_errors(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    fake_api.add_error("videos", 400, "badRequest")
+
+    with pytest.raises(PyYouTubeServiceError):
+        await retrying_client.videos.list(video_id="v1")
+
+    assert len(fake_api.requested("videos")) == 1
+
+
+@pytest.mark.structure
+async def test_retries_rate_limit_reasons(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    fake_api.add_error("videos", 403, "rateLimitExceeded")
+
+    await retrying_client.videos.list(video_id="v1")
+
+    assert len(fake_api.requested("videos")) == 2
+
+
+@pytest.mark.structure
+async def test_honors_retry_after(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    fake_api.add_error("videos", 429, "tooManyRequests", headers={"Retry-After": "0.2"})
+
+    start = perf_counter()
+    await retrying_client.videos.list(video_id="v1")
+
+    assert perf_counter() - start >= 0.2
+    assert len(fake_api.requested("videos")) == 2
+
+
+@pytest.mark.structure
+async def test_does_not_wait_for_too_long_retry_after(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    fake_api.add_error("videos", 429, "tooManyRequests", headers={"Retry-After": "3600"})
+
+    with pytest.raises(PyYouTubeServiceError) as error:
+        await retrying_client.videos.list(video_id="v1")
+
+    assert error.value.retry_after == 3600
+    assert len(fake_api.requested("videos")) == 1
+
+
+@pytest.mark.structure
+async def test_retries_connection_resets(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    fake_api.add_response("videos", body=ConnectionResetError())
+
+    response = await retrying_client.videos.list(video_id="v1")
+
+    assert isinstance(response, VideoListResponse)
+    assert len(fake_api.requested("videos")) == 2
+
+
+@pytest.mark.structure
+async def test_retries_timeouts(fake_api: FakeYouTubeAPI):
+    client = Client(
+        APIKeyAuthentication(api_key="test-key"),
+        timeout=ClientTimeout(total=0.1),
+        retry=RetryPolicy(base_delay=0.001),
+    )
+    client.base_url = fake_api.url  # type: ignore
+    fake_api.add_response("videos", delay=0.5)
+
+    async with client:
+        response = await client.videos.list(video_id="v1")
+
+    assert isinstance(response, VideoListResponse)
+    assert len(fake_api.requested("videos")) == 2
+
+
+@pytest.mark.structure
+async def test_retries_disabled(fake_api: FakeYouTubeAPI, retrying_client: Client):
+    retrying_client.retry = RetryPolicy(max_attempts=1)
+    fake_api.add_error("videos", 503, "backendError")
+
+    with pytest.raises(PyYouTubeServiceError):
+        await retrying_client.videos.list(video_id="v1")
+
+    assert len(fake_api.requested("videos")) == 1
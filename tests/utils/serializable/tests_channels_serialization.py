@@ -61,3 +61,18 @@ def test_channel_list_response_deserialization():
     assert deserialized.items[0].contentDetails.relatedPlaylists.uploads == "uploads"
     assert deserialized.items[0].statistics.viewCount == 1000
     assert deserialized.items[0].statistics.subscriberCount == 1000
+
+
+@pytest.mark.structure
+def test_channel_list_response_partial_deserialization():
+    """Test deserializing a partial response requested with `fields=items(statistics)`."""
+    deserialized = ChannelListResponse.deserialize({"items": [{"statistics": {"viewCount": "1000"}}]})
+
+    assert deserialized.kind is None
+    assert deserialized.etag is None
+    assert deserialized.items[0].id is None
+    assert deserialized.items[0].snippet is None
+    assert deserialized.items[0].statistics.viewCount == 1000
+    assert ChannelListResponse(items=[Channel(id="123456")]) == ChannelListResponse.deserialize(
+        {"items": [{"id": "123456"}]}
+    )
@@ -1,8 +1,11 @@
+import dataclasses
 from dataclasses import dataclass
 from typing import Optional
 
+import orjson
 import pytest
 
+from pyyoutube.models import Video, VideoListResponse, VideoSnippet
 from pyyoutube.utils import Serializable
 
 
@@ -205,3 +208,148 @@ def test_serializable_complex_types():
     assert deserialized.simple == ["a", "b", "c"]
     assert deserialized.simple_set == {"a", "b", "c"}
     assert deserialized.simple_tuple == ("a", "b", "c")
+
+
+@pytest.mark.structure
+def test_serializable_lazy_deserialization():
+    """Test that `deserialize_lazy` defers the nested dataclasses until they're accessed."""
+
+    @dataclass
+    class NestedSerializable(Serializable):
+        value: float
+
+    @dataclass
+    class LazySerializable(Serializable):
+        name: str
+        nested: NestedSerializable
+        items: list[NestedSerializable]
+        optional: Optional[NestedSerializable] = None
+        missing: Optional[NestedSerializable] = None
+
+    data = {"name": "Lazy", "nested": {"value": 1.0}, "items": [{"value": 2.0}], "optional": {"value": 3.0}}
+    deserialized = LazySerializable.deserialize_lazy(data)
+
+    assert deserialized.name == "Lazy"
+    assert set(deserialized._pending) == {"nested", "items", "optional"}
+
+    assert deserialized.optional == NestedSerializable(value=3.0)
+    assert deserialized.optional is deserialized.optional
+    assert set(deserialized._pending) == {"nested", "items"}
+
+    assert deserialized.missing is None
+    assert deserialized == LazySerializable.deserialize(data)
+    assert deserialized.serialize() == LazySerializable.deserialize(data).serialize()
+    assert not deserialized._pending
+
+    assert LazySerializable(name="Eager", nested=NestedSerializable(value=0.0), items=[]).optional is None
+
+
+@pytest.mark.structure
+def test_serializable_slots():
+    """Test that Serializable subclasses are slotted, including the inherited and the mixed-in ones."""
+    video = Video(kind="youtube#video", etag="", id="123456", snippet=VideoSnippet(title="Test"))
+
+    assert not hasattr(video, "__dict__")
+    assert not hasattr(video.snippet, "__dict__")
+    assert "snippet" in Video.__slots__
+    assert "id" not in Video.__slots__
+    with pytest.raises(AttributeError):
+        video.unknown = 1
+
+    fields = {field.name: field for field in dataclasses.fields(VideoListResponse)}
+    assert fields["nextPageToken"].default is None
+    assert fields["nextPageToken"].repr is False
+    assert VideoListResponse.deserialize({"items": [{"id": "123456"}]}).items[0].id == "123456"
+
+
+@pytest.mark.structure
+def test_serializable_to_json():
+    """Test the `to_json` method of the `Serializable` class."""
+
+    @dataclass
+    class NestedSerializable(Serializable):
+        value: Optional[float] = None
+
+    @dataclass
+    class JsonSerializable(Serializable):
+        name: str
+        nested: Optional[NestedSerializable] = None
+        items: Optional[list[NestedSerializable]] = None
+        mapping: Optional[dict[str, NestedSerializable]] = None
+        tags: Optional[set[str]] = None
+
+    test = JsonSerializable(
+        name="Json",
+        items=[NestedSerializable(value=1.0), NestedSerializable()],
+        mapping={"key": NestedSerializable(value=2.0)},
+        tags={"tag"},
+    )
+
+    assert orjson.loads(test.to_json()) == {
+        "name": "Json",
+        "nested": None,
+        "items": [{"value": 1.0}, {"value": None}],
+        "mapping": {"key": {"value": 2.0}},
+        "tags": ["tag"],
+    }
+    assert (
+        test.to_json(skip_none=True)
+        == b'{"name":"Json","items":[{"value":1.0},{}],"mapping":{"key":{"value":2.0}},"tags":["tag"]}'
+    )
+    assert JsonSerializable(name="Json").to_json() == orjson.dumps(JsonSerializable(name="Json").serialize())
+
+
+@pytest.mark.structure
+def test_serializable_deserialize_many():
+    """Test that `deserialize_many` gives the same instances as `deserialize` for every item."""
+
+    @dataclass
+    class NestedSerializable(Serializable):
+        value: Optional[float] = None
+
+    @dataclass
+    class BatchSerializable(Serializable):
+        name: str
+        count: int = 0
+        nested: Optional[NestedSerializable] = None
+        items: list[NestedSerializable] = dataclasses.field(default_factory=list)
+        mapping: Optional[dict[str, NestedSerializable]] = None
+        tags: Optional[set[str]] = None
+
+    data = [
+        {"name": "Full", "count": 1, "nested": {"value": 1.0}, "items": [{"value": 2.0}, {}], "tags": ["tag"]},
+        {"name": "Mapping", "mapping": {"key": {"value": 3.0}}, "items": None},
+        {"name": "Empty"},
+    ]
+
+    deserialized = BatchSerializable.deserialize_many(data)
+    assert deserialized == [BatchSerializable.deserialize(item) for item in data]
+    assert deserialized[0].items == [NestedSerializable(value=2.0), NestedSerializable()]
+    assert deserialized[1].mapping == {"key": NestedSerializable(value=3.0)}
+    assert deserialized[2].count == 0
+    assert deserialized[2].items == []
+    assert deserialized[1].items is not deserialized[2].items
+    assert BatchSerializable.deserialize_many([]) == []
+
+    # The `__post_init__` of the models is called as well.
+    videos = Video.deserialize_many([{"id": "123456", "topicDetails": {"relevantTopicIds": ["/m/04rlf"]}}])
+    assert videos[0].topicDetails.topicIds == ["/m/04rlf"]
+
+
+@pytest.mark.structure
+def test_serializable_compiles_on_first_call():
+    """Test that the class functions are compiled on their first call."""
+
+    @dataclass
+    class CompiledSerializable(Serializable):
+        name: str
+        nested: Optional[SerializableExample] = None
+
+    stub = CompiledSerializable.__dict__["_deserialize_fn"]
+    test = CompiledSerializable.deserialize({"name": "Compiled", "nested": {"name": "Nested", "age": 1}})
+
+    assert test == CompiledSerializable(name="Compiled", nested=SerializableExample(name="Nested", age=1))
+    assert CompiledSerializable.__dict__["_deserialize_fn"] is not stub
+    assert CompiledSerializable.__dict__["_serialize_fn"].__name__ == "stub"
+    assert test.serialize() == {"name": "Compiled", "nested": {"name": "Nested", "age": 1}}
+    assert CompiledSerializable.__dict__["_serialize_fn"].__name__ == "_serialize_fn"
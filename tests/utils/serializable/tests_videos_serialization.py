@@ -6,6 +6,7 @@ from pyyoutube.models import (
     Thumbnails,
     Video,
     VideoContentDetails,
+    VideoListResponse,
     VideoSnippet,
     VideoStatistics,
     VideoStatus,
@@ -128,3 +129,22 @@ def test_video_deserialization():
     assert deserialized.topicDetails.topicCategories == ["123456"]
 
     assert deserialized.player.embedHtml == ""
+
+
+@pytest.mark.structure
+def test_video_list_response_partial_deserialization():
+    """Test deserializing a partial response requested with `fields=items(id,statistics)`."""
+    data = {"items": [{"id": "123456", "statistics": {"viewCount": "1000"}}]}
+
+    deserialized = VideoListResponse.deserialize(data)
+    assert deserialized.kind is None
+    assert deserialized.items[0].id == "123456"
+    assert deserialized.items[0].snippet is None
+    assert deserialized.items[0].statistics.viewCount == 1000
+    assert deserialized.items[0].statistics.likeCount is None
+
+    serialized = deserialized.serialize()
+    assert serialized["items"][0]["snippet"] is None
+    assert serialized["items"][0]["statistics"]["viewCount"] == 1000
+
+    assert VideoListResponse.deserialize({"nextPageToken": "token"}).items == []
@@ -0,0 +1,72 @@
+from collections.abc import Iterator
+from typing import Any
+
+import orjson
+import pytest
+
+pytest.importorskip("msgspec")
+
+from pyyoutube.error import PyYouTubeIncorrectParamsError  # noqa: E402
+from pyyoutube.models import SearchListResponse, VideoListResponse  # noqa: E402
+from pyyoutube.utils import codec  # noqa: E402
+
+VIDEO = {
+    "kind": "youtube#video",
+    "etag": "etag",
+    "id": "dQw4w9WgXcQ",
+    "snippet": {
+        "publishedAt": "2009-10-25T06:57:33Z",
+        "title": "Title",
+        "thumbnails": {"default": {"url": "https://i.ytimg.com/vi/dQw4w9WgXcQ/default.jpg", "width": 120}},
+        "tags": ["tag"],
+    },
+    "contentDetails": {"duration": "PT3M33S", "contentRating": {"ytRating": "ytAgeRestricted"}},
+    "statistics": {"viewCount": "1500000000", "likeCount": "17000000"},
+    "topicDetails": {"relevantTopicIds": ["/m/04rlf"]},
+}
+
+
+@pytest.fixture
+def backend() -> Iterator[None]:
+    original = codec.get_backend()
+    yield
+    codec.set_backend(original)
+
+
+@pytest.mark.structure
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"kind": "youtube#videoListResponse", "pageInfo": {"totalResults": 2}, "items": [VIDEO, {"id": "partial"}]},
+        {"items": [{"id": "123456", "statistics": {"viewCount": 5}}]},
+        {"items": None},
+        {},
+    ],
+)
+def test_codec_decode(backend: None, data: dict[str, Any]):
+    """Test that both backends give the same models as `deserialize`."""
+    for name in ("msgspec", "orjson"):
+        codec.set_backend(name)
+        assert VideoListResponse.from_json(orjson.dumps(data)) == VideoListResponse.deserialize(data)
+
+    codec.set_backend("msgspec")
+    response = VideoListResponse.from_json(orjson.dumps({"items": [VIDEO]}))
+    assert response.items[0].statistics.viewCount == 1500000000
+    assert response.items[0].topicDetails.topicIds == ["/m/04rlf"]
+    assert response.items[0].snippet.thumbnails.default.width == 120
+
+
+@pytest.mark.structure
+def test_codec_fallback(backend: None):
+    """Test that the data which doesn't match the field types is decoded by `deserialize`."""
+    codec.set_backend("msgspec")
+
+    data = {"items": [{"id": {"kind": "youtube#video", "videoId": 123456}}]}
+    assert SearchListResponse.from_json(orjson.dumps(data)) == SearchListResponse.deserialize(data)
+    assert SearchListResponse.from_json(orjson.dumps(data)).items[0].id.videoId == "123456"
+
+    with pytest.raises(orjson.JSONDecodeError):
+        SearchListResponse.from_json(b"{")
+
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        codec.set_backend("json")
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+from pyyoutube import APIKeyAuthentication, Client
+from pyyoutube.models import VideoCategoryListResponse
+from pyyoutube.utils.etag_cache import ETagCache, MemoryETagStore, SQLiteETagStore
+from pyyoutube.utils.params_checker import canonical_request_key
+from tests.fake_api import FakeYouTubeAPI
+
+CATEGORIES = {
+    "kind": "youtube#videoCategoryListResponse",
+    "etag": "v1",
+    "items": [{"kind": "youtube#videoCategory", "etag": "", "id": "10", "snippet": {"title": "Music"}}],
+}
+
+
+@pytest.mark.structure
+async def test_client_revalidates_cached_responses(fake_api: FakeYouTubeAPI, tmp_path: Path):
+    client = Client(APIKeyAuthentication(api_key="key"), etag_cache=ETagCache(SQLiteETagStore(tmp_path / "etags.db")))
+    client.base_url = fake_api.url  # type: ignore
+    fake_api.add_response("videoCategories", body=CATEGORIES, headers={"ETag": '"v1"'})
+    for _ in range(3):
+        fake_api.add_response("videoCategories", status=304, headers={"ETag": '"v1"'})
+
+    params = {"part": "snippet", "regionCode": "US"}
+    async with client:
+        first = await client.list(VideoCategoryListResponse, "videoCategories", params)
+        second = await client.list(VideoCategoryListResponse, "videoCategories", params)
+        raw = await client.list(VideoCategoryListResponse, "videoCategories", params, response_format="json")
+        body = await client.list(VideoCategoryListResponse, "videoCategories", params, response_format="bytes")
+        await client.videos.list(video_id="v1")
+
+    assert second is first
+    assert first.items[0].snippet.title == "Music"
+    assert raw == CATEGORIES
+    assert isinstance(body, bytes)
+    assert client.etag_cache.hits == 3
+    assert client.etag_cache.misses == 1
+
+    conditions = [(path, headers.get("If-None-Match")) for path, _, headers in fake_api.requests]
+    assert conditions == [
+        ("videoCategories", None),
+        ("videoCategories", '"v1"'),
+        ("videoCategories", '"v1"'),
+        ("videoCategories", '"v1"'),
+        ("videos", None),
+    ]
+
+    # The conditional requests don't break the connection reuse.
+    assert client.connection_stats.created == 1
+    assert client.connection_stats.reused == 4
+
+    # The responses are kept by the persistent store.
+    cache = ETagCache(SQLiteETagStore(tmp_path / "etags.db"))
+    entry = cache.get(canonical_request_key(f"{fake_api.url}videoCategories", params))
+    assert entry is not None
+    assert entry.etag == '"v1"'
+    assert VideoCategoryListResponse.from_json(entry.body) == first
+
+
+@pytest.mark.structure
+async def test_client_updates_outdated_responses(fake_api: FakeYouTubeAPI):
+    client = Client(APIKeyAuthentication(api_key="key"), etag_cache=ETagCache())
+    client.base_url = fake_api.url  # type: ignore
+    fake_api.add_response("videoCategories", body=CATEGORIES, headers={"ETag": '"v1"'})
+    fake_api.add_response("videoCategories", body={**CATEGORIES, "items": []}, headers={"ETag": '"v2"'})
+    fake_api.add_response("videoCategories", status=304)
+
+    async with client:
+        first = await client.videos.categories.list(region_code="US")
+        second = await client.videos.categories.list(region_code="US")
+        third = await client.videos.categories.list(region_code="US")
+
+    assert len(first.items) == 1
+    assert second.items == []
+    assert third is second
+    assert [headers.get("If-None-Match") for _, _, headers in fake_api.requests] == [None, '"v1"', '"v2"']
+
+
+@pytest.mark.structure
+def test_etag_cache_evicts_least_recently_used():
+    store = MemoryETagStore()
+    cache = ETagCache(store, max_entries=2, resources=["videoCategories"])
+    cache.set("a", "1", b"{}")
+    cache.set("b", "2", b"{}")
+    assert cache.get("a") is not None
+    cache.set("c", "3", b"{}")
+
+    assert list(cache._entries) == ["a", "c"]
+    assert cache.get("b").etag == "2"
+    assert cache.is_cacheable("https://www.googleapis.com/youtube/v3/videoCategories")
+    assert not cache.is_cacheable("https://www.googleapis.com/youtube/v3/videos")
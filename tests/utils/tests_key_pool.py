@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyyoutube import APIKeyAuthentication, Client
+from pyyoutube.error import PyYouTubeQuotaReachedError
+from pyyoutube.utils.key_pool import APIKeyPool
+from tests.fake_api import FakeYouTubeAPI
+
+
+@pytest.mark.structure
+def test_key_pool_picks_healthiest_key():
+    pool = APIKeyPool(["a", "b"], daily_quota=150)
+
+    assert pool.acquire(100) == "a"
+    assert pool.acquire(1) == "b"
+    assert pool.acquire(100) == "b"
+    assert pool.acquire(1) == "a"
+
+
+@pytest.mark.structure
+def test_key_pool_rearms_keys_at_reset():
+    pool = APIKeyPool(["a", "b"], daily_quota=100)
+    pool.mark_exhausted("a")
+    pool.mark_exhausted("b")
+
+    with pytest.raises(PyYouTubeQuotaReachedError):
+        pool.acquire()
+
+    pool.reset_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    assert pool.available == ["a", "b"]
+    assert pool.keys["a"].quota_remaining == 100
+
+
+@pytest.mark.structure
+async def test_client_rotates_keys_on_quota_exceeded(fake_api: FakeYouTubeAPI):
+    client = Client(APIKeyAuthentication(api_keys=["first", "second"]))
+    client.base_url = fake_api.url  # type: ignore
+    fake_api.add_error("videos", 403, "quotaExceeded")
+
+    async with client:
+        await client.videos.list(video_id="v1")
+        await client.videos.list(video_id="v2")
+
+    assert [params["key"] for params in fake_api.requested("videos")] == ["first", "second", "second"]
+
+
+@pytest.mark.structure
+async def test_client_raises_when_all_keys_are_exhausted(fake_api: FakeYouTubeAPI):
+    client = Client(APIKeyAuthentication(api_key="first", api_keys=["second"]))
+    client.base_url = fake_api.url  # type: ignore
+    fake_api.add_error("videos", 403, "quotaExceeded")
+    fake_api.add_error("videos", 403, "quotaExceeded")
+
+    async with client:
+        with pytest.raises(PyYouTubeQuotaReachedError):
+            await client.videos.list(video_id="v1")
+        with pytest.raises(PyYouTubeQuotaReachedError):
+            await client.videos.list(video_id="v2")
+
+    assert len(fake_api.requested("videos")) == 2
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from pyyoutube.utils.loader import BatchLoader
+
+
+@pytest.mark.structure
+async def test_batch_loader_propagates_errors():
+    async def batch(keys: list[str]) -> dict[str, str]:
+        raise ValueError("broken batch")
+
+    loader = BatchLoader(batch)
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.structure
+async def test_batch_loader_waits_for_delay():
+    batches: list[list[str]] = []
+
+    async def batch(keys: list[str]) -> dict[str, str]:
+        batches.append(keys)
+        return {key: key.upper() for key in keys}
+
+    loader = BatchLoader(batch, max_delay=0.01)
+
+    async def delayed_load(key: str, delay: float) -> str:
+        await asyncio.sleep(delay)
+        return await loader.load(key)
+
+    results = await asyncio.gather(delayed_load("a", 0), delayed_load("b", 0.001), delayed_load("c", 0.05))
+
+    assert results == ["A", "B", "C"]
+    assert batches == [["a", "b"], ["c"]]
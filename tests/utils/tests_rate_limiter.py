@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+import pytest
+
+from pyyoutube import APIKeyAuthentication, Client, RateLimiter
+from pyyoutube.error import PyYouTubeIncorrectParamsError
+from pyyoutube.utils.quota import QUOTA_TIMEZONE, get_quota_cost, next_quota_reset
+from tests.fake_api import FakeYouTubeAPI
+
+
+@pytest.mark.structure
+def test_quota_costs():
+    assert get_quota_cost("search") == 100
+    assert get_quota_cost("https://www.googleapis.com/youtube/v3/videos") == 1
+    assert get_quota_cost("unknown") == 1
+
+
+@pytest.mark.structure
+def test_next_quota_reset():
+    now = datetime(2024, 7, 1, 6, 59, tzinfo=timezone.utc)  # 23:59 PDT on June 30
+    assert next_quota_reset(now) == datetime(2024, 7, 1, 0, 0, tzinfo=QUOTA_TIMEZONE)
+    assert next_quota_reset(now + timedelta(minutes=1)) == datetime(2024, 7, 2, 0, 0, tzinfo=QUOTA_TIMEZONE)
+
+
+@pytest.mark.structure
+async def test_rate_limiter_requests_per_second():
+    limiter = RateLimiter(requests_per_second=50, burst=5, daily_quota=None)
+
+    start = perf_counter()
+    await asyncio.gather(*(limiter.acquire("videos") for _ in range(15)))
+
+    # 5 requests are admitted at once, the other 10 at 50 requests per second.
+    assert perf_counter() - start >= 0.18
+    assert limiter.quota_used == 15
+
+
+@pytest.mark.structure
+async def test_rate_limiter_daily_quota():
+    limiter = RateLimiter(daily_quota=201)
+
+    await limiter.acquire("search")
+    await limiter.acquire("search")
+    await limiter.acquire("videos")
+    assert limiter.quota_remaining == 0
+    assert limiter.quota_used_by_endpoint == {"search": 200, "videos": 1}
+
+    # The next request waits for the quota reset instead of failing.
+    limiter.quota_reset_at = datetime.now(timezone.utc) + timedelta(seconds=0.1)
+    waiting = asyncio.ensure_future(limiter.acquire("videos"))
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    await waiting
+    assert limiter.quota_used == 1
+
+
+@pytest.mark.structure
+async def test_rate_limiter_rejects_requests_over_daily_quota():
+    limiter = RateLimiter(daily_quota=50)
+
+    # A search costs 100 units, waiting for the quota reset would never admit it.
+    with pytest.raises(PyYouTubeIncorrectParamsError):
+        await asyncio.wait_for(limiter.acquire("search"), timeout=1)
+
+    await limiter.acquire("videos")
+    assert limiter.quota_used == 1
+
+
+@pytest.mark.structure
+async def test_client_charges_rate_limiter(fake_api: FakeYouTubeAPI):
+    limiter = RateLimiter(daily_quota=None)
+    client = Client(APIKeyAuthentication(api_key="test-key"), rate_limiter=limiter)
+    client.base_url = fake_api.url  # type: ignore
+
+    async with client:
+        await client.search.list(q="python")
+        await client.videos.list(video_id="v1")
+
+    assert limiter.quota_used == 101
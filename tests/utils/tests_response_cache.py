@@ -0,0 +1,164 @@
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from pyyoutube import AccessTokenAuthentication, APIKeyAuthentication, Client
+from pyyoutube.models import ChannelListResponse
+from pyyoutube.utils.response_cache import (
+    LRUCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+from tests.fake_api import FakeYouTubeAPI
+
+CHANNELS = {
+    "kind": "youtube#channelListResponse",
+    "etag": "etag",
+    "items": [{"kind": "youtube#channel", "etag": "", "id": "UC1", "snippet": {"title": "Channel"}}],
+}
+
+
+class FakeRedis:
+    """The subset of `redis.asyncio.Redis` used by the backend."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[bytes, int]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.data.get(key, (None, 0))[0]
+
+    async def set(self, key: str, value: bytes, px: int) -> None:
+        self.data[key] = (value, px)
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+@pytest.mark.structure
+async def test_client_serves_repeated_requests_from_cache(fake_api: FakeYouTubeAPI):
+    cache = ResponseCache(LRUCacheBackend())
+    fake_api.add_response("channels", body=CHANNELS)
+
+    # Clients with different API keys share the cached responses.
+    responses = []
+    for api_key in ("first", "second"):
+        client = Client(APIKeyAuthentication(api_key=api_key), response_cache=cache)
+        client.base_url = fake_api.url  # type: ignore
+        async with client:
+            responses.append(await client.channels.list(channel_id="UC1", parts="snippet"))
+            responses.append(await client.channels.list(channel_id="UC1", parts=["snippet"]))
+
+    assert len(fake_api.requested("channels")) == 1
+    assert all(response.items[0].snippet.title == "Channel" for response in responses)
+    assert responses[0] is not responses[1]
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+@pytest.mark.structure
+async def test_client_requests_expired_and_uncached_responses(fake_api: FakeYouTubeAPI):
+    cache = ResponseCache(ttls={"videos": 0.05})
+    client = Client(APIKeyAuthentication(api_key="key"), response_cache=cache)
+    client.base_url = fake_api.url  # type: ignore
+
+    async with client:
+        await client.videos.list(video_id="v1")
+        await client.videos.list(video_id="v1")
+        await asyncio.sleep(0.06)
+        await client.videos.list(video_id="v1")
+        await client.channels.list(channel_id="UC1")
+        await client.channels.list(channel_id="UC1")
+
+    assert len(fake_api.requested("videos")) == 2
+    assert len(fake_api.requested("channels")) == 2
+
+
+@pytest.mark.structure
+async def test_client_doesnt_cache_private_responses(fake_api: FakeYouTubeAPI):
+    cache = ResponseCache()
+    params = {"part": "snippet", "id": "UC1"}
+    auth = AccessTokenAuthentication(access_token="token")  # noqa: S106
+
+    async with Client(APIKeyAuthentication(api_key="key"), response_cache=cache) as client:
+        client.base_url = fake_api.url  # type: ignore
+        for _ in range(2):
+            await client.list(ChannelListResponse, "channels", {"part": "snippet", "mine": "true"})
+
+    # The responses to the OAuth clients depend on the user, they're cached only on opt-in.
+    async with Client(auth, response_cache=cache) as client:
+        client.base_url = fake_api.url  # type: ignore
+        for _ in range(2):
+            await client.list(ChannelListResponse, "channels", params)
+
+    authorized_cache = ResponseCache(cache_authorized=True)
+    async with Client(auth, response_cache=authorized_cache) as client:
+        client.base_url = fake_api.url  # type: ignore
+        for _ in range(2):
+            await client.list(ChannelListResponse, "channels", params)
+
+    assert len(fake_api.requested("channels")) == 5
+    assert cache.hits == cache.misses == 0
+    assert authorized_cache.hits == 1
+
+
+@pytest.mark.structure
+def test_response_cache_ttls():
+    cache = ResponseCache()
+
+    assert cache.get_ttl("https://www.googleapis.com/youtube/v3/channels", {"part": "snippet"}) == 24 * 3600
+    assert cache.get_ttl("videos", {"part": "snippet,statistics"}) == 60
+    assert cache.get_ttl("videos", {"part": "snippet"}) == 3600
+    assert cache.get_ttl("search", {"part": "snippet"}) is None
+    assert cache.get_ttl("channels", {"part": "snippet", "mine": True}) is None
+    assert cache.get_ttl("videos", {"part": "snippet", "myRating": "like"}) is None
+    assert cache.get_ttl("subscriptions", {"part": "snippet", "onBehalfOfContentOwner": "owner"}) is None
+    assert cache.get_key("videos", {"id": "v1", "key": "secret", "part": "id"}) == "videos?id=v1&part=id"
+
+
+@pytest.mark.structure
+async def test_lru_backend_evicts_by_size():
+    backend = LRUCacheBackend(max_bytes=10)
+    await backend.set("a", b"aaaaaa", 60)
+    await backend.set("b", b"bbbb", 60)
+    assert await backend.get("a") == b"aaaaaa"
+
+    await backend.set("c", b"cccc", 60)
+    assert await backend.get("b") is None
+    assert await backend.get("a") == b"aaaaaa"
+    assert backend.size == 10
+
+    await backend.set("d", b"d" * 11, 60)
+    assert await backend.get("d") is None
+    assert len(backend) == 2
+
+
+@pytest.mark.structure
+async def test_sqlite_backend(tmp_path: Path):
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    await backend.set("a", b"a", 60)
+    await backend.set("b", b"b", -1)
+    await backend.close()
+
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    assert await backend.get("a") == b"a"
+    assert await backend.get("b") is None
+    assert backend.purge_expired() == 1
+
+    await backend.delete("a")
+    assert await backend.get("a") is None
+
+
+@pytest.mark.structure
+async def test_redis_backend():
+    redis = FakeRedis()
+    backend = RedisCacheBackend(redis)
+    await backend.set("videos?id=v1", b"{}", 1.5)
+
+    assert redis.data == {"pyyoutube:videos?id=v1": (b"{}", 1500)}
+    assert await backend.get("videos?id=v1") == b"{}"
+
+    await backend.delete("videos?id=v1")
+    assert await backend.get("videos?id=v1") is None
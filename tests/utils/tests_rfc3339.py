@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyyoutube.utils.rfc3339 import format_rfc3339, parse_rfc3339, to_utc
+
+
+@pytest.mark.structure
+def test_parse_rfc3339():
+    assert parse_rfc3339("2024-05-01T10:17:00Z") == datetime(2024, 5, 1, 10, 17, tzinfo=timezone.utc)
+    assert parse_rfc3339("2024-05-01T12:17:00+02:00") == datetime(2024, 5, 1, 10, 17, tzinfo=timezone.utc)
+    # Naive times are UTC, so they can be compared with the aware ones.
+    assert parse_rfc3339("2024-05-01T10:17:00") == parse_rfc3339("2024-05-01T10:17:00Z")
+    assert parse_rfc3339("yesterday") is None
+    assert parse_rfc3339(None) is None
+
+
+@pytest.mark.structure
+def test_format_rfc3339():
+    assert format_rfc3339(datetime(2024, 5, 1, 10, 17, 30, 500)) == "2024-05-01T10:17:30Z"  # noqa: DTZ001
+    assert format_rfc3339(datetime(2024, 5, 1, 12, tzinfo=timezone(timedelta(hours=2)))) == "2024-05-01T10:00:00Z"
+
+
+@pytest.mark.structure
+def test_to_utc():
+    moment = datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+
+    assert to_utc(datetime(2024, 5, 1, 10)) == moment  # noqa: DTZ001
+    assert to_utc(datetime(2024, 5, 1, 12, tzinfo=timezone(timedelta(hours=2)))).tzinfo == timezone.utc
+    assert to_utc(datetime(2024, 5, 1, 12, tzinfo=timezone(timedelta(hours=2)))) == moment
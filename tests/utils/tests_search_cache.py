@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyyoutube import APIKeyAuthentication, Client
+from pyyoutube.utils.response_cache import LRUCacheBackend
+from pyyoutube.utils.search_cache import SearchCache, round_time
+from tests.fake_api import FakeYouTubeAPI
+
+SEARCH = {
+    "kind": "youtube#searchListResponse",
+    "etag": "etag",
+    "items": [{"kind": "youtube#searchResult", "etag": "", "id": {"kind": "youtube#video", "videoId": "v1"}}],
+}
+
+
+@pytest.mark.structure
+async def test_client_serves_equivalent_searches_from_cache(fake_api: FakeYouTubeAPI):
+    cache = SearchCache(LRUCacheBackend(), granularity=timedelta(hours=1))
+    fake_api.add_response("search", body=SEARCH)
+
+    queries = [
+        {"q": "Python  Tutorial", "type": ["video", "channel"], "published_after": "2024-05-01T10:17:00Z"},
+        {"q": "python tutorial", "type": "channel,video", "published_after": "2024-05-01T10:59:59Z", "order": "relevance"},
+    ]
+    for api_key, query in zip(("team-a", "team-b"), queries):
+        client = Client(APIKeyAuthentication(api_key=api_key), search_cache=cache)
+        client.base_url = fake_api.url  # type: ignore
+        async with client:
+            response = await client.search.list(**query)
+            assert response.items[0].id.videoId == "v1"
+
+    requested = fake_api.requested("search")
+    assert len(requested) == 1
+    assert requested[0]["q"] == "python tutorial"
+    assert requested[0]["type"] == "channel,video"
+    assert requested[0]["publishedAfter"] == "2024-05-01T10:00:00Z"
+    assert cache.hits == 1
+
+
+@pytest.mark.structure
+async def test_client_sends_exact_window_by_default(fake_api: FakeYouTubeAPI):
+    client = Client(APIKeyAuthentication(api_key="key"), search_cache=SearchCache())
+    client.base_url = fake_api.url  # type: ignore
+
+    async with client:
+        await client.search.list(q="cats", published_after="2024-05-01T10:17:00Z")
+        await client.search.list(q="Cats", published_after="2024-05-01T10:17:00Z")
+        await client.search.list(q="cats", published_after="2024-05-01T10:18:00Z")
+
+    assert [params["publishedAfter"] for params in fake_api.requested("search")] == [
+        "2024-05-01T10:17:00Z",
+        "2024-05-01T10:18:00Z",
+    ]
+
+
+@pytest.mark.structure
+async def test_client_doesnt_cache_private_searches(fake_api: FakeYouTubeAPI):
+    client = Client(APIKeyAuthentication(api_key="key"), search_cache=SearchCache())
+    client.base_url = fake_api.url  # type: ignore
+
+    async with client:
+        await client.search.list(on_behalf_of_content_owner="owner", type="video")
+        await client.search.list(on_behalf_of_content_owner="owner", type="video")
+        await client.videos.list(video_id="v1")
+        await client.videos.list(video_id="v1")
+
+    assert len(fake_api.requested("search")) == 2
+    assert len(fake_api.requested("videos")) == 2
+
+
+@pytest.mark.structure
+def test_search_cache_canonicalize():
+    cache = SearchCache(granularity=timedelta(days=1))
+    params = cache.canonicalize(
+        {
+            "part": "snippet",
+            "q": "  Cats\tAND dogs ",
+            "type": "video, playlist,video",
+            "maxResults": 5,
+            "safeSearch": "moderate",
+            "publishedAfter": "2024-05-01T10:17:00+02:00",
+            "publishedBefore": "2024-05-03T00:00:00Z",
+        }
+    )
+
+    assert params == {
+        "part": "snippet",
+        "q": "cats and dogs",
+        "type": "playlist,video",
+        "publishedAfter": "2024-05-01T00:00:00Z",
+        "publishedBefore": "2024-05-03T00:00:00Z",
+    }
+    assert round_time("2024-05-01T10:17:00.5Z", timedelta(minutes=15), up=True) == "2024-05-01T10:30:00Z"
+    assert round_time("yesterday", timedelta(hours=1)) == "yesterday"
+    # The requested window is kept exact unless the rounding is enabled.
+    assert SearchCache().canonicalize({"publishedAfter": "2024-05-01T10:17:00Z", "q": "Cats"}) == {
+        "publishedAfter": "2024-05-01T10:17:00Z",
+        "q": "cats",
+    }
+
+
+@pytest.mark.structure
+def test_search_cache_freshness_policy():
+    cache = SearchCache(ttl=100, recent_ttl=10, live_ttl=1, archive_ttl=1000)
+    recent = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    assert cache.get_ttl("search", {"q": "cats"}) == 100
+    assert cache.get_ttl("search", {"q": "cats", "eventType": "live"}) == 1
+    assert cache.get_ttl("search", {"q": "cats", "order": "date"}) == 10
+    assert cache.get_ttl("search", {"q": "cats", "publishedAfter": recent}) == 10
+    assert cache.get_ttl("search", {"q": "cats", "publishedBefore": recent}) == 100
+    assert cache.get_ttl("search", {"q": "cats", "order": "date", "publishedBefore": "2020-01-01T00:00:00Z"}) == 1000
+    assert cache.get_ttl("search", {"forMine": True}) is None
+    assert cache.get_ttl("videos", {"part": "snippet"}) is None